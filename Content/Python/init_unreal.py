@@ -43,8 +43,12 @@ def _on_tick(delta_seconds):
         if not _SCRIPTS or not os.path.isdir(_SCRIPTS):
             _log("Scripts folder not found at %s" % _SCRIPTS)
         else:
-            from init_ftrack_menu import register_ftrack_menu
-            register_ftrack_menu()
+            import ftrack_trace
+            with ftrack_trace.span("init_unreal._on_tick"):
+                import ftrack_commands
+                ftrack_commands.register_builtin_commands()
+                from init_ftrack_menu import register_ftrack_menu
+                register_ftrack_menu()
     except Exception as e:
         _log("Failed to register Ftrack menu: %s" % e)
         _log(traceback.format_exc())
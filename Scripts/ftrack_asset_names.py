@@ -0,0 +1,67 @@
+# :coding: utf-8
+"""
+Unique asset name allocation for handle creation (FtrackHandle, FtrackHandle_1, ...).
+
+Names come from asset registry metadata (AssetData.asset_name), so nothing is loaded. Each folder is
+scanned once and kept in an in-memory index that is updated as names are handed out; a per-base
+suffix cursor means creating K assets in a folder of N costs about O(N + K). Before a name is
+returned, does_asset_exist() (also a registry lookup) guards against assets added by other tools
+since the scan.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Set, Tuple
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_folder_names: Dict[str, Set[str]] = {}
+_next_suffix: Dict[Tuple[str, str], int] = {}
+
+
+def _normalize_folder(folder: str) -> str:
+    return "/" + folder.strip().replace("\\", "/").strip("/")
+
+
+def _scan_folder(folder: str) -> Set[str]:
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    # Asset names are FNames (case-insensitive), so the index is kept lower-case.
+    return set(str(a.asset_name).lower() for a in registry.get_assets_by_path(folder, recursive=False) or [])
+
+
+def allocate_asset_name(folder: str, base_name: str) -> str:
+    """Return a name not used in folder: base_name, then base_name_1, base_name_2, ... and reserve it."""
+    folder = _normalize_folder(folder)
+    names = _folder_names.get(folder)
+    if names is None:
+        names = _scan_folder(folder)
+        _folder_names[folder] = names
+    key = (folder, base_name)
+    idx = _next_suffix.get(key, 0)
+    while True:
+        name = base_name if idx == 0 else "%s_%d" % (base_name, idx)
+        idx += 1
+        if name.lower() in names:
+            continue
+        if unreal.EditorAssetLibrary.does_asset_exist("%s/%s" % (folder, name)):
+            names.add(name.lower())
+            continue
+        break
+    names.add(name.lower())
+    _next_suffix[key] = idx
+    return name
+
+
+def forget_folder(folder: Optional[str] = None) -> None:
+    """Drop the cached index for one folder (or all folders); the next allocation rescans."""
+    if folder is None:
+        _folder_names.clear()
+        _next_suffix.clear()
+        return
+    folder = _normalize_folder(folder)
+    _folder_names.pop(folder, None)
+    for key in [k for k in _next_suffix if k[0] == folder]:
+        del _next_suffix[key]
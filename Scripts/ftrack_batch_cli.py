@@ -0,0 +1,336 @@
+# :coding: utf-8
+"""
+Headless batch entry point: import Ftrack Asset Handles and/or turn Out Handles into publish jobs.
+
+Runs inside the editor's Python without Qt, the browser or menu registration, e.g. on a farm or CI
+machine (Slate does not tick there; queued game-thread work is drained between batches):
+
+    UnrealEditor-Cmd <Project>.uproject -run=pythonscript
+        -script="<Plugin>/Scripts/ftrack_batch_cli.py --manifest jobs.json --report report.json"
+
+    --import PATH ...            handle object paths to import (automated, one import batch per --batch-size)
+    --import-under /Game/Path    every handle under a content folder
+    --publish PATH ...           Out Handles to turn into publish jobs (out_handle_to_publish_job_dict)
+    --publish-under /Game/Path   every Out Handle under a content folder
+    --manifest FILE              JSON {"import": [...], "import_under": "/Game/..", "publish": [...],
+                                 "publish_under": "/Game/.."}, or text with one handle path per line (import)
+
+Publish jobs go to the publish spool (drained by ftrack_publish_worker.py) or, with --jsonl, to a JSON
+Lines file. Imported assets are saved by their import tasks (AssetImportTask.save), so a commandlet
+does not lose them on exit.
+
+The report (--report, default Saved/MroyaFtrack/batch_reports/batch_<time>.json) has per-item results
+with latency, per-batch times, and throughput (items/s, MB/s for imports) with p50/p95/max latency.
+An item's import latency is its own import time plus its share of the batch's resolve/prefetch
+time.
+
+main() returns 1 if any item failed and 2 on a usage error. Run as a script outside Unreal, that is the
+process exit code. Inside the editor, a non-zero code raises RuntimeError after the report is written:
+the traceback is logged and -run=pythonscript treats the script as failed, so the commandlet exits
+non-zero. With -ExecutePythonScript the editor keeps running unless --quit is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+if _THIS_DIR not in sys.path:
+    sys.path.insert(0, _THIS_DIR)
+
+# init_ftrack_menu registers the editor menu when imported unless this is set.
+os.environ.setdefault("MROYA_FTRACK_HEADLESS", "1")
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+DEFAULT_BATCH_SIZE = 50
+
+
+def _log(message: str) -> None:
+    if unreal:
+        unreal.log("Ftrack batch: %s" % message)
+    print("[batch] %s" % message, flush=True)
+
+
+def _log_error(message: str) -> None:
+    if unreal:
+        unreal.log_error("Ftrack batch: %s" % message)
+    print("[batch] ERROR %s" % message, file=sys.stderr, flush=True)
+
+
+def _batches(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _drain_game_thread() -> None:
+    import ftrack_game_thread
+    ftrack_game_thread.drain()
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _summary(items: List[Dict[str, Any]], batches: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    latencies = [i["latency_seconds"] for i in items if i.get("latency_seconds") is not None]
+    total_bytes = sum(i.get("bytes") or 0 for i in items if i["ok"])
+    return {
+        "items": len(items),
+        "ok": sum(1 for i in items if i["ok"]),
+        "errors": sum(1 for i in items if not i["ok"]),
+        "seconds": seconds,
+        "items_per_second": len(items) / seconds if seconds > 0 else None,
+        "bytes": total_bytes,
+        "mb_per_second": total_bytes / 1024 ** 2 / seconds if seconds > 0 else None,
+        "latency_seconds": {"p50": _percentile(latencies, 0.5), "p95": _percentile(latencies, 0.95),
+                            "max": max(latencies) if latencies else None},
+        "batches": batches,
+        "results": items,
+    }
+
+
+def _file_size(path: Optional[str]) -> Optional[int]:
+    try:
+        return os.path.getsize(path) if path else None
+    except OSError:
+        return None
+
+
+def run_imports(handle_paths: List[str], *, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Any]:
+    """Import handles in batches with init_ftrack_menu.import_handles_in_unreal(automated=True)."""
+    from init_ftrack_menu import import_handles_in_unreal
+
+    items: List[Dict[str, Any]] = []
+    batches: List[Dict[str, Any]] = []
+    t_start = time.perf_counter()
+    for index, batch in enumerate(_batches(handle_paths, batch_size)):
+        t0 = time.perf_counter()
+        try:
+            results = import_handles_in_unreal(batch, automated=True)
+        except Exception as e:
+            results = [{"handle": p, "error": "Import batch failed: %s" % e} for p in batch]
+        import_seconds = time.perf_counter() - t0
+        _drain_game_thread()
+        seconds = time.perf_counter() - t0
+        own = sum(r.get("import_seconds") or 0.0 for r in results)
+        shared = max(0.0, seconds - own) / max(1, len(results))
+        for r in results:
+            objects = r.get("imported_object_paths") or []
+            error = r.get("error")
+            if not error and not r.get("imported"):
+                error = "Nothing imported."
+            items.append({
+                "handle": r.get("handle"),
+                "ok": not error,
+                "error": error,
+                "component_id": r.get("component_id"),
+                "version_id": r.get("version_id"),
+                "source": r.get("path"),
+                "local_path": r.get("local_path"),
+                "bytes": _file_size(r.get("local_path") or r.get("path")),
+                "preset": r.get("preset"),
+                "imported_object_paths": objects,
+                "import_seconds": r.get("import_seconds"),
+                "latency_seconds": shared + (r.get("import_seconds") or 0.0),
+                "batch": index,
+            })
+        batches.append({"index": index, "items": len(batch), "seconds": seconds, "import_seconds": import_seconds})
+        _log("import batch %d: %d handle(s), %d error(s), %.2fs" % (
+            index, len(batch), sum(1 for i in items[-len(results):] if not i["ok"]), seconds))
+        unreal.SystemLibrary.collect_garbage()
+    return _summary(items, batches, time.perf_counter() - t_start)
+
+
+def run_publish_jobs(
+    out_handle_paths: List[str],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    spool_root: Optional[str] = None,
+    jsonl_path: Optional[str] = None,
+    verify_sequences: bool = True,
+    allow_incomplete: bool = False,
+) -> Dict[str, Any]:
+    """Build a publish job per Out Handle and queue it in the spool (or write it to jsonl_path)."""
+    import ftrack_publish_spool as spool
+    from ftrack_out_handle import out_handle_to_publish_job_dict
+    from ftrack_sequence_check import format_report, verify_job
+
+    items: List[Dict[str, Any]] = []
+    batches: List[Dict[str, Any]] = []
+    jsonl = None
+    if jsonl_path:
+        os.makedirs(os.path.dirname(os.path.abspath(jsonl_path)), exist_ok=True)
+        jsonl = open(jsonl_path + ".part", "w", encoding="utf-8")
+    t_start = time.perf_counter()
+    try:
+        for index, batch in enumerate(_batches(out_handle_paths, batch_size)):
+            t_batch = time.perf_counter()
+            for path in batch:
+                t0 = time.perf_counter()
+                item: Dict[str, Any] = {"out_handle": path, "ok": False, "error": None, "job_id": None,
+                                        "components": None, "bytes": None, "batch": index}
+                try:
+                    job = out_handle_to_publish_job_dict(path, use_cache=False)  # one pass; keep memory flat
+                    item["components"] = len(job.get("components") or [])
+                    preflight = None
+                    if verify_sequences:
+                        check = verify_job(job)
+                        item["bytes"] = check["total_bytes"]
+                        preflight = {"ok": check["ok"], "total_bytes": check["total_bytes"],
+                                     "sequences": len(check["sequences"])}
+                        if not check["ok"] and not allow_incomplete:
+                            raise ValueError("; ".join(format_report(r) for r in check["sequences"] if not r["ok"]))
+                    if jsonl is not None:
+                        jsonl.write(json.dumps(dict(job, unreal_asset_path=path), ensure_ascii=False) + "\n")
+                    else:
+                        item["job_id"] = spool.submit_job(job, spool_root, unreal_asset_path=path, preflight=preflight)
+                    item["ok"] = True
+                except Exception as e:
+                    item["error"] = str(e)
+                item["latency_seconds"] = time.perf_counter() - t0
+                items.append(item)
+            batches.append({"index": index, "items": len(batch), "seconds": time.perf_counter() - t_batch})
+            _log("publish batch %d: %d Out Handle(s), %d error(s)" % (
+                index, len(batch), sum(1 for i in items[-len(batch):] if not i["ok"])))
+            _drain_game_thread()
+            unreal.SystemLibrary.collect_garbage()
+    finally:
+        if jsonl is not None:
+            jsonl.close()
+            os.replace(jsonl_path + ".part", jsonl_path)
+    summary = _summary(items, batches, time.perf_counter() - t_start)
+    if jsonl_path:
+        summary["jsonl"] = jsonl_path
+    else:
+        summary["spool"] = spool.spool_root(spool_root)
+    return summary
+
+
+def _read_manifest(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("{"):
+        data = json.loads(text)
+        if not isinstance(data, dict):
+            raise ValueError("Manifest must be a JSON object.")
+        return data
+    lines = [line.strip() for line in text.splitlines()]
+    return {"import": [line for line in lines if line and not line.startswith("#")]}
+
+
+def _unique(paths: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(p for p in paths if p))
+
+
+def default_report_path() -> str:
+    saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved, "MroyaFtrack", "batch_reports", "batch_%s.json" % time.strftime("%Y%m%d_%H%M%S"))
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".part"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(prog="ftrack_batch_cli.py",
+                                     description="Headless Ftrack import / publish-job batches (run inside UnrealEditor-Cmd).")
+    parser.add_argument("--manifest", help="JSON manifest, or a text file with one handle path per line (import).")
+    parser.add_argument("--import", dest="import_paths", nargs="+", default=[], metavar="HANDLE",
+                        help="Ftrack Asset Handle object paths to import.")
+    parser.add_argument("--import-under", metavar="CONTENT_PATH", help="Import every handle under this folder.")
+    parser.add_argument("--publish", dest="publish_paths", nargs="+", default=[], metavar="OUT_HANDLE",
+                        help="Ftrack Out Handle paths to turn into publish jobs.")
+    parser.add_argument("--publish-under", metavar="CONTENT_PATH", help="Publish jobs for every Out Handle under this folder.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Items per batch (default: 50).")
+    parser.add_argument("--spool", help="Publish spool root (default: MROYA_FTRACK_PUBLISH_SPOOL or Saved/MroyaFtrack/publish_spool).")
+    parser.add_argument("--jsonl", metavar="PATH", help="Write publish jobs to this JSON Lines file instead of the spool.")
+    parser.add_argument("--no-sequence-check", action="store_true", help="Skip the missing/zero-byte frame check.")
+    parser.add_argument("--allow-incomplete", action="store_true", help="Queue jobs with incomplete frame sequences.")
+    parser.add_argument("--report", help="Report JSON path (default: Saved/MroyaFtrack/batch_reports/batch_<time>.json).")
+    parser.add_argument("--quit", action="store_true", help="Quit the editor when done (for -ExecutePythonScript runs).")
+    args = parser.parse_args(argv)
+
+    if unreal is None:
+        _log_error("Run inside the Unreal Editor's Python (UnrealEditor-Cmd -run=pythonscript).")
+        return 2
+    manifest = _read_manifest(args.manifest) if args.manifest else {}
+    import_paths = list(manifest.get("import") or []) + args.import_paths
+    publish_paths = list(manifest.get("publish") or []) + args.publish_paths
+    import_under = args.import_under or manifest.get("import_under")
+    publish_under = args.publish_under or manifest.get("publish_under")
+    if import_under:
+        from ftrack_version_scan import iter_asset_handle_paths
+        import_paths += list(iter_asset_handle_paths(import_under))
+    if publish_under:
+        from ftrack_out_handle import iter_out_handle_paths
+        publish_paths += list(iter_out_handle_paths(publish_under))
+    import_paths, publish_paths = _unique(import_paths), _unique(publish_paths)
+    if not import_paths and not publish_paths:
+        _log_error("Nothing to do: give --import/--import-under/--publish/--publish-under or a --manifest.")
+        return 2
+
+    batch_size = max(1, args.batch_size)
+    report: Dict[str, Any] = {"started_at": time.time(), "argv": list(sys.argv), "batch_size": batch_size}
+    t0 = time.perf_counter()
+    if import_paths:
+        _log("importing %d handle(s)" % len(import_paths))
+        report["import"] = run_imports(import_paths, batch_size=batch_size)
+    if publish_paths:
+        _log("building %d publish job(s)" % len(publish_paths))
+        report["publish"] = run_publish_jobs(
+            publish_paths,
+            batch_size=batch_size,
+            spool_root=args.spool,
+            jsonl_path=args.jsonl,
+            verify_sequences=not args.no_sequence_check,
+            allow_incomplete=args.allow_incomplete,
+        )
+    report["seconds"] = time.perf_counter() - t0
+    report["finished_at"] = time.time()
+    try:
+        from ftrack_component_cache import get_component_cache
+        cache = get_component_cache()
+        if cache is not None:
+            report["component_cache"] = cache.stats()
+    except Exception:
+        pass
+    errors = sum(report[k]["errors"] for k in ("import", "publish") if k in report)
+    report["ok"] = errors == 0
+
+    report_path = args.report or default_report_path()
+    write_report(report, report_path)
+    for key in ("import", "publish"):
+        if key in report:
+            s = report[key]
+            _log("%s: %d ok, %d error(s) in %.1fs (%.2f items/s, p95 latency %s)" % (
+                key, s["ok"], s["errors"], s["seconds"], s["items_per_second"] or 0.0,
+                "-" if s["latency_seconds"]["p95"] is None else "%.2fs" % s["latency_seconds"]["p95"]))
+    _log("report: %s" % report_path)
+    if args.quit:
+        unreal.SystemLibrary.quit_editor()
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    _code = main()
+    if unreal is None:
+        sys.exit(_code)
+    if _code:
+        # The embedded interpreter does not end the process on SystemExit; an uncaught error fails the commandlet.
+        raise RuntimeError("Ftrack batch finished with errors (exit code %d)." % _code)
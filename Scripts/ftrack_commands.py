@@ -0,0 +1,132 @@
+# :coding: utf-8
+"""
+Named entry points for the C++ side (Slate panels) of the plugin.
+
+C++ (FtrackPythonBridge) calls dispatch(name, args_json) instead of generating a script per click:
+the statement is always the same one-liner and the arguments travel as one JSON string. Commands are
+registered once per session by register_builtin_commands() (called from Content/Python/init_unreal.py
+and, if that has not run yet, by the bridge's one-time setup). Modules behind the commands are
+imported on first use.
+
+    register("handles.import", fn)           - fn(**args) where args is the decoded JSON object
+    dispatch("handles.import", '{"paths": ["/Game/A.A"]}') -> True if the command ran without raising
+
+Built-in commands:
+    browser.open                                   open the ftrack browser in-process
+    handles.import     {"paths": [...], "automated": bool}  import_handles_async (one batch)
+    handles.reimport   {"paths": [...]|null, "force": bool}  reimport_handles_async
+    handles.update     {"paths": [...]}            ftrack_version_scan.update_handles
+    versions.scan      {"content_path": "/Game"}  ftrack_version_scan.scan_project_async
+    cache.stats                                    log component cache hit rate, size and budget
+"""
+
+from __future__ import annotations
+
+import json
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_commands: Dict[str, Callable[..., Any]] = {}
+_builtins_registered = False
+
+
+def _log_error(message: str) -> None:
+    if unreal:
+        unreal.log_error("Ftrack: %s" % message)
+    else:
+        print("Ftrack: %s" % message)
+
+
+def register(name: str, fn: Optional[Callable[..., Any]] = None):
+    """Register fn under name (replacing any previous one). Usable as a decorator: @register("x")."""
+    if fn is None:
+        def decorator(f):
+            _commands[name] = f
+            return f
+        return decorator
+    _commands[name] = fn
+    return fn
+
+
+def commands() -> List[str]:
+    return sorted(_commands)
+
+
+def dispatch(name: str, args_json: str = "") -> bool:
+    """Run a registered command with JSON arguments (object -> keyword arguments). Returns False on error."""
+    if not _builtins_registered:
+        register_builtin_commands()
+    fn = _commands.get(name)
+    if fn is None:
+        _log_error("Unknown command %r (registered: %s)" % (name, ", ".join(commands())))
+        return False
+    try:
+        args = json.loads(args_json) if args_json else {}
+    except ValueError as e:
+        _log_error("Command %s: bad arguments: %s" % (name, e))
+        return False
+    if not isinstance(args, dict):
+        _log_error("Command %s: arguments must be a JSON object." % name)
+        return False
+    try:
+        fn(**args)
+    except Exception as e:
+        _log_error("Command %s failed: %s" % (name, e))
+        _log_error(traceback.format_exc())
+        return False
+    return True
+
+
+def _open_browser() -> None:
+    import open_browser_inprocess
+    open_browser_inprocess.open_browser()
+
+
+def _import_handles(paths: List[str], automated: bool = False) -> None:
+    import init_ftrack_menu
+    init_ftrack_menu.import_handles_async(list(paths), automated=automated)
+
+
+def _reimport_handles(paths: Optional[List[str]] = None, force: bool = False) -> None:
+    import init_ftrack_menu
+    init_ftrack_menu.reimport_handles_async(list(paths) if paths else None, force=force)
+
+
+def _update_handles(paths: List[str]) -> None:
+    import ftrack_version_scan
+    ftrack_version_scan.update_handles(list(paths))
+
+
+def _scan_versions(content_path: str = "/Game") -> None:
+    import ftrack_version_scan
+    ftrack_version_scan.scan_project_async(content_path)
+
+
+def _log_cache_stats() -> None:
+    import ftrack_component_cache
+    cache = ftrack_component_cache.get_component_cache()
+    if cache is None:
+        _log_error("No component cache folder (Saved/MroyaFtrack/prefetch or MROYA_FTRACK_PREFETCH_DIR).")
+        return
+    message = "Ftrack: %s" % ftrack_component_cache.format_stats(cache.stats())
+    if unreal:
+        unreal.log(message)
+    else:
+        print(message)
+
+
+def register_builtin_commands() -> None:
+    """Register the plugin's own commands (idempotent)."""
+    global _builtins_registered
+    _builtins_registered = True
+    register("browser.open", _open_browser)
+    register("handles.import", _import_handles)
+    register("handles.reimport", _reimport_handles)
+    register("handles.update", _update_handles)
+    register("versions.scan", _scan_versions)
+    register("cache.stats", _log_cache_stats)
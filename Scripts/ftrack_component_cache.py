@@ -0,0 +1,508 @@
+# :coding: utf-8
+"""
+Managed local cache of component files (the prefetch folder), bounded by a byte budget.
+
+Layout: <root>/<component id>/<version id>/<file name>. An ftrack component version is an immutable
+address, so its files are cached under it; a hit still requires the local copy to have the source's
+size and mtime (copies keep the source mtime), so a file replaced in place is fetched again.
+
+<root>/index.json records each cached file (source path, size, last use, hits), the files pinned by
+each editor instance and cumulative stats. It is only read and rewritten while holding
+<root>/index.lock, so several editors (or machines) can share one cache folder. A file being copied is
+guarded by "<file>.lock", so two instances never write the same copy; the second waits and then finds
+a hit.
+
+Eviction removes least recently used files until the cache fits the budget (MROYA_FTRACK_CACHE_MAX_GB,
+default 50; 0 disables eviction). It never removes:
+    files pinned by an instance: sources of handles whose imported assets the open level uses
+        (worked out once per opened level, see pin_current_level), plus sources imported since
+    files used in the last few minutes (another editor may be about to import them)
+    files being copied
+
+    cache = get_component_cache()
+    cache.lookup(source, key)  -> local path if a valid copy exists (stat only), else None
+    cache.stats()              -> hit rate, bytes saved/fetched, evictions, size, budget
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_INDEX_FILE_NAME = "index.json"
+_INDEX_LOCK_NAME = "index.lock"
+_FORMAT_VERSION = 1
+_BUDGET_ENV = "MROYA_FTRACK_CACHE_MAX_GB"
+DEFAULT_BUDGET_GB = 50.0
+
+# Index lock holders only read/merge/write JSON; a lock this old was left by a crashed process.
+_INDEX_LOCK_STALE_SECONDS = 30.0
+_INDEX_LOCK_TIMEOUT_SECONDS = 15.0
+# Copy locks are touched while the copy makes progress.
+_COPY_LOCK_STALE_SECONDS = 120.0
+_COPY_LOCK_TOUCH_SECONDS = 10.0
+# Files used this recently are not evicted (prefetched by another instance, import pending).
+_RECENT_USE_SECONDS = 600.0
+# Pins of instances that have not refreshed them for this long (closed or crashed editors) are ignored.
+_PIN_TTL_SECONDS = 24 * 3600.0
+
+_STAT_KEYS = ("hits", "misses", "bytes_saved", "bytes_fetched", "evicted_files", "evicted_bytes")
+
+
+def _norm(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path)).replace("\\", "/")
+
+
+def cache_key(component_id: str, version_id: Optional[str]) -> str:
+    """Folder of a component version's files, relative to the cache root."""
+    return "%s/%s" % (component_id, version_id or "latest")
+
+
+def budget_bytes_from_env() -> Optional[int]:
+    """MROYA_FTRACK_CACHE_MAX_GB in bytes (default 50 GB); None when set to 0 (no eviction)."""
+    try:
+        gb = float(os.environ.get(_BUDGET_ENV, "").strip() or DEFAULT_BUDGET_GB)
+    except ValueError:
+        gb = DEFAULT_BUDGET_GB
+    return int(gb * 1024 ** 3) if gb > 0 else None
+
+
+class _FileLock:
+    """Cross-process lock: a file created with O_EXCL. A lock not touched for stale_seconds is taken over."""
+
+    def __init__(self, path: str, stale_seconds: float, timeout: Optional[float] = None, poll: float = 0.05):
+        self.path = path
+        self._stale_seconds = stale_seconds
+        self._timeout = timeout
+        self._poll = poll
+        self._last_touch = 0.0
+
+    def acquire(self) -> bool:
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(self.path).st_mtime > self._stale_seconds:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue  # released (or taken over) meanwhile
+            else:
+                with os.fdopen(fd, "w") as f:
+                    f.write("%s %d" % (socket.gethostname(), os.getpid()))
+                self._last_touch = time.monotonic()
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self._poll)
+
+    def touch(self) -> None:
+        """Mark the lock as alive (throttled); for holders of long locks."""
+        now = time.monotonic()
+        if now - self._last_touch < _COPY_LOCK_TOUCH_SECONDS:
+            return
+        self._last_touch = now
+        try:
+            os.utime(self.path)
+        except OSError:
+            pass
+
+    def release(self) -> None:
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self) -> "_FileLock":
+        if not self.acquire():
+            raise TimeoutError("Timed out waiting for lock %s" % self.path)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class ComponentCache:
+    """Thread-safe handle on one cache folder. Usage is recorded in memory and merged into the index by flush()."""
+
+    def __init__(self, root: str, budget_bytes: Optional[int] = None):
+        self.root = root
+        self.budget_bytes = budget_bytes
+        self.instance_id = "%s-%d" % (socket.gethostname(), os.getpid())
+        self._lock = threading.Lock()
+        self._touched: Dict[str, Dict[str, Any]] = {}  # rel path -> entry fields to merge
+        self._pending: Dict[str, int] = dict.fromkeys(_STAT_KEYS, 0)
+        self._session: Dict[str, int] = dict.fromkeys(_STAT_KEYS, 0)
+        self._pinned: Optional[List[str]] = None
+
+    # -- paths ---------------------------------------------------------------------------------
+
+    def path_for(self, source: str, key: str) -> str:
+        return os.path.join(self.root, key, os.path.basename(source))
+
+    def _rel(self, local: str) -> str:
+        return os.path.relpath(local, self.root).replace("\\", "/")
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root, _INDEX_FILE_NAME)
+
+    # -- hit / miss ----------------------------------------------------------------------------
+
+    def lookup(self, source: str, key: str) -> Optional[str]:
+        """Local copy of source if it is complete and matches the source's size and mtime (stats only)."""
+        local = self.path_for(source, key)
+        try:
+            st = os.stat(source)
+            cached = os.stat(local)
+            hit = cached.st_size == st.st_size and cached.st_mtime_ns == st.st_mtime_ns
+        except OSError:
+            hit = False
+        with self._lock:
+            self._count("hits" if hit else "misses", 1)
+            if hit:
+                self._count("bytes_saved", st.st_size)
+                self._touch(local, source, st.st_size, hit=True)
+        return local if hit else None
+
+    def add(self, local: str, source: str, size: int, copied_bytes: int, found_complete: bool = False) -> None:
+        """Record a file copied to local after a lookup() miss.
+
+        found_complete: another instance finished the copy while this one waited for the copy lock;
+        the miss is counted as a hit.
+        """
+        with self._lock:
+            if found_complete:
+                self._count("misses", -1)
+                self._count("hits", 1)
+                self._count("bytes_saved", size)
+            self._count("bytes_fetched", copied_bytes)
+            self._touch(local, source, size, hit=found_complete)
+
+    def copy_lock(self, local: str) -> _FileLock:
+        """Lock to hold while writing local (waits for another instance copying the same file)."""
+        os.makedirs(os.path.dirname(os.path.abspath(local)), exist_ok=True)
+        return _FileLock(local + ".lock", _COPY_LOCK_STALE_SECONDS)
+
+    def _count(self, name: str, n: int) -> None:
+        self._pending[name] += n
+        self._session[name] += n
+
+    def _touch(self, local: str, source: str, size: int, hit: bool) -> None:
+        rel = self._rel(local)
+        prev = self._touched.get(rel)
+        self._touched[rel] = {"source": source, "size": size, "last_used": time.time(),
+                              "hits": (prev["hits"] if prev else 0) + (1 if hit else 0)}
+
+    # -- pins ----------------------------------------------------------------------------------
+
+    def pin_sources(self, sources: Iterable[str]) -> None:
+        """Replace this instance's pinned sources (persisted on the next flush)."""
+        with self._lock:
+            self._pinned = sorted({_norm(s) for s in sources if s})
+
+    # -- index ---------------------------------------------------------------------------------
+
+    def _read_index(self) -> Dict[str, Any]:
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == _FORMAT_VERSION:
+                data.setdefault("entries", {})
+                data.setdefault("pins", {})
+                data.setdefault("stats", {})
+                return data
+        except (OSError, ValueError):
+            pass
+        # No index yet (or unreadable): adopt files already in the folder as least recently used.
+        return {"version": _FORMAT_VERSION, "entries": self._scan_files(), "pins": {}, "stats": {}}
+
+    def _scan_files(self) -> Dict[str, Dict[str, Any]]:
+        entries: Dict[str, Dict[str, Any]] = {}
+        for dirpath, _dirnames, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith((".part", ".part.json", ".lock", ".tmp")) or dirpath == self.root:
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    continue
+                entries[self._rel(path)] = {"source": None, "size": size, "last_used": 0.0, "hits": 0}
+        return entries
+
+    def _write_index(self, data: Dict[str, Any]) -> None:
+        path = self._index_path()
+        tmp = "%s.%s.tmp" % (path, uuid.uuid4().hex[:8])
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    @contextlib.contextmanager
+    def _locked_index(self):
+        """Yield the index dict under the cross-process lock and write it back afterwards."""
+        os.makedirs(self.root, exist_ok=True)
+        with _FileLock(os.path.join(self.root, _INDEX_LOCK_NAME), _INDEX_LOCK_STALE_SECONDS,
+                       timeout=_INDEX_LOCK_TIMEOUT_SECONDS):
+            data = self._read_index()
+            yield data
+            self._write_index(data)
+
+    def _merge_pending(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            touched, self._touched = self._touched, {}
+            pending, self._pending = self._pending, dict.fromkeys(_STAT_KEYS, 0)
+            pinned = self._pinned
+        entries = data["entries"]
+        for rel, fields in touched.items():
+            prev = entries.get(rel) or {}
+            entries[rel] = dict(fields, hits=prev.get("hits", 0) + fields["hits"])
+        stats = data["stats"]
+        for name, n in pending.items():
+            stats[name] = stats.get(name, 0) + n
+        if pinned is not None:
+            data["pins"][self.instance_id] = {"sources": pinned, "time": time.time()}
+
+    def flush(self) -> bool:
+        """Merge usage, stats and pins into the shared index. Returns False if the index was busy."""
+        try:
+            with self._locked_index() as data:
+                self._merge_pending(data)
+            return True
+        except (OSError, TimeoutError) as e:
+            _log_warning("Could not update component cache index: %s" % e)
+            return False
+
+    def evict(self, keep: Iterable[str] = ()) -> int:
+        """Flush, then remove least recently used unpinned files over the budget. Returns bytes freed."""
+        keep_rel = {self._rel(p) for p in keep}
+        freed = 0
+        try:
+            with self._locked_index() as data:
+                self._merge_pending(data)
+                entries = data["entries"]
+                now = time.time()
+                data["pins"] = {k: v for k, v in data["pins"].items() if now - v.get("time", 0) < _PIN_TTL_SECONDS}
+                pinned: Set[str] = set()
+                for pin in data["pins"].values():
+                    pinned.update(pin.get("sources") or [])
+                for rel in [r for r in entries if not os.path.isfile(os.path.join(self.root, r))]:
+                    del entries[rel]
+                if self.budget_bytes is None:
+                    return 0
+                total = sum(e.get("size", 0) for e in entries.values())
+                for rel, entry in sorted(entries.items(), key=lambda kv: kv[1].get("last_used", 0)):
+                    if total <= self.budget_bytes:
+                        break
+                    path = os.path.join(self.root, rel)
+                    if (rel in keep_rel or now - entry.get("last_used", 0) < _RECENT_USE_SECONDS
+                            or (entry.get("source") and _norm(entry["source"]) in pinned)
+                            or os.path.exists(path + ".lock")):
+                        continue
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        continue  # open in another process (Windows); try again next time
+                    del entries[rel]
+                    total -= entry.get("size", 0)
+                    freed += entry.get("size", 0)
+                    data["stats"]["evicted_files"] = data["stats"].get("evicted_files", 0) + 1
+                    data["stats"]["evicted_bytes"] = data["stats"].get("evicted_bytes", 0) + entry.get("size", 0)
+                    with self._lock:
+                        self._session["evicted_files"] += 1
+                        self._session["evicted_bytes"] += entry.get("size", 0)
+                    _remove_empty_dirs(os.path.dirname(path), self.root)
+        except (OSError, TimeoutError) as e:
+            _log_warning("Could not evict from component cache: %s" % e)
+        return freed
+
+    # -- stats ---------------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Session and cumulative (all instances) counters, plus the cache's current size and budget."""
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        with self._lock:
+            session = dict(self._session)
+            pending = dict(self._pending)
+        stored = data.get("stats")
+        stored = stored if isinstance(stored, dict) else {}
+        total = {k: stored.get(k, 0) + pending[k] for k in _STAT_KEYS}
+        for counters in (session, total):
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = counters["hits"] / lookups if lookups else None
+        entries = data.get("entries")
+        entries = entries if isinstance(entries, dict) else {}
+        pins = data.get("pins")
+        return {
+            "root": self.root,
+            "session": session,
+            "total": total,
+            "files": len(entries),
+            "bytes": sum(e.get("size", 0) for e in entries.values()),
+            "budget_bytes": self.budget_bytes,
+            "pinned_instances": len(pins) if isinstance(pins, dict) else 0,
+        }
+
+
+def _remove_empty_dirs(path: str, root: str) -> None:
+    root = os.path.abspath(root)
+    path = os.path.abspath(path)
+    while path != root and path.startswith(root):
+        try:
+            os.rmdir(path)
+        except OSError:
+            return
+        path = os.path.dirname(path)
+
+
+def _log_warning(message: str) -> None:
+    if unreal:
+        unreal.log_warning("Ftrack: %s" % message)
+    else:
+        print("Ftrack: %s" % message)
+
+
+_cache: Optional[ComponentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_component_cache() -> Optional[ComponentCache]:
+    """Shared cache over the prefetch folder (None outside Unreal without MROYA_FTRACK_PREFETCH_DIR)."""
+    global _cache
+    from ftrack_prefetch import prefetch_dir
+
+    with _cache_lock:
+        root = prefetch_dir()
+        if not root:
+            return None
+        if _cache is None or _cache.root != root:
+            _cache = ComponentCache(root, budget_bytes_from_env())
+        return _cache
+
+
+def current_level_package() -> Optional[str]:
+    """Package name of the level open in the editor, or None (no world, e.g. in a commandlet)."""
+    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    return world.get_path_name().split(".", 1)[0] if world is not None else None
+
+
+def _world_packages(package: str) -> Set[str]:
+    """The level package and its external (one file per actor) actor/object packages."""
+    packages = {package}
+    mount, _, rest = package.lstrip("/").partition("/")
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    for external in ("__ExternalActors__", "__ExternalObjects__"):
+        ar_filter = unreal.ARFilter(package_paths=["/%s/%s/%s" % (mount, external, rest)], recursive_paths=True)
+        packages.update(str(d.package_name) for d in registry.get_assets(ar_filter) or [])
+    return packages
+
+
+def level_dependency_packages(package: str, max_queries: int = 20000) -> Set[str]:
+    """Packages the level uses, following hard references (game thread; one registry query per package).
+
+    Stops after max_queries dependency queries and logs a warning; the result is then incomplete.
+    """
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    options = unreal.AssetRegistryDependencyOptions(
+        include_soft_package_references=False,
+        include_hard_package_references=True,
+        include_searchable_names=False,
+        include_soft_management_references=False,
+        include_hard_management_references=False,
+    )
+    seen = _world_packages(package)
+    todo = list(seen)
+    queries = 0
+    while todo and queries < max_queries:
+        queries += 1
+        for dep in registry.get_dependencies(todo.pop(), options) or []:
+            dep = str(dep)
+            if dep not in seen and not dep.startswith("/Script/") and not dep.startswith("/Engine/"):
+                seen.add(dep)
+                todo.append(dep)
+    if todo:
+        _log_warning("Level dependency walk for %s stopped after %d packages (%d not followed); "
+                     "cached files of some handles used by the level may not be pinned." % (package, queries, len(todo)))
+    return seen
+
+
+_pinned_level: Optional[str] = None
+_level_sources: List[str] = []
+
+
+def pin_current_level(cache: Optional[ComponentCache] = None, force: bool = False) -> Optional[int]:
+    """Pin cached sources of handles whose imported assets the open level uses (game thread).
+
+    The dependency walk runs once per opened level: while the same level stays open this returns None
+    without querying anything (force=True walks again). Handles imported in the meantime are pinned by
+    pin_imported_sources. Uses the import manifest (handle -> source path, imported objects). Returns
+    the number of sources pinned.
+    """
+    global _pinned_level, _level_sources
+    cache = cache or get_component_cache()
+    if cache is None:
+        return None
+    level = current_level_package()
+    if level is None or (level == _pinned_level and not force):
+        return None
+    from ftrack_import_manifest import get_import_manifest
+
+    packages = level_dependency_packages(level)
+    manifest = get_import_manifest()
+    sources = []
+    for handle in manifest.handles():
+        entry = manifest.get(handle) or {}
+        objects = entry.get("imported_object_paths") or []
+        if entry.get("source_path") and any(p.split(".", 1)[0] in packages for p in objects):
+            sources.append(entry["source_path"])
+    _level_sources = sources
+    cache.pin_sources(sources)
+    _pinned_level = level
+    return len(sources)
+
+
+def pin_imported_sources(sources: Iterable[str], cache: Optional[ComponentCache] = None) -> None:
+    """Add just-imported sources to the open level's pins (game thread), without walking the level again.
+
+    The level may use the new assets before it is saved, and the cached walk would not see them.
+    The added pins last until another level is opened.
+    """
+    global _level_sources
+    cache = cache or get_component_cache()
+    if cache is None:
+        return
+    _level_sources = sorted(set(_level_sources).union(s for s in sources if s))
+    cache.pin_sources(_level_sources)
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    def rate(counters):
+        return "-" if counters["hit_rate"] is None else "%.0f%%" % (100.0 * counters["hit_rate"])
+
+    session, total = stats["session"], stats["total"]
+    budget = stats["budget_bytes"]
+    return ("Component cache %s: %d file(s), %.2f GB of %s; session hit rate %s (%d/%d), %.2f GB saved, "
+            "%.2f GB fetched; all-time hit rate %s, %.2f GB saved, %d file(s) evicted." % (
+                stats["root"], stats["files"], stats["bytes"] / 1024 ** 3,
+                "%.2f GB" % (budget / 1024 ** 3) if budget else "no limit",
+                rate(session), session["hits"], session["hits"] + session["misses"],
+                session["bytes_saved"] / 1024 ** 3, session["bytes_fetched"] / 1024 ** 3,
+                rate(total), total["bytes_saved"] / 1024 ** 3, total["evicted_files"]))
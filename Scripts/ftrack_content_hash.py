@@ -0,0 +1,378 @@
+# :coding: utf-8
+"""
+Content hashes for publish component files, so unchanged files can be recognised across publishes.
+
+The hash is a two-level SHA-256 tree: each 8 MiB chunk is hashed on its own (in parallel; hashlib
+releases the GIL, and SHA-256 is hardware-accelerated on current CPUs), and the root hash covers the
+chunk digests plus the file size. Files are read
+through mmap where possible (no copies into Python bytes), otherwise with positioned reads.
+Values look like "sha256-tree-8m:<hex>" and are only comparable with the same algorithm tag.
+
+Image sequences (components with a frame pattern and frame_range) hash every frame and combine the
+frame numbers and frame hashes into one value.
+
+HashCache maps (path, size, mtime_ns) -> hash and is persisted as JSON (Saved/MroyaFtrack in the
+editor, MROYA_FTRACK_HASH_CACHE or an explicit path elsewhere), so a file is hashed again only
+after it changes. Publish worker processes share one file: save() merges the entries on disk under
+"<file>.lock" before replacing it, so no process drops what another one hashed.
+
+annotate_job_hashes() writes "content_hash" and "content_size" into each component's metadata; the
+publisher can compare them with the previous version's components and reuse instead of uploading.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+CHUNK_SIZE = 8 * 1024 * 1024
+ALGORITHM = "sha256-tree-8m"
+
+_CACHE_FILE_NAME = "content_hash_cache.json"
+_FORMAT_VERSION = 1
+_ENV = "MROYA_FTRACK_HASH_CACHE"
+
+# Files mapped/opened at once while their chunks are being hashed.
+_MAX_OPEN_FILES = 32
+
+# save() holds "<file>.lock" while it merges and rewrites the file (see ftrack_component_cache._FileLock).
+_SAVE_LOCK_STALE_SECONDS = 30.0
+_SAVE_LOCK_TIMEOUT_SECONDS = 10.0
+
+
+def _default_cache_path() -> Optional[str]:
+    env = os.environ.get(_ENV, "").strip()
+    if env:
+        return env
+    if unreal is None:
+        return None
+    try:
+        saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    except Exception:
+        return None
+    return os.path.join(saved, "MroyaFtrack", _CACHE_FILE_NAME)
+
+
+def _cache_key_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class HashCache:
+    """Thread-safe LRU map of (path, size, mtime_ns) -> content hash."""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 200000):
+        self._path = path
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _read_file(self) -> "OrderedDict[str, Tuple[int, int, str]]":
+        """Entries stored on disk (oldest first); empty if the file is missing or unusable."""
+        entries: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        if not self._path or not os.path.isfile(self._path):
+            return entries
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return entries
+        if (not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION
+                or data.get("algorithm") != ALGORITHM or not isinstance(data.get("entries"), list)):
+            return entries
+        for e in data["entries"]:
+            try:
+                entries[e["path"]] = (int(e["size"]), int(e["mtime_ns"]), str(e["hash"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return entries
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        self._entries = self._read_file()
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        key = _cache_key_path(path)
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == size and entry[1] == mtime_ns:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        return None
+
+    def put(self, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        key = _cache_key_path(path)
+        with self._lock:
+            self._ensure_loaded()
+            self._entries.pop(key, None)
+            self._entries[key] = (size, mtime_ns, digest)
+            self._dirty = True
+            self._evict()
+
+    def save(self) -> bool:
+        """Merge with the file on disk and write it if this cache changed. Returns True if a file was written.
+
+        Entries other processes saved meanwhile are kept (and loaded here); for a path both have, this
+        cache's entry wins. If the file lock cannot be taken, the cache stays dirty for the next save().
+        """
+        if not self._path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+        from ftrack_component_cache import _FileLock
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+            with _FileLock(self._path + ".lock", _SAVE_LOCK_STALE_SECONDS, timeout=_SAVE_LOCK_TIMEOUT_SECONDS):
+                merged = self._read_file()
+                with self._lock:
+                    self._ensure_loaded()
+                    for key, entry in self._entries.items():
+                        merged.pop(key, None)
+                        merged[key] = entry
+                    self._entries = merged
+                    self._evict()
+                    entries = [{"path": k, "size": v[0], "mtime_ns": v[1], "hash": v[2]}
+                               for k, v in self._entries.items()]
+                    self._dirty = False
+                try:
+                    tmp = "%s.%s.tmp" % (self._path, uuid.uuid4().hex[:8])
+                    with open(tmp, "w", encoding="utf-8") as f:
+                        json.dump({"version": _FORMAT_VERSION, "algorithm": ALGORITHM, "entries": entries}, f)
+                    os.replace(tmp, self._path)
+                except OSError:
+                    with self._lock:
+                        self._dirty = True
+                    raise
+            return True
+        except OSError as e:  # includes TimeoutError from the lock
+            if unreal:
+                unreal.log_warning("Ftrack: Could not save content hash cache: %s" % e)
+            return False
+
+
+_cache: Optional[HashCache] = None
+
+
+def get_hash_cache() -> HashCache:
+    """Shared cache persisted under the project's Saved folder (or MROYA_FTRACK_HASH_CACHE)."""
+    global _cache
+    if _cache is None:
+        _cache = HashCache(_default_cache_path())
+    return _cache
+
+
+class _FileSource:
+    """Chunk reader for one file: mmap when possible, else positioned reads."""
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        self._file = open(path, "rb")
+        self._mm: Optional[mmap.mmap] = None
+        if size > 0:
+            try:
+                self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._mm = None
+        self._read_lock = threading.Lock()
+
+    def digest(self, offset: int, length: int) -> bytes:
+        if self._mm is not None:
+            with memoryview(self._mm) as whole:
+                part = whole[offset:offset + length]
+                try:
+                    return hashlib.sha256(part).digest()
+                finally:
+                    part.release()
+        if hasattr(os, "pread"):
+            data = os.pread(self._file.fileno(), length, offset)
+        else:
+            with self._read_lock:
+                self._file.seek(offset)
+                data = self._file.read(length)
+        return hashlib.sha256(data).digest()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+def _root_digest(leaves: List[bytes], size: int) -> str:
+    root = hashlib.sha256()
+    for leaf in leaves:
+        root.update(leaf)
+    root.update(struct.pack("<Q", size))
+    return "%s:%s" % (ALGORITHM, root.hexdigest())
+
+
+def hash_files(
+    paths: Iterable[str],
+    cache: Optional[HashCache] = None,
+    max_workers: Optional[int] = None,
+    sizes: Optional[Dict[str, int]] = None,
+) -> Dict[str, Optional[str]]:
+    """Hash files in parallel (chunks of all files share one thread pool). Returns {path: hash or None}.
+
+    None means the file could not be read. Results are taken from / stored in cache when given.
+    If sizes is a dict, it receives {path: size in bytes} from the same stat.
+    """
+    results: Dict[str, Optional[str]] = {}
+    todo: List[Tuple[str, os.stat_result]] = []
+    for path in paths:
+        if path in results:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            results[path] = None
+            continue
+        if sizes is not None:
+            sizes[path] = st.st_size
+        cached = cache.get(path, st.st_size, st.st_mtime_ns) if cache is not None else None
+        if cached is not None:
+            results[path] = cached
+        else:
+            results[path] = None
+            todo.append((path, st))
+    if not todo:
+        return results
+
+    workers = max_workers or min(16, (os.cpu_count() or 2) * 2)
+    in_flight: "collections.deque" = collections.deque()
+
+    def finish(item) -> None:
+        path, st, src, futures = item
+        try:
+            leaves = [f.result() for f in futures]
+        except (OSError, ValueError):
+            results[path] = None
+            return
+        finally:
+            src.close()
+        digest = _root_digest(leaves, st.st_size)
+        results[path] = digest
+        if cache is not None:
+            try:
+                after = os.stat(path)
+            except OSError:
+                return
+            if after.st_size == st.st_size and after.st_mtime_ns == st.st_mtime_ns:  # not modified while hashing
+                cache.put(path, st.st_size, st.st_mtime_ns, digest)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="MroyaHash") as pool:
+        for path, st in todo:
+            try:
+                src = _FileSource(path, st.st_size)
+            except OSError:
+                continue
+            futures = [pool.submit(src.digest, off, min(CHUNK_SIZE, st.st_size - off))
+                       for off in range(0, st.st_size, CHUNK_SIZE)]
+            in_flight.append((path, st, src, futures))
+            while len(in_flight) >= _MAX_OPEN_FILES:
+                finish(in_flight.popleft())
+        while in_flight:
+            finish(in_flight.popleft())
+    return results
+
+
+def hash_file(path: str, cache: Optional[HashCache] = None, max_workers: Optional[int] = None) -> Optional[str]:
+    return hash_files([path], cache=cache, max_workers=max_workers)[path]
+
+
+def _sequence_frames(pattern: str, frame_range) -> Optional[List[Tuple[int, str]]]:
+    from ftrack_sequence_check import frame_file_name, parse_pattern
+
+    parsed = parse_pattern(pattern)
+    if parsed is None:
+        return None
+    directory, prefix, suffix, padding = parsed
+    start, end = int(frame_range[0]), int(frame_range[1])
+    return [(f, os.path.join(directory, frame_file_name(prefix, suffix, padding, f))) for f in range(start, end + 1)]
+
+
+def annotate_job_hashes(
+    job: Dict[str, Any],
+    cache: Optional[HashCache] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Add metadata["content_hash"] and ["content_size"] to every enabled component whose files exist.
+
+    Sequences combine all frame hashes; a sequence with any unreadable frame gets no hash. The job is
+    modified in place and returned. Saves the cache afterwards.
+    """
+    cache = cache if cache is not None else get_hash_cache()
+    plans: List[Tuple[Dict[str, Any], Optional[List[Tuple[int, str]]], Optional[str]]] = []
+    all_paths: List[str] = []
+    for comp in job.get("components") or []:
+        if not comp.get("export_enabled", True):
+            continue
+        frames = None
+        pattern = comp.get("sequence_pattern") or comp.get("file_path")
+        if comp.get("frame_range") and pattern:
+            frames = _sequence_frames(pattern, comp["frame_range"])
+        if frames is not None:
+            all_paths.extend(p for _, p in frames)
+            plans.append((comp, frames, None))
+        elif comp.get("file_path"):
+            all_paths.append(comp["file_path"])
+            plans.append((comp, None, comp["file_path"]))
+    if not plans:
+        return job
+
+    sizes: Dict[str, int] = {}
+    hashes = hash_files(all_paths, cache=cache, max_workers=max_workers, sizes=sizes)
+    for comp, frames, path in plans:
+        if frames is not None:
+            frame_hashes = [hashes.get(p) for _, p in frames]
+            if not all(frame_hashes):
+                continue
+            combined = hashlib.sha256()
+            size = 0
+            for (frame, p), h in zip(frames, frame_hashes):
+                combined.update(b"%d:%s\n" % (frame, h.encode("ascii")))
+                size += sizes[p]
+            digest = "%s-seq:%s" % (ALGORITHM, combined.hexdigest())
+        else:
+            digest = hashes.get(path)
+            if not digest:
+                continue
+            size = sizes[path]
+        meta = comp.get("metadata")
+        if meta is None:
+            meta = comp["metadata"] = {}
+        meta["content_hash"] = digest
+        meta["content_size"] = str(size)
+    cache.save()
+    return job
@@ -0,0 +1,96 @@
+# :coding: utf-8
+"""
+Marshal work from background threads back to Unreal's game thread.
+
+Worker threads call run_on_game_thread(fn, ...) which only appends to a queue; the queue is drained
+on Slate post-tick (same mechanism as Content/Python/init_unreal.py uses for menu registration).
+The tick callback is registered while someone holds the dispatcher: call hold() on the game thread
+before starting background work and release() (on the game thread, e.g. from a dispatched callback)
+when done. Outside Unreal, callables run inline. Headless editor runs (commandlets, where Slate does
+not tick) call drain() between steps instead.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+# Time budget per tick for queued callables; anything left runs on the next tick.
+_TICK_BUDGET_SECONDS = 0.008
+
+_queue: "collections.deque[tuple]" = collections.deque()
+_lock = threading.Lock()
+_holds = 0
+_tick_handle = None
+
+
+def _set_result(future: Future, fn: Callable, args: tuple, kwargs: dict) -> None:
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def run_on_game_thread(fn: Callable, *args: Any, **kwargs: Any) -> Future:
+    """Queue fn(*args, **kwargs) for the next Slate tick. Safe to call from any thread."""
+    future: Future = Future()
+    if unreal is None:
+        _set_result(future, fn, args, kwargs)
+        return future
+    _queue.append((future, fn, args, kwargs))
+    return future
+
+
+def _on_tick(delta_seconds):
+    global _tick_handle
+    deadline = time.perf_counter() + _TICK_BUDGET_SECONDS
+    while _queue and time.perf_counter() < deadline:
+        future, fn, args, kwargs = _queue.popleft()
+        _set_result(future, fn, args, kwargs)
+    with _lock:
+        if _holds == 0 and not _queue and _tick_handle is not None:
+            try:
+                unreal.unregister_slate_post_tick_callback(_tick_handle)
+            except Exception:
+                pass
+            _tick_handle = None
+
+
+def hold() -> None:
+    """Keep the tick callback registered (game thread only)."""
+    global _holds, _tick_handle
+    if unreal is None:
+        return
+    with _lock:
+        _holds += 1
+        if _tick_handle is None:
+            _tick_handle = unreal.register_slate_post_tick_callback(_on_tick)
+
+
+def release() -> None:
+    """Drop a hold(); the callback unregisters itself once the queue is empty."""
+    global _holds
+    if unreal is None:
+        return
+    with _lock:
+        _holds = max(0, _holds - 1)
+
+
+def drain() -> int:
+    """Run everything queued now (game thread). For headless runs, where Slate does not tick. Returns the count."""
+    count = 0
+    while _queue:
+        future, fn, args, kwargs = _queue.popleft()
+        _set_result(future, fn, args, kwargs)
+        count += 1
+    return count
@@ -0,0 +1,118 @@
+# :coding: utf-8
+"""
+Read Ftrack Asset Handle fields from asset registry tags, without loading the handle assets.
+
+UFtrackAssetHandle marks ComponentId, AssetVersionId and ContentSubpath as AssetRegistrySearchable,
+so they are stored as tags in each package's registry data. Lookups here are in-memory registry
+queries. Handles saved before the tags existed (or whose ComponentId is empty) have no ComponentId
+tag; read_handle_tags() returns None for them and callers load those few assets instead. Resaving
+such handles adds the tags.
+
+    find_handles_by_component(ids)   - {component_id: [handle object paths]}
+    read_handle_tags(paths)          - {path: {"component_id", "version_id", "content_subpath"} or None}
+    iter_handle_asset_data(folder)   - AssetData of every handle under folder
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+COMPONENT_ID_TAG = "ComponentId"
+ASSET_VERSION_ID_TAG = "AssetVersionId"
+CONTENT_SUBPATH_TAG = "ContentSubpath"
+
+
+def _handle_class_path():
+    return unreal.TopLevelAssetPath("/Script/MroyaFtrack", "FtrackAssetHandle")
+
+
+def _tag(data, name: str) -> Optional[str]:
+    """Tag value as a stripped string, or None if missing/empty."""
+    value = data.get_tag_value(name)
+    if isinstance(value, tuple):  # (found, value) on engine versions that return the out-param pair
+        value = value[1] if value[0] else None
+    value = (str(value) if value is not None else "").strip()
+    return value or None
+
+
+def _object_path(data) -> str:
+    return "%s.%s" % (data.package_name, data.asset_name)
+
+
+def _package_name(handle_path: str) -> str:
+    return handle_path.split(".", 1)[0]
+
+
+def _normalize_object_path(handle_path: str) -> str:
+    """Package path "/Game/A/H" -> object path "/Game/A/H.H"; object paths are returned unchanged."""
+    if "." in handle_path.rsplit("/", 1)[-1]:
+        return handle_path
+    return "%s.%s" % (handle_path, handle_path.rsplit("/", 1)[-1])
+
+
+def tags_of(data) -> Optional[Dict[str, Optional[str]]]:
+    """Handle fields from one AssetData's tags, or None if the ComponentId tag is missing."""
+    component_id = _tag(data, COMPONENT_ID_TAG)
+    if not component_id:
+        return None
+    return {
+        "component_id": component_id,
+        "version_id": _tag(data, ASSET_VERSION_ID_TAG),
+        "content_subpath": _tag(data, CONTENT_SUBPATH_TAG),
+    }
+
+
+def iter_handle_asset_data(content_path: str = "/Game") -> Iterable[Any]:
+    """AssetData of every UFtrackAssetHandle under content_path (recursive; nothing is loaded)."""
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    ar_filter = unreal.ARFilter(
+        class_paths=[_handle_class_path()],
+        package_paths=[content_path.rstrip("/") or "/Game"],
+        recursive_paths=True,
+        recursive_classes=True,
+    )
+    return registry.get_assets(ar_filter) or []
+
+
+def read_handle_tags(handle_paths: Iterable[str]) -> Dict[str, Optional[Dict[str, Optional[str]]]]:
+    """{path: tag fields or None} for the given handle paths, with one registry query.
+
+    None means the handle is not in the registry or has no ComponentId tag (load it instead).
+    """
+    handle_paths = list(handle_paths)
+    if not handle_paths:
+        return {}
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    ar_filter = unreal.ARFilter(
+        package_names=sorted({_package_name(p) for p in handle_paths}),
+        class_paths=[_handle_class_path()],
+        recursive_classes=True,
+    )
+    by_path = {_object_path(d): d for d in registry.get_assets(ar_filter) or []}
+    out: Dict[str, Optional[Dict[str, Optional[str]]]] = {}
+    for path in handle_paths:
+        data = by_path.get(_normalize_object_path(path))
+        out[path] = tags_of(data) if data is not None else None
+    return out
+
+
+def find_handles_by_component(component_ids: Iterable[str], content_path: str = "/Game") -> Dict[str, List[str]]:
+    """{component_id: [handle object paths]} for handles under content_path that reference the given IDs.
+
+    Uses registry tags only; handles without a ComponentId tag (not resaved since the tags were
+    added) are not found.
+    """
+    wanted = {str(i) for i in component_ids if i}
+    out: Dict[str, List[str]] = {i: [] for i in wanted}
+    if not wanted:
+        return out
+    for data in iter_handle_asset_data(content_path):
+        component_id = _tag(data, COMPONENT_ID_TAG)
+        if component_id in wanted:
+            out[component_id].append(_object_path(data))
+    return out
@@ -0,0 +1,245 @@
+# :coding: utf-8
+"""
+Import manifest: what each Ftrack Asset Handle was last imported from, so re-import can skip handles
+whose source did not change.
+
+One entry per handle object path, persisted as JSON at Saved/MroyaFtrack/import_manifest.json:
+    component_id, version_id, source_path, size, mtime_ns, content_hash, destination,
+    imported_object_paths, imported_at
+
+Entries are written on the game thread right after an import (a stat, no hashing). The content hash
+(ftrack_content_hash) is filled in afterwards on a background thread, so large sources never block
+the editor. Re-import compares the re-resolved source against the entry: a different path or version,
+or a different size, means changed. If only the mtime differs, the content hash decides, so a
+touched but identical file is not re-imported.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_MANIFEST_FILE_NAME = "import_manifest.json"
+_FORMAT_VERSION = 1
+
+
+def _default_manifest_path() -> Optional[str]:
+    if unreal is None:
+        return None
+    try:
+        saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    except Exception:
+        return None
+    return os.path.join(saved, "MroyaFtrack", _MANIFEST_FILE_NAME)
+
+
+class ImportManifest:
+    """Thread-safe map of handle object path -> last import record."""
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._path or not os.path.isfile(self._path):
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _FORMAT_VERSION and isinstance(data.get("handles"), dict):
+            self._entries = data["handles"]
+
+    def get(self, handle: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(handle)
+            return dict(entry) if entry is not None else None
+
+    def handles(self) -> List[str]:
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._entries)
+
+    def record(
+        self,
+        handle: str,
+        *,
+        component_id: Optional[str],
+        version_id: Optional[str],
+        source_path: str,
+        size: int,
+        mtime_ns: int,
+        destination: Optional[str],
+        imported_object_paths: Iterable[str],
+        content_hash: Optional[str] = None,
+    ) -> None:
+        entry = {
+            "component_id": component_id,
+            "version_id": version_id,
+            "source_path": source_path,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "content_hash": content_hash,
+            "destination": destination,
+            "imported_object_paths": list(imported_object_paths),
+            "imported_at": time.time(),
+        }
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[handle] = entry
+            self._dirty = True
+
+    def set_content_hash(self, handle: str, source_path: str, size: int, mtime_ns: int, content_hash: str) -> bool:
+        """Store the hash if the entry still records exactly this file state. Returns False otherwise."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(handle)
+            if (entry is None or entry.get("source_path") != source_path
+                    or entry.get("size") != size or entry.get("mtime_ns") != mtime_ns):
+                return False
+            entry["content_hash"] = content_hash
+            self._dirty = True
+            return True
+
+    def remove(self, handle: str) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(handle, None) is not None:
+                self._dirty = True
+
+    def save(self) -> bool:
+        """Write the manifest to disk if it changed. Returns True if a file was written."""
+        if not self._path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = {"version": _FORMAT_VERSION, "handles": {k: dict(v) for k, v in self._entries.items()}}
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            tmp = self._path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp, self._path)
+            return True
+        except OSError as e:
+            if unreal:
+                unreal.log_warning("Ftrack: Could not save import manifest: %s" % e)
+            return False
+
+
+_manifest: Optional[ImportManifest] = None
+_manifest_save_lock = threading.Lock()
+
+
+def get_import_manifest() -> ImportManifest:
+    """Shared manifest persisted under the project's Saved folder (memory-only outside Unreal)."""
+    global _manifest
+    if _manifest is None:
+        _manifest = ImportManifest(_default_manifest_path())
+    return _manifest
+
+
+def _save_shared() -> None:
+    with _manifest_save_lock:  # the game thread and the hash thread may both save
+        get_import_manifest().save()
+
+
+def source_change(entry: Optional[Dict[str, Any]], source_path: str, version_id: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Compare a re-resolved source with its manifest entry. Worker-thread safe (stat and hash only).
+
+    Returns (reason, content_hash): reason is None when the source is unchanged, otherwise a short
+    description. content_hash is set when it had to be computed for the decision.
+    """
+    if entry is None:
+        return "not imported yet", None
+    if entry.get("version_id") != version_id:
+        return "version %s -> %s" % (entry.get("version_id"), version_id), None
+    if os.path.normcase(entry.get("source_path") or "") != os.path.normcase(source_path):
+        return "source path changed", None
+    try:
+        st = os.stat(source_path)
+    except OSError as e:
+        return "source not readable: %s" % e, None
+    if st.st_size != entry.get("size"):
+        return "size changed", None
+    if st.st_mtime_ns == entry.get("mtime_ns"):
+        return None, entry.get("content_hash")
+    if not entry.get("content_hash"):
+        return "modified (no recorded hash)", None
+    from ftrack_content_hash import get_hash_cache, hash_file
+
+    digest = hash_file(source_path, cache=get_hash_cache())
+    if digest != entry["content_hash"]:
+        return "content changed", digest
+    return None, digest
+
+
+def record_imports(results: List[Dict[str, Any]]) -> None:
+    """Record every successfully imported result (game thread), then hash their sources in the background."""
+    manifest = get_import_manifest()
+    to_hash: List[Tuple[str, str, str]] = []
+    for r in results:
+        if r.get("error") or not r.get("imported") or not r.get("path"):
+            continue
+        try:
+            st = os.stat(r["path"])
+        except OSError:
+            continue
+        manifest.record(
+            r["handle"],
+            component_id=r.get("component_id"),
+            version_id=r.get("version_id"),
+            source_path=r["path"],
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            destination=r.get("destination"),
+            imported_object_paths=r.get("imported_object_paths") or [],
+            content_hash=r.get("content_hash"),
+        )
+        if not r.get("content_hash"):
+            # Hash the prefetched local copy when there is one (same bytes, no network reads).
+            to_hash.append((r["handle"], r["path"], r.get("local_path") or r["path"]))
+    _save_shared()
+    if to_hash:
+        threading.Thread(target=_hash_sources, args=(to_hash,), name="MroyaFtrackManifestHash", daemon=True).start()
+
+
+def _hash_sources(items: List[Tuple[str, str, str]]) -> None:
+    """items: (handle, recorded source path, file to hash). A local copy keeps the source's size and mtime."""
+    from ftrack_content_hash import get_hash_cache, hash_files
+
+    cache = get_hash_cache()
+    try:
+        hashes = hash_files([p for _, _, p in items], cache=cache)
+        manifest = get_import_manifest()
+        for handle, source_path, hash_path in items:
+            digest = hashes.get(hash_path)
+            if not digest:
+                continue
+            try:
+                st = os.stat(hash_path)
+            except OSError:
+                continue
+            manifest.set_content_hash(handle, source_path, st.st_size, st.st_mtime_ns, digest)
+        cache.save()
+        _save_shared()
+    except Exception:
+        pass  # the hash only lets a later re-import skip touched-but-identical files
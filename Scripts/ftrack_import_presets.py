@@ -0,0 +1,213 @@
+# :coding: utf-8
+"""
+Import option presets for unattended (automated) imports, chosen per file.
+
+Automated AssetImportTasks never show the options dialog, so their options must be set up front. A
+preset names an options class (FbxImportUI, AbcImportSettings, ...) and its property values, and/or a
+factory class with properties. Rules pick the preset for a file by extension and optional file name
+patterns; the first matching rule wins.
+
+The project config is JSON at <Project>/Config/MroyaFtrackImportPresets.json (or the path in
+MROYA_FTRACK_IMPORT_PRESETS):
+
+    {
+      "version": 1,
+      "rules": [{"preset": "fbx_skeletal", "extensions": [".fbx"], "name_patterns": ["SK_*"]}, ...],
+      "presets": {
+        "fbx_static": {"options_class": "FbxImportUI",
+                       "options": {"import_as_skeletal": false,
+                                   "static_mesh_import_data": {"combine_meshes": true}}},
+        "texture": {"factory_class": "TextureFactory", "factory_options": {"lod_group": "TEXTUREGROUP_WORLD"}}
+      }
+    }
+
+"presets" entries replace the built-in preset of the same name; "rules", when given, replace the
+built-in rules. Nested objects/structs are dicts, enum values are their names as strings, vectors and
+rotators are [x, y, z] lists. Built-in presets: fbx_static, fbx_skeletal, alembic, texture.
+"""
+
+from __future__ import annotations
+
+import copy
+import fnmatch
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_CONFIG_FILE_NAME = "MroyaFtrackImportPresets.json"
+_ENV = "MROYA_FTRACK_IMPORT_PRESETS"
+
+_TEXTURE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".tga", ".exr", ".tif", ".tiff", ".psd", ".bmp", ".hdr"]
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "rules": [
+        {"preset": "fbx_skeletal", "extensions": [".fbx"], "name_patterns": ["sk_*", "*_sk_*", "*_sk", "*_skel*", "*_rig*"]},
+        {"preset": "fbx_static", "extensions": [".fbx", ".obj"]},
+        {"preset": "alembic", "extensions": [".abc"]},
+        {"preset": "texture", "extensions": _TEXTURE_EXTENSIONS},
+    ],
+    "presets": {
+        "fbx_static": {
+            "options_class": "FbxImportUI",
+            "options": {
+                "automated_import_should_detect_type": False,
+                "mesh_type_to_import": "FBXIT_STATIC_MESH",
+                "import_mesh": True,
+                "import_as_skeletal": False,
+                "import_animations": False,
+                "import_materials": True,
+                "import_textures": True,
+                "static_mesh_import_data": {"combine_meshes": True, "auto_generate_collision": True},
+            },
+        },
+        "fbx_skeletal": {
+            "options_class": "FbxImportUI",
+            "options": {
+                "automated_import_should_detect_type": False,
+                "mesh_type_to_import": "FBXIT_SKELETAL_MESH",
+                "import_mesh": True,
+                "import_as_skeletal": True,
+                "import_animations": True,
+                "import_materials": True,
+                "import_textures": True,
+                "create_physics_asset": True,
+            },
+        },
+        "alembic": {
+            "options_class": "AbcImportSettings",
+            "options": {"import_type": "GEOMETRY_CACHE"},
+        },
+        "texture": {},
+    },
+}
+
+_config_lock = threading.Lock()
+_config_cache: Dict[str, Any] = {"key": None, "config": None}
+
+
+def config_path() -> Optional[str]:
+    """Project preset config path (MROYA_FTRACK_IMPORT_PRESETS overrides). May not exist."""
+    env = os.environ.get(_ENV, "").strip()
+    if env:
+        return env
+    if unreal is None:
+        return None
+    try:
+        config_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_config_dir())
+    except Exception:
+        return None
+    return os.path.join(config_dir, _CONFIG_FILE_NAME)
+
+
+def load_config(path: Optional[str] = None) -> Dict[str, Any]:
+    """Built-in presets merged with the project config. Re-read only when the file changes."""
+    path = path or config_path()
+    try:
+        mtime = os.stat(path).st_mtime_ns if path else None
+    except OSError:
+        mtime = None
+    key = (path, mtime)
+    with _config_lock:
+        if _config_cache["key"] == key and _config_cache["config"] is not None:
+            return _config_cache["config"]
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    if mtime is not None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object, got %s" % type(data).__name__)
+        except (OSError, ValueError) as e:
+            if unreal:
+                unreal.log_warning("Ftrack: Could not read import presets %s: %s (using built-in presets)" % (path, e))
+            data = {}
+        if isinstance(data.get("presets"), dict):
+            config["presets"].update(data["presets"])
+        if isinstance(data.get("rules"), list):
+            config["rules"] = data["rules"]
+    with _config_lock:
+        _config_cache.update(key=key, config=config)
+    return config
+
+
+def choose_preset(file_path: str, config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Name of the first rule's preset matching the file's extension and name patterns, or None."""
+    config = config or load_config()
+    name = os.path.basename(file_path).lower()
+    stem, ext = os.path.splitext(name)
+    for rule in config.get("rules") or []:
+        extensions = [e.lower() for e in rule.get("extensions") or []]
+        if extensions and ext not in extensions:
+            continue
+        patterns = [p.lower() for p in rule.get("name_patterns") or []]
+        if patterns and not any(fnmatch.fnmatchcase(stem, p) or fnmatch.fnmatchcase(name, p) for p in patterns):
+            continue
+        return rule.get("preset")
+    return None
+
+
+def _convert(current: Any, value: Any) -> Any:
+    if isinstance(value, str) and isinstance(current, unreal.EnumBase):
+        return getattr(type(current), value.upper())
+    if isinstance(value, (list, tuple)):
+        if isinstance(current, unreal.Vector):
+            return unreal.Vector(*value)
+        if isinstance(current, unreal.Rotator):
+            return unreal.Rotator(*value)
+    return value
+
+
+def _apply_properties(obj: Any, props: Dict[str, Any], where: str) -> None:
+    for key, value in props.items():
+        try:
+            current = obj.get_editor_property(key)
+            if isinstance(value, dict):
+                if current is None:
+                    raise ValueError("is not set, cannot apply nested values")
+                _apply_properties(current, value, "%s.%s" % (where, key))
+                obj.set_editor_property(key, current)  # structs are copies; write them back
+            else:
+                obj.set_editor_property(key, _convert(current, value))
+        except Exception as e:
+            raise ValueError("%s.%s: %s" % (where, key, e))
+
+
+def build_preset(name: str, config: Optional[Dict[str, Any]] = None) -> Tuple[Any, Any]:
+    """(options object or None, factory or None) for a preset. New objects on every call."""
+    config = config or load_config()
+    preset = (config.get("presets") or {}).get(name)
+    if preset is None:
+        raise KeyError("Unknown import preset %r." % name)
+    options = factory = None
+    if preset.get("options_class"):
+        options = getattr(unreal, preset["options_class"])()
+        _apply_properties(options, preset.get("options") or {}, preset["options_class"])
+    if preset.get("factory_class"):
+        factory = getattr(unreal, preset["factory_class"])()
+        _apply_properties(factory, preset.get("factory_options") or {}, preset["factory_class"])
+    return options, factory
+
+
+def apply_preset(task: Any, file_path: str, preset: Optional[str] = None, config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Set task.options / task.factory from preset (or the rule match for file_path). Returns the preset used."""
+    config = config or load_config()
+    name = preset or choose_preset(file_path, config)
+    if not name:
+        return None
+    options, factory = build_preset(name, config)
+    if options is not None:
+        task.options = options
+    if factory is not None:
+        task.factory = factory
+    return name
+
+
+def preset_names(config: Optional[Dict[str, Any]] = None) -> List[str]:
+    return sorted((config or load_config()).get("presets") or {})
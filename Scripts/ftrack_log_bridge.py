@@ -0,0 +1,328 @@
+# :coding: utf-8
+"""
+Route Python logging to the Unreal Output Log without per-record overhead.
+
+UnrealQueueLogHandler.emit() only appends to a bounded queue, so it never blocks and is safe from any
+thread (ftrack event hub, resolve workers). Records are formatted and passed to unreal.log* on the game
+thread in bounded batches from a Slate post-tick callback.
+
+Noisy libraries get per-logger levels (set on the loggers themselves, so filtered records are never
+created), and each logger is rate limited. Records dropped because the queue was full or a logger
+exceeded its rate are counted and reported in the Output Log.
+
+Per-logger levels can be overridden with MROYA_FTRACK_LOG_LEVELS, e.g. "ftrack_api=DEBUG,urllib3=INFO".
+
+redirect_stderr() swaps sys.stderr for UnrealStderrStream, which coalesces write() fragments into whole
+lines and forwards them on tick; restore_stderr() puts the original stream back (on browser close).
+"""
+
+from __future__ import annotations
+
+import collections
+import copy
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_LOGGER_LEVELS: Dict[str, int] = {
+    "urllib3": logging.WARNING,
+    "botocore": logging.WARNING,
+    "boto3": logging.WARNING,
+    "s3transfer": logging.WARNING,
+    "ftrack_api": logging.INFO,
+}
+
+_LEVELS_ENV = "MROYA_FTRACK_LOG_LEVELS"
+
+
+def logger_levels_from_env() -> Dict[str, int]:
+    """Parse MROYA_FTRACK_LOG_LEVELS ("name=LEVEL,name=LEVEL") into {logger name: level}."""
+    out: Dict[str, int] = {}
+    for item in os.environ.get(_LEVELS_ENV, "").split(","):
+        name, _, level = item.partition("=")
+        name, level = name.strip(), level.strip().upper()
+        if not name or not level:
+            continue
+        value = logging.getLevelName(level)
+        if isinstance(value, int):
+            out[name] = value
+    return out
+
+
+def apply_logger_levels(levels: Dict[str, int]) -> None:
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+class UnrealQueueLogHandler(logging.Handler):
+    """Non-blocking handler: emit() queues, drain() forwards to unreal.log/log_warning/log_error."""
+
+    def __init__(
+        self,
+        unreal_module,
+        *,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        max_records_per_logger_per_second: int = 100,
+    ):
+        super().__init__()
+        self._unreal = unreal_module
+        self._queue: "collections.deque[logging.LogRecord]" = collections.deque()
+        self._max_queue = max_queue
+        self._batch_size = batch_size
+        self._rate = max_records_per_logger_per_second
+        self._rate_windows: Dict[str, list] = {}  # logger name -> [window start second, count]
+        self._count_lock = threading.Lock()
+        self.dropped_queue_full = 0
+        self.dropped_rate_limited = 0
+        self._reported_dropped = (0, 0)
+        self._tick_handle = None
+
+    def _rate_limited(self, name: str) -> bool:
+        if self._rate <= 0:
+            return False
+        now = int(time.monotonic())
+        with self._count_lock:
+            window = self._rate_windows.get(name)
+            if window is None or window[0] != now:
+                self._rate_windows[name] = [now, 1]
+                return False
+            window[1] += 1
+            if window[1] > self._rate:
+                self.dropped_rate_limited += 1
+                return True
+        return False
+
+    def emit(self, record):
+        if self._rate_limited(record.name):
+            return
+        if len(self._queue) >= self._max_queue:
+            with self._count_lock:
+                self.dropped_queue_full += 1
+            return
+        try:
+            # Resolve %-args now: the objects they reference may change before the drain runs.
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info and not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        except Exception:
+            self.handleError(record)
+            return
+        self._queue.append(record)
+
+    def drain(self, max_records: Optional[int] = None) -> int:
+        """Forward up to max_records (default batch_size) queued records to Unreal. Game thread only."""
+        limit = self._batch_size if max_records is None else max_records
+        n = 0
+        while n < limit:
+            try:
+                record = self._queue.popleft()
+            except IndexError:
+                break
+            n += 1
+            try:
+                msg = self.format(record)
+                if record.levelno >= logging.ERROR:
+                    self._unreal.log_error(msg)
+                elif record.levelno >= logging.WARNING:
+                    self._unreal.log_warning(msg)
+                else:
+                    self._unreal.log(msg)
+            except Exception:
+                self.handleError(record)
+        dropped = (self.dropped_queue_full, self.dropped_rate_limited)
+        if dropped != self._reported_dropped:
+            self._unreal.log_warning(
+                "Ftrack: Dropped log records so far: %s (queue full), %s (rate limited)." % dropped
+            )
+            self._reported_dropped = dropped
+        return n
+
+    def _on_tick(self, delta_seconds):
+        if self._queue or (self.dropped_queue_full, self.dropped_rate_limited) != self._reported_dropped:
+            self.drain()
+
+    def install_tick(self) -> None:
+        """Start draining on Slate post-tick (game thread)."""
+        if self._tick_handle is None:
+            self._tick_handle = self._unreal.register_slate_post_tick_callback(self._on_tick)
+
+    def close(self):
+        if self._tick_handle is not None:
+            try:
+                self._unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            except Exception:
+                pass
+            self._tick_handle = None
+        try:
+            self.drain(max_records=len(self._queue))
+        except Exception:
+            pass
+        super().close()
+
+
+_handler: Optional[UnrealQueueLogHandler] = None
+
+
+def install_root_handler(unreal_module, logger_levels: Optional[Dict[str, int]] = None) -> UnrealQueueLogHandler:
+    """Replace root logging handlers with the shared queue handler (once) and apply per-logger levels."""
+    global _handler
+    root = logging.getLogger()
+    if _handler is None:
+        _handler = UnrealQueueLogHandler(unreal_module)
+        _handler.install_tick()
+    for h in root.handlers[:]:
+        if h is not _handler:
+            root.removeHandler(h)
+    if _handler not in root.handlers:
+        root.addHandler(_handler)
+    root.setLevel(logging.DEBUG)
+    levels = dict(DEFAULT_LOGGER_LEVELS)
+    levels.update(logger_levels or {})
+    levels.update(logger_levels_from_env())
+    apply_logger_levels(levels)
+    return _handler
+
+
+def get_root_handler() -> Optional[UnrealQueueLogHandler]:
+    return _handler
+
+
+class UnrealStderrStream:
+    """Line-buffered stderr replacement that forwards whole lines to unreal.log() on Slate tick.
+
+    Fragments are joined until a newline (or the partial line exceeds max_partial chars, or the tick
+    ends). Pending lines are bounded: writers on other threads wait briefly for the game thread to
+    drain, then lines are dropped and counted. Thread-safe.
+    """
+
+    def __init__(self, unreal_module, original=None, *, max_partial: int = 8192, max_pending_lines: int = 5000,
+                 lines_per_tick: int = 500, backpressure_timeout: float = 0.5):
+        self._unreal = unreal_module
+        self.original = original
+        self._max_partial = max_partial
+        self._max_pending = max_pending_lines
+        self._lines_per_tick = lines_per_tick
+        self._timeout = backpressure_timeout
+        self._partial = ""
+        self._pending: "collections.deque[str]" = collections.deque()
+        self._cond = threading.Condition()
+        self._game_thread = threading.get_ident()
+        self.dropped_lines = 0
+        self._reported_dropped = 0
+        self._tick_handle = None
+
+    def write(self, msg):
+        if not msg:
+            return 0
+        with self._cond:
+            text = self._partial + msg
+            lines = text.split("\n")
+            self._partial = lines.pop()
+            if len(self._partial) >= self._max_partial:
+                lines.append(self._partial)
+                self._partial = ""
+            for line in lines:
+                self._push_line(line)
+        return len(msg)
+
+    def _push_line(self, line: str) -> None:
+        # Caller holds self._cond.
+        if len(self._pending) >= self._max_pending and threading.get_ident() != self._game_thread:
+            self._cond.wait_for(lambda: len(self._pending) < self._max_pending, timeout=self._timeout)
+        if len(self._pending) >= self._max_pending:
+            self.dropped_lines += 1
+            return
+        self._pending.append(line)
+
+    def flush(self):
+        """Move a pending partial line to the queue (it is forwarded on the next drain)."""
+        with self._cond:
+            if self._partial:
+                self._push_line(self._partial)
+                self._partial = ""
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return False
+
+    def drain(self, max_lines: Optional[int] = None, flush_partial: bool = True) -> int:
+        """Forward queued lines as one unreal.log() call. Game thread only."""
+        if flush_partial:
+            self.flush()
+        limit = self._lines_per_tick if max_lines is None else max_lines
+        with self._cond:
+            lines = []
+            while self._pending and len(lines) < limit:
+                lines.append(self._pending.popleft())
+            self._cond.notify_all()
+            dropped = self.dropped_lines
+        text = "\n".join(line.rstrip() for line in lines).strip("\n")
+        if text.strip():
+            self._unreal.log(text)
+        if dropped != self._reported_dropped:
+            self._unreal.log_warning("Ftrack: Dropped %s stderr line(s) (output too fast)." % dropped)
+            self._reported_dropped = dropped
+        return len(lines)
+
+    def _on_tick(self, delta_seconds):
+        if self._pending or self._partial or self.dropped_lines != self._reported_dropped:
+            self.drain()
+
+    def install_tick(self) -> None:
+        if self._tick_handle is None:
+            self._tick_handle = self._unreal.register_slate_post_tick_callback(self._on_tick)
+
+    def uninstall_tick(self) -> None:
+        if self._tick_handle is not None:
+            try:
+                self._unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            except Exception:
+                pass
+            self._tick_handle = None
+
+
+_stderr_stream: Optional[UnrealStderrStream] = None
+
+
+def _retire_stream(stream: UnrealStderrStream) -> None:
+    stream.uninstall_tick()
+    try:
+        while stream.drain():
+            pass
+    except Exception:
+        pass
+
+
+def redirect_stderr(unreal_module) -> UnrealStderrStream:
+    """Point sys.stderr at a line-buffered UnrealStderrStream (game thread). Idempotent."""
+    global _stderr_stream
+    if _stderr_stream is not None and sys.stderr is _stderr_stream:
+        return _stderr_stream
+    if _stderr_stream is not None:
+        # Something else replaced sys.stderr since: stop the old stream's tick and forward what it buffered.
+        _retire_stream(_stderr_stream)
+    _stderr_stream = UnrealStderrStream(unreal_module, original=sys.stderr)
+    _stderr_stream.install_tick()
+    sys.stderr = _stderr_stream
+    return _stderr_stream
+
+
+def restore_stderr() -> None:
+    """Flush buffered output and put the original sys.stderr back (game thread)."""
+    global _stderr_stream
+    stream = _stderr_stream
+    if stream is None:
+        return
+    _stderr_stream = None
+    _retire_stream(stream)
+    if sys.stderr is stream:
+        sys.stderr = stream.original if stream.original is not None else sys.__stderr__
@@ -11,11 +11,23 @@ ftrack_inout JobBuilder.
 
 Optional scenario keys: include_unreal_metadata=True adds scenario index/description into the main
 component Metadata only (not playblast; playblast is never metadata).
+
+Built job dicts are cached per handle and flags, keyed on the handle's EditGeneration (bumped by the
+C++ class on load, Modify, property edits and undo/redo), so repeated validation passes over unchanged
+handles skip the property reads.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import collections
+import json
+import os
+import threading
+import time
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ftrack_trace import span, traced
 
 try:
     import unreal
@@ -23,21 +35,51 @@ except ImportError:
     unreal = None
 
 
-def _get_prop(obj: Any, *names: str) -> Any:
-    """Read first available property (Unreal Python naming varies by version)."""
-    if obj is None:
-        return None
+# (type, candidate names) -> accessor learned on the first successful read, or None if nothing matched.
+# Unreal structs/classes have a fixed property set, so the answer is the same for every instance.
+_accessor_cache: Dict[Tuple[type, Tuple[str, ...]], Optional[Callable[[Any], Any]]] = {}
+
+
+def _editor_property_accessor(name: str) -> Callable[[Any], Any]:
+    return lambda obj: obj.get_editor_property(name)
+
+
+def _probe_prop(obj: Any, names: Tuple[str, ...]) -> Tuple[Any, Optional[Callable[[Any], Any]]]:
+    """Original probing order: get_editor_property(n), then getattr(n), for each name."""
     for n in names:
         try:
             if hasattr(obj, "get_editor_property"):
-                return obj.get_editor_property(n)
+                return obj.get_editor_property(n), _editor_property_accessor(n)
         except Exception:
             pass
         try:
-            return getattr(obj, n)
+            return getattr(obj, n), attrgetter(n)
         except Exception:
             pass
-    return None
+    return None, None
+
+
+def _get_prop(obj: Any, *names: str) -> Any:
+    """Read first available property (Unreal Python naming varies by version).
+
+    The working name and access path are learned once per type; later reads use that accessor directly
+    and only fall back to probing if it fails.
+    """
+    if obj is None:
+        return None
+    key = (type(obj), names)
+    try:
+        accessor = _accessor_cache[key]
+    except KeyError:
+        value, _accessor_cache[key] = _probe_prop(obj, names)
+        return value
+    if accessor is None:
+        return None
+    try:
+        return accessor(obj)
+    except Exception:
+        value, _accessor_cache[key] = _probe_prop(obj, names)
+        return value
 
 
 def _binding_str(raw: Any) -> str:
@@ -186,67 +228,257 @@ def out_handle_component_bindings(handle: Any) -> List[Dict[str, str]]:
     return out
 
 
-def out_handle_to_publish_job_dict(
-    handle: Any,
-    *,
-    include_unreal_metadata: bool = False,
-    merge_frame_into_metadata: bool = True,
-) -> Dict[str, Any]:
-    """
-    Build a dict suitable for PublishJob.from_dict from a UFtrackOutHandle asset.
-
-    Args:
-        handle: Loaded UFtrackOutHandle UObject, or asset path string.
-        include_unreal_metadata: If True, push scenario index/description into the main component metadata.
-        merge_frame_into_metadata: If True and frame range is set, add start_frame/end_frame to metadata.
-    """
+def _load_out_handle(handle: Any) -> Any:
     if unreal is None:
         raise RuntimeError("unreal module is not available (run inside Unreal Editor).")
     asset = handle
     if isinstance(handle, str):
-        asset = unreal.load_asset(handle)
+        with span("publish.load_out_handle"):
+            asset = unreal.load_asset(handle)
     if not asset:
         raise ValueError("Could not load Ftrack Out Handle asset.")
+    return asset
+
+
+def _job_header(asset: Any) -> Dict[str, Any]:
+    """Job-level fields of the publish job dict (everything except components)."""
+    return {
+        "task_id": (_get_prop(asset, "TaskId", "task_id") or "").strip(),
+        "asset_id": (_get_prop(asset, "AssetId", "asset_id") or "").strip() or None,
+        "asset_name": (_get_prop(asset, "AssetName", "asset_name") or "").strip() or None,
+        "asset_type": (_get_prop(asset, "AssetType", "asset_type") or "").strip() or None,
+        "comment": (_get_prop(asset, "Comment", "comment") or "").strip(),
+        "thumbnail_path": (_get_prop(asset, "ThumbnailPath", "thumbnail_path") or "").strip() or None,
+        "source_dcc": (_get_prop(asset, "SourceDcc", "source_dcc") or "unreal").strip() or "unreal",
+        "transfer_target_location": (_get_prop(asset, "TransferTargetLocation", "transfer_target_location") or "").strip() or None,
+    }
 
-    task_id = (_get_prop(asset, "TaskId", "task_id") or "").strip()
-    asset_id = (_get_prop(asset, "AssetId", "asset_id") or "").strip() or None
-    asset_name = (_get_prop(asset, "AssetName", "asset_name") or "").strip() or None
-    asset_type = (_get_prop(asset, "AssetType", "asset_type") or "").strip() or None
-    comment = (_get_prop(asset, "Comment", "comment") or "").strip()
-    thumbnail_path = (_get_prop(asset, "ThumbnailPath", "thumbnail_path") or "").strip() or None
-    use_pb = _get_prop(asset, "bUsePlayblast", "use_playblast")
-    pb_path = (_get_prop(asset, "PlayblastPath", "playblast_path") or "").strip()
-    source_dcc = (_get_prop(asset, "SourceDcc", "source_dcc") or "unreal").strip() or "unreal"
-    transfer_loc = (_get_prop(asset, "TransferTargetLocation", "transfer_target_location") or "").strip() or None
 
+def iter_job_components(
+    asset: Any,
+    *,
+    include_unreal_metadata: bool = False,
+    merge_frame_into_metadata: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """Yield component dicts one at a time (Components array entries, then the playblast if enabled)."""
     raw_components = _get_prop(asset, "Components", "components")
-    components: List[Dict[str, Any]] = []
     if raw_components:
         for entry in raw_components:
-            components.append(
-                _entry_to_component_dict(
-                    entry,
-                    include_unreal_metadata=include_unreal_metadata,
-                    merge_frame_into_metadata=merge_frame_into_metadata,
-                )
+            yield _entry_to_component_dict(
+                entry,
+                include_unreal_metadata=include_unreal_metadata,
+                merge_frame_into_metadata=merge_frame_into_metadata,
             )
+    use_pb = _get_prop(asset, "bUsePlayblast", "use_playblast")
+    pb_path = (_get_prop(asset, "PlayblastPath", "playblast_path") or "").strip()
     if bool(use_pb) and pb_path:
-        components.append(_playblast_component_dict(pb_path))
+        yield _playblast_component_dict(pb_path)
+
+
+# (object path, include_unreal_metadata, merge_frame_into_metadata) -> (EditGeneration, job dict), LRU order.
+# EditGeneration changes on every load, Modify, property edit and undo/redo of the handle, so a stale
+# entry never matches; entries are only evicted for size or by invalidate_publish_job_cache().
+_JOB_CACHE_MAX_ENTRIES = 2048
+_job_cache: "collections.OrderedDict[Tuple[str, bool, bool], Tuple[int, Dict[str, Any]]]" = collections.OrderedDict()
+_job_cache_lock = threading.Lock()
+job_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "uncacheable": 0}
+
+
+def _copy_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a job dict deep enough that callers can mutate it (components and their metadata)."""
+    out = dict(job)
+    out["components"] = [dict(c, metadata=dict(c["metadata"])) for c in job["components"]]
+    return out
+
+
+def invalidate_publish_job_cache(asset_path: Optional[str] = None) -> None:
+    """Drop cached job dicts for one handle (object or package path), or all handles.
+
+    Only needed after writing handle properties in a way that bypasses Modify/PostEditChangeProperty.
+    """
+    with _job_cache_lock:
+        if asset_path is None:
+            _job_cache.clear()
+            return
+        package = asset_path.split(".", 1)[0]
+        for key in [k for k in _job_cache if k[0].split(".", 1)[0] == package]:
+            del _job_cache[key]
+
+
+def _build_job_dict(asset: Any, include_unreal_metadata: bool, merge_frame_into_metadata: bool) -> Dict[str, Any]:
+    header = _job_header(asset)
+    with span("publish.components_to_dicts") as sp:
+        components = list(
+            iter_job_components(
+                asset,
+                include_unreal_metadata=include_unreal_metadata,
+                merge_frame_into_metadata=merge_frame_into_metadata,
+            )
+        )
+        sp.set(count=len(components))
 
     job: Dict[str, Any] = {
-        "task_id": task_id,
-        "asset_id": asset_id,
-        "asset_name": asset_name,
-        "asset_type": asset_type,
-        "comment": comment,
+        "task_id": header["task_id"],
+        "asset_id": header["asset_id"],
+        "asset_name": header["asset_name"],
+        "asset_type": header["asset_type"],
+        "comment": header["comment"],
         "components": components,
-        "thumbnail_path": thumbnail_path,
-        "source_dcc": source_dcc,
-        "transfer_target_location": transfer_loc,
+        "thumbnail_path": header["thumbnail_path"],
+        "source_dcc": header["source_dcc"],
+        "transfer_target_location": header["transfer_target_location"],
     }
     return job
 
 
+@traced("publish.out_handle_to_publish_job_dict")
+def out_handle_to_publish_job_dict(
+    handle: Any,
+    *,
+    include_unreal_metadata: bool = False,
+    merge_frame_into_metadata: bool = True,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Build a dict suitable for PublishJob.from_dict from a UFtrackOutHandle asset.
+
+    Args:
+        handle: Loaded UFtrackOutHandle UObject, or asset path string.
+        include_unreal_metadata: If True, push scenario index/description into the main component metadata.
+        merge_frame_into_metadata: If True and frame range is set, add start_frame/end_frame to metadata.
+        use_cache: Reuse the dict built for the same handle and flags while its EditGeneration is unchanged.
+            The caller always gets its own copy.
+    """
+    asset = _load_out_handle(handle)
+    generation = _get_prop(asset, "EditGeneration", "edit_generation") if use_cache else None
+    if not generation:
+        # Caching disabled, or a plugin binary without EditGeneration.
+        if use_cache:
+            job_cache_stats["uncacheable"] += 1
+        return _build_job_dict(asset, include_unreal_metadata, merge_frame_into_metadata)
+
+    key = (unreal.SystemLibrary.get_path_name(asset), bool(include_unreal_metadata), bool(merge_frame_into_metadata))
+    with _job_cache_lock:
+        hit = _job_cache.get(key)
+        if hit is not None and hit[0] == generation:
+            _job_cache.move_to_end(key)
+            job_cache_stats["hits"] += 1
+            return _copy_job(hit[1])
+        job_cache_stats["misses"] += 1
+
+    job = _build_job_dict(asset, include_unreal_metadata, merge_frame_into_metadata)
+    with _job_cache_lock:
+        _job_cache[key] = (generation, _copy_job(job))
+        _job_cache.move_to_end(key)
+        while len(_job_cache) > _JOB_CACHE_MAX_ENTRIES:
+            _job_cache.popitem(last=False)
+    return job
+
+
+def iter_out_handle_paths(content_path: str = "/Game", recursive: bool = True) -> Iterator[str]:
+    """Yield object paths of every UFtrackOutHandle under content_path (asset registry query; nothing is loaded)."""
+    if unreal is None:
+        raise RuntimeError("unreal module is not available (run inside Unreal Editor).")
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    ar_filter = unreal.ARFilter(
+        class_paths=[unreal.TopLevelAssetPath("/Script/MroyaFtrack", "FtrackOutHandle")],
+        package_paths=[content_path.rstrip("/") or "/Game"],
+        recursive_paths=recursive,
+        recursive_classes=True,
+    )
+    for data in registry.get_assets(ar_filter) or []:
+        yield "%s.%s" % (data.package_name, data.asset_name)
+
+
+def iter_publish_jobs(
+    content_path: str = "/Game",
+    *,
+    recursive: bool = True,
+    include_unreal_metadata: bool = False,
+    merge_frame_into_metadata: bool = True,
+    gc_every: int = 200,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (asset_path, job_dict) for each Out Handle under content_path, loading one handle at a time.
+
+    Handles that fail to load or convert are logged and skipped. Every gc_every handles, garbage is
+    collected so handles loaded only for the export do not accumulate (0 disables). The job cache is
+    bypassed: a handle reloaded after collection gets a new EditGeneration, so cached copies would
+    only hold memory.
+    """
+    for n, asset_path in enumerate(iter_out_handle_paths(content_path, recursive=recursive), 1):
+        try:
+            job = out_handle_to_publish_job_dict(
+                asset_path,
+                include_unreal_metadata=include_unreal_metadata,
+                merge_frame_into_metadata=merge_frame_into_metadata,
+                use_cache=False,
+            )
+        except Exception as e:
+            unreal.log_warning("Ftrack: Skipping Out Handle %s: %s" % (asset_path, e))
+            continue
+        yield asset_path, job
+        del job
+        if gc_every and n % gc_every == 0:
+            unreal.SystemLibrary.collect_garbage()
+
+
+def write_publish_jobs_jsonl(
+    spool_path: str,
+    content_path: str = "/Game",
+    *,
+    recursive: bool = True,
+    include_unreal_metadata: bool = False,
+    merge_frame_into_metadata: bool = True,
+    gc_every: int = 200,
+) -> int:
+    """Write one publish job per line (JSON Lines) for every Out Handle under content_path. Returns job count.
+
+    Each line is the out_handle_to_publish_job_dict shape plus "unreal_asset_path" (see iter_publish_jobs;
+    a handle that fails is logged and skipped). The file is written to spool_path + ".part" and renamed
+    when complete.
+    """
+    if unreal is None:
+        raise RuntimeError("unreal module is not available (run inside Unreal Editor).")
+    os.makedirs(os.path.dirname(os.path.abspath(spool_path)), exist_ok=True)
+    tmp = spool_path + ".part"
+    count = 0
+    with span("publish.write_publish_jobs_jsonl") as sp, open(tmp, "w", encoding="utf-8") as f:
+        for asset_path, job in iter_publish_jobs(
+            content_path,
+            recursive=recursive,
+            include_unreal_metadata=include_unreal_metadata,
+            merge_frame_into_metadata=merge_frame_into_metadata,
+            gc_every=gc_every,
+        ):
+            job["unreal_asset_path"] = asset_path
+            json.dump(job, f, ensure_ascii=False)
+            f.write("\n")
+            count += 1
+        sp.set(count=count)
+    os.replace(tmp, spool_path)
+    unreal.log("Ftrack: Wrote %s publish job(s) from %s to %s" % (count, content_path, spool_path))
+    return count
+
+
+def default_publish_spool_dir() -> str:
+    """Saved/MroyaFtrack/publish_spool under the current project."""
+    saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved, "MroyaFtrack", "publish_spool")
+
+
+def export_all_publish_jobs(content_path: str = "/Game") -> Optional[str]:
+    """Editor command: write every Out Handle under content_path to a timestamped .jsonl in the publish spool dir."""
+    if unreal is None:
+        return None
+    path = os.path.join(default_publish_spool_dir(), "jobs_%s.jsonl" % time.strftime("%Y%m%d_%H%M%S"))
+    try:
+        write_publish_jobs_jsonl(path, content_path)
+    except Exception as e:
+        unreal.log_error("Ftrack: export_all_publish_jobs failed: %s" % e)
+        return None
+    return path
+
+
 def create_ftrack_out_handle(
     package_path: str = "/Game/FtrackPublish",
     asset_name_base: str = "FtrackOutHandle",
@@ -262,17 +494,8 @@ def create_ftrack_out_handle(
             sub = raw.strip("/")
             base_path = "/Game/" + sub
         asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-        existing = unreal.EditorAssetLibrary.list_assets(base_path, recursive=False, include_folder=False)
-        used = set()
-        for p in existing or []:
-            a = unreal.load_asset(p)
-            if a:
-                used.add(unreal.SystemLibrary.get_object_name(a))
-        idx = 0
-        asset_name = asset_name_base
-        while asset_name in used:
-            idx += 1
-            asset_name = "%s_%d" % (asset_name_base, idx)
+        from ftrack_asset_names import allocate_asset_name
+        asset_name = allocate_asset_name(base_path, asset_name_base)
         handle_class = unreal.load_object(None, "/Script/MroyaFtrack.FtrackOutHandle")
         if not handle_class:
             unreal.log_error("Ftrack: FtrackOutHandle class not found. Is the plugin built?")
@@ -0,0 +1,259 @@
+# :coding: utf-8
+"""
+Copy resolved component files from remote/slow locations to a local folder before import.
+
+With multi-site ftrack locations a resolved path is often on a remote share; importing from there
+reads the file across the network (once per importer pass) or fails. The prefetch stage copies those
+files to a local directory first, with a bounded thread pool, and the import reads the local copy.
+
+Copies are chunked (progress per chunk), written to "<name>.part" and renamed when complete. A
+".part" left by an interrupted run is resumed if the source still has the same size and mtime
+(recorded next to it in "<name>.part.json"); otherwise it is restarted. The finished copy must have
+the source's size, and gets the source's mtime, so a later prefetch of an unchanged source is a
+stat-only cache hit.
+
+Which paths are remote (MROYA_FTRACK_PREFETCH):
+    "auto" (default)  UNC paths (\\\\server\\share, //server/share) and paths under
+                      MROYA_FTRACK_PREFETCH_ROOTS (os.pathsep-separated folders)
+    "all"             every path not already inside the prefetch directory
+    "0" / "off"       never prefetch
+Local directory: MROYA_FTRACK_PREFETCH_DIR, default Saved/MroyaFtrack/prefetch.
+
+With a ComponentCache (ftrack_component_cache) the copies are managed: hits are looked up and
+counted there, copies are locked against other editor instances sharing the folder, and the cache
+is trimmed to its byte budget after each batch.
+
+Everything here works without unreal, so it can be tested with two local folders standing in for
+a remote and a local site: prefetch_files([...], root=local_dir, remote_roots=[remote_dir]).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_WORKERS = 4
+
+_MODE_ENV = "MROYA_FTRACK_PREFETCH"
+_ROOTS_ENV = "MROYA_FTRACK_PREFETCH_ROOTS"
+_DIR_ENV = "MROYA_FTRACK_PREFETCH_DIR"
+
+ProgressFn = Callable[[int, int], None]
+
+
+def prefetch_dir() -> Optional[str]:
+    """Local copy directory (MROYA_FTRACK_PREFETCH_DIR, else Saved/MroyaFtrack/prefetch in the editor)."""
+    env = os.environ.get(_DIR_ENV, "").strip()
+    if env:
+        return env
+    if unreal is None:
+        return None
+    try:
+        saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    except Exception:
+        return None
+    return os.path.join(saved, "MroyaFtrack", "prefetch")
+
+
+def _norm(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path)).replace("\\", "/").rstrip("/")
+
+
+def _under(path: str, root: str) -> bool:
+    p, r = _norm(path), _norm(root)
+    return p == r or p.startswith(r + "/")
+
+
+def _env_roots() -> List[str]:
+    return [r for r in os.environ.get(_ROOTS_ENV, "").split(os.pathsep) if r.strip()]
+
+
+def needs_prefetch(path: str, root: Optional[str] = None, remote_roots: Optional[Iterable[str]] = None,
+                   mode: Optional[str] = None) -> bool:
+    """True if path should be copied locally before import (see module docstring for the rules)."""
+    mode = (mode or os.environ.get(_MODE_ENV, "auto")).strip().lower()
+    if mode in ("0", "off", "false", "no") or not path:
+        return False
+    if root and _under(path, root):
+        return False
+    if mode == "all":
+        return True
+    if path.startswith("\\\\") or path.startswith("//"):
+        return True
+    roots = list(remote_roots) if remote_roots is not None else _env_roots()
+    return any(_under(path, r) for r in roots)
+
+
+def local_path_for(source: str, root: str, key: Optional[str] = None) -> str:
+    """Local copy location: <root>/<key>/<file name>. key defaults to a hash of the source folder."""
+    if not key:
+        key = hashlib.sha1(_norm(os.path.dirname(source)).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(root, key, os.path.basename(source))
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def copy_file(source: str, dest: str, chunk_size: int = CHUNK_SIZE, progress: Optional[ProgressFn] = None) -> Dict[str, Any]:
+    """Copy source to dest in chunks, resuming dest + ".part" when possible. Not for concurrent use on one dest.
+
+    Returns {"source", "local", "status": "copied"|"cached", "bytes", "copied_bytes", "resumed"}.
+    progress(bytes_written_now, total_bytes) is called after each chunk. Raises OSError on failure,
+    including a size mismatch after the copy.
+    """
+    st = os.stat(source)
+    size = st.st_size
+    result = {"source": source, "local": dest, "status": "cached", "bytes": size, "copied_bytes": 0, "resumed": False}
+    try:
+        dst = os.stat(dest)
+        if dst.st_size == size and dst.st_mtime_ns == st.st_mtime_ns:
+            return result
+    except OSError:
+        pass
+
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+    part, meta_path = dest + ".part", dest + ".part.json"
+    stamp = {"source": source, "size": size, "mtime_ns": st.st_mtime_ns}
+    offset = 0
+    try:
+        part_size = os.path.getsize(part)
+    except OSError:
+        part_size = -1
+    if 0 <= part_size <= size and _read_json(meta_path) == stamp:
+        offset = part_size
+        result["resumed"] = offset > 0
+    else:
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(stamp, f)
+
+    with open(source, "rb") as src, open(part, "r+b" if offset else "wb") as out:
+        src.seek(offset)
+        out.seek(offset)
+        out.truncate()
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            out.write(chunk)
+            result["copied_bytes"] += len(chunk)
+            if progress:
+                progress(len(chunk), size)
+    copied = os.path.getsize(part)
+    if copied != size:
+        raise OSError("Size mismatch after copy of %s: %d of %d bytes" % (source, copied, size))
+    os.utime(part, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(part, dest)
+    try:
+        os.remove(meta_path)
+    except OSError:
+        pass
+    result["status"] = "copied"
+    return result
+
+
+def prefetch_files(
+    items: Iterable[Dict[str, Any]],
+    root: Optional[str] = None,
+    *,
+    remote_roots: Optional[Iterable[str]] = None,
+    max_workers: int = DEFAULT_WORKERS,
+    chunk_size: int = CHUNK_SIZE,
+    progress: Optional[ProgressFn] = None,
+    mode: Optional[str] = None,
+    cache=None,
+) -> List[Dict[str, Any]]:
+    """Copy the remote ones of items ({"path", optional "key"}) into root with a bounded pool.
+
+    Returns one result per item, in order: source, local (the path to import from: the copy, or the
+    source itself when no prefetch was needed), status ("local", "cached", "copied" or "error"),
+    bytes, copied_bytes, resumed, seconds, error. progress(done_bytes, total_bytes) covers all copies
+    and may be called from worker threads. Copies of the same local file are done once.
+    cache: optional ComponentCache; its root is used when root is not given.
+    """
+    root = root or (cache.root if cache is not None else prefetch_dir())
+    remote_roots = list(remote_roots) if remote_roots is not None else None
+    results: List[Dict[str, Any]] = []
+    jobs: Dict[str, List[Dict[str, Any]]] = {}
+    keys: Dict[str, Optional[str]] = {}
+    total = 0
+    for item in items:
+        path = item.get("path")
+        r = {"source": path, "local": path, "status": "local", "bytes": 0, "copied_bytes": 0,
+             "resumed": False, "seconds": 0.0, "error": None}
+        results.append(r)
+        if not root or not needs_prefetch(path, root, remote_roots, mode):
+            continue
+        dest = local_path_for(path, root, item.get("key"))
+        keys[dest] = item.get("key")
+        if dest not in jobs:
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        jobs.setdefault(dest, []).append(r)
+    if not jobs:
+        return results
+
+    done = [0]
+    lock = threading.Lock()
+
+    def on_chunk(n: int, _size: int) -> None:
+        if progress is None:
+            return
+        with lock:
+            done[0] += n
+            current = done[0]
+        progress(current, total)
+
+    def run(dest: str, source: str, key: Optional[str]) -> Dict[str, Any]:
+        t0 = time.perf_counter()
+        if cache is None:
+            out = copy_file(source, dest, chunk_size=chunk_size, progress=on_chunk)
+        elif cache.lookup(source, key) == dest:
+            size = os.path.getsize(dest)
+            out = {"source": source, "local": dest, "status": "cached", "bytes": size, "copied_bytes": 0, "resumed": False}
+        else:
+            with cache.copy_lock(dest) as lock:
+                def on_cache_chunk(n: int, size: int) -> None:
+                    lock.touch()
+                    on_chunk(n, size)
+
+                out = copy_file(source, dest, chunk_size=chunk_size, progress=on_cache_chunk)
+            cache.add(dest, source, out["bytes"], out["copied_bytes"], found_complete=out["status"] == "cached")
+        on_chunk(out["bytes"] - out["copied_bytes"], out["bytes"])  # cached and resumed bytes count as done
+        out["seconds"] = time.perf_counter() - t0
+        return out
+
+    workers = max(1, min(max_workers, len(jobs)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="MroyaPrefetch") as pool:
+        futures = {pool.submit(run, dest, rs[0]["source"], keys[dest]): dest for dest, rs in jobs.items()}
+        for future in concurrent.futures.as_completed(futures):
+            dest = futures[future]
+            try:
+                out = future.result()
+            except Exception as e:
+                for r in jobs[dest]:
+                    r.update(status="error", error="Prefetch failed: %s" % e)
+                continue
+            for r in jobs[dest]:
+                r.update(local=dest, status=out["status"], bytes=out["bytes"], copied_bytes=out["copied_bytes"],
+                         resumed=out["resumed"], seconds=out["seconds"])
+    if cache is not None:
+        cache.evict(keep=jobs)
+    return results
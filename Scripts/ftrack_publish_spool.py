@@ -0,0 +1,309 @@
+# :coding: utf-8
+"""
+Publish spool: serialized publish jobs handed from the editor to out-of-process workers.
+
+Layout under the spool root (default Saved/MroyaFtrack/publish_spool, or MROYA_FTRACK_PUBLISH_SPOOL):
+
+    pending/<job_id>.json   submitted, waiting for a worker
+    running/<job_id>.json   claimed by a worker (claimed with an atomic rename out of pending/)
+    done/<job_id>.json      finished; envelope gains "result"
+    failed/<job_id>.json    finished with an error; envelope gains "error"
+    status/<job_id>.json    latest state/progress, rewritten by the worker; polled by the editor.
+                            Each status records the host that wrote it ("host"), so workers
+                            sharing a spool across machines only recover their own jobs.
+
+A job file is an envelope: {"job_id", "submitted_at", "unreal_asset_path", "job": <PublishJob dict>}.
+Job IDs start with a UTC timestamp so pending jobs are claimed in submission order. All files are
+written to a temporary name and renamed, so readers never see partial JSON.
+
+This module does not need unreal (only spool_root() and submit_out_handles() use it when available),
+so the standalone worker (ftrack_publish_worker.py) imports it as well.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+STATUS = "status"
+_QUEUE_DIRS = (PENDING, RUNNING, DONE, FAILED)
+
+_ENV = "MROYA_FTRACK_PUBLISH_SPOOL"
+HOST = socket.gethostname()
+
+
+def spool_root(root: Optional[str] = None) -> str:
+    """Resolve the spool root: explicit path, MROYA_FTRACK_PUBLISH_SPOOL, then the project's Saved dir."""
+    if root:
+        return os.path.abspath(root)
+    env = os.environ.get(_ENV, "").strip()
+    if env:
+        return os.path.abspath(env)
+    if unreal is None:
+        raise RuntimeError("No spool root: pass one or set %s." % _ENV)
+    saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved, "MroyaFtrack", "publish_spool")
+
+
+def ensure_layout(root: str) -> str:
+    for name in _QUEUE_DIRS + (STATUS,):
+        os.makedirs(os.path.join(root, name), exist_ok=True)
+    return root
+
+
+def _job_file(root: str, state: str, job_id: str) -> str:
+    return os.path.join(root, state, job_id + ".json")
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    tmp = "%s.%s.tmp" % (path, uuid.uuid4().hex[:8])
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def new_job_id() -> str:
+    now = time.time()
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now))
+    return "%s.%06d_%s" % (stamp, int((now % 1) * 1e6), uuid.uuid4().hex[:8])
+
+
+def submit_job(
+    job: Dict[str, Any],
+    root: Optional[str] = None,
+    *,
+    unreal_asset_path: Optional[str] = None,
+    preflight: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Queue one PublishJob dict. Returns its job_id. preflight (a verify_job() summary) is stored as-is."""
+    root = ensure_layout(spool_root(root))
+    job_id = new_job_id()
+    envelope = {
+        "job_id": job_id,
+        "submitted_at": time.time(),
+        "unreal_asset_path": unreal_asset_path,
+        "job": job,
+    }
+    if preflight is not None:
+        envelope["preflight"] = preflight
+    write_status(root, job_id, PENDING)
+    _write_json_atomic(_job_file(root, PENDING, job_id), envelope)
+    return job_id
+
+
+def _log_warning(msg: str) -> None:
+    if unreal is not None:
+        unreal.log_warning(msg)
+
+
+def submit_out_handles(
+    asset_paths: Iterable[str],
+    root: Optional[str] = None,
+    *,
+    verify_sequences: bool = True,
+    allow_incomplete: bool = False,
+    **job_kwargs: Any,
+) -> List[str]:
+    """Build a job for each Out Handle (editor only) and queue it. Returns the job IDs in order.
+
+    job_kwargs are passed to out_handle_to_publish_job_dict. Handles that fail to build are logged and skipped.
+    With verify_sequences, frame sequences are checked first (ftrack_sequence_check); jobs with missing or
+    zero-byte frames are logged and not queued unless allow_incomplete is set.
+    """
+    from ftrack_out_handle import out_handle_to_publish_job_dict
+    from ftrack_sequence_check import format_report, verify_job
+
+    ids: List[str] = []
+    for path in asset_paths:
+        try:
+            job = out_handle_to_publish_job_dict(path, **job_kwargs)
+        except Exception as e:
+            _log_warning("Ftrack: Not queued for publish %s: %s" % (path, e))
+            continue
+        preflight = None
+        if verify_sequences:
+            check = verify_job(job)
+            preflight = {"ok": check["ok"], "total_bytes": check["total_bytes"], "sequences": len(check["sequences"])}
+            if not check["ok"]:
+                for report in check["sequences"]:
+                    if not report["ok"]:
+                        _log_warning("Ftrack: %s: %s" % (path, format_report(report)))
+                if not allow_incomplete:
+                    _log_warning("Ftrack: Not queued for publish %s: incomplete frame sequence(s)." % path)
+                    continue
+        ids.append(submit_job(job, root, unreal_asset_path=path, preflight=preflight))
+    if unreal is not None and ids:
+        unreal.log("Ftrack: Queued %s publish job(s) in %s" % (len(ids), spool_root(root)))
+    return ids
+
+
+def submit_jsonl(jsonl_path: str, root: Optional[str] = None) -> List[str]:
+    """Queue every line of a write_publish_jobs_jsonl() export as its own job."""
+    ids: List[str] = []
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            job = json.loads(line)
+            asset_path = job.pop("unreal_asset_path", None)
+            ids.append(submit_job(job, root, unreal_asset_path=asset_path))
+    return ids
+
+
+def claim_next(root: str) -> Optional[Dict[str, Any]]:
+    """Move the oldest pending job to running/ and return its envelope, or None if nothing is pending.
+
+    The rename is the claim: with several workers on one spool, only one rename of a file succeeds.
+    """
+    pending_dir = os.path.join(root, PENDING)
+    try:
+        names = sorted(n for n in os.listdir(pending_dir) if n.endswith(".json"))
+    except OSError:
+        return None
+    for name in names:
+        src = os.path.join(pending_dir, name)
+        dst = os.path.join(root, RUNNING, name)
+        try:
+            os.rename(src, dst)
+        except OSError:
+            continue  # claimed by another worker
+        envelope = _read_json(dst)
+        if envelope is None:
+            os.replace(dst, os.path.join(root, FAILED, name))
+            write_status(root, name[:-5], FAILED, message="Unreadable job file.")
+            continue
+        return envelope
+    return None
+
+
+def finish_job(root: str, job_id: str, *, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+    """Move a running job to done/ or failed/ (error set) and write its final status."""
+    src = _job_file(root, RUNNING, job_id)
+    state = FAILED if error else DONE
+    envelope = _read_json(src) or {"job_id": job_id}
+    envelope["finished_at"] = time.time()
+    if error:
+        envelope["error"] = error
+    else:
+        envelope["result"] = result or {}
+    _write_json_atomic(_job_file(root, state, job_id), envelope)
+    try:
+        os.remove(src)
+    except OSError:
+        pass
+    write_status(root, job_id, state, progress=1.0 if not error else None, message=error or "", result=result)
+
+
+def requeue_job(root: str, job_id: str) -> bool:
+    """Return a running job to pending/ (e.g. its worker died). Returns False if it is not running."""
+    try:
+        os.rename(_job_file(root, RUNNING, job_id), _job_file(root, PENDING, job_id))
+    except OSError:
+        return False
+    write_status(root, job_id, PENDING, message="Requeued.")
+    return True
+
+
+def write_status(root: str, job_id: str, state: str, progress: Optional[float] = None, message: str = "", **extra: Any) -> None:
+    status = {"job_id": job_id, "state": state, "progress": progress, "message": message, "updated_at": time.time(),
+              "host": HOST}
+    status.update(extra)
+    _write_json_atomic(os.path.join(root, STATUS, job_id + ".json"), status)
+
+
+def read_status(job_id: str, root: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    return _read_json(os.path.join(spool_root(root), STATUS, job_id + ".json"))
+
+
+def poll_status(job_ids: Optional[Iterable[str]] = None, root: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Latest status for the given jobs (or every job with a status file). Cheap enough to call on a timer."""
+    root = spool_root(root)
+    if job_ids is None:
+        try:
+            job_ids = [n[:-5] for n in os.listdir(os.path.join(root, STATUS)) if n.endswith(".json")]
+        except OSError:
+            return {}
+    out: Dict[str, Dict[str, Any]] = {}
+    for job_id in job_ids:
+        status = _read_json(os.path.join(root, STATUS, job_id + ".json"))
+        if status is not None:
+            out[job_id] = status
+    return out
+
+
+class _StatusWatcher:
+    def __init__(self, root: str, job_ids: List[str], interval: float, on_update):
+        self.root = root
+        self.job_ids = list(job_ids)
+        self.interval = interval
+        self.on_update = on_update
+        self.elapsed = 0.0
+        self.seen: Dict[str, Any] = {}
+        self.handle = None
+
+    def _on_tick(self, delta_seconds: float) -> None:
+        self.elapsed += delta_seconds
+        if self.elapsed < self.interval:
+            return
+        self.elapsed = 0.0
+        for job_id, status in poll_status(self.job_ids, self.root).items():
+            key = (status.get("state"), status.get("progress"), status.get("message"))
+            if self.seen.get(job_id) == key:
+                continue
+            self.seen[job_id] = key
+            if self.on_update is not None:
+                self.on_update(job_id, status)
+            elif status.get("state") == DONE:
+                unreal.log("Ftrack: Publish %s done." % job_id)
+            elif status.get("state") == FAILED:
+                unreal.log_error("Ftrack: Publish %s failed: %s" % (job_id, status.get("message")))
+        if all(s[0] in (DONE, FAILED) for s in self.seen.values()) and len(self.seen) == len(self.job_ids):
+            unreal.unregister_slate_post_tick_callback(self.handle)
+            self.handle = None
+
+
+def watch_jobs(job_ids: Iterable[str], root: Optional[str] = None, *, interval: float = 2.0, on_update=None) -> None:
+    """Editor: poll status files on Slate tick every `interval` seconds until all jobs finish.
+
+    on_update(job_id, status) is called on the game thread when a job's state/progress changes; by default
+    finished jobs are logged to the Output Log.
+    """
+    if unreal is None:
+        return
+    watcher = _StatusWatcher(spool_root(root), list(job_ids), interval, on_update)
+    if watcher.job_ids:
+        watcher.handle = unreal.register_slate_post_tick_callback(watcher._on_tick)
+
+
+def queue_counts(root: Optional[str] = None) -> Dict[str, int]:
+    """Number of job files per queue directory."""
+    root = spool_root(root)
+    counts: Dict[str, int] = {}
+    for name in _QUEUE_DIRS:
+        try:
+            counts[name] = sum(1 for n in os.listdir(os.path.join(root, name)) if n.endswith(".json"))
+        except OSError:
+            counts[name] = 0
+    return counts
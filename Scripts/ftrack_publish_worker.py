@@ -0,0 +1,308 @@
+# :coding: utf-8
+"""
+Standalone publish worker: drains a publish spool (see ftrack_publish_spool) with a process pool.
+
+Runs outside Unreal with any Python that can import ftrack_inout (MROYA_FTRACK_CONNECT is used the same
+way as in the editor). Each job runs in its own pool process, so N uploads/encodes proceed in parallel
+while the editor only polls status files.
+
+    python Scripts/ftrack_publish_worker.py --spool <Project>/Saved/MroyaFtrack/publish_spool --workers 4
+    python Scripts/ftrack_publish_worker.py --spool <dir> --publisher stub --once
+
+--publisher is "ftrack" (ftrack_inout Publisher, default), "stub" (local stand-in that validates the job
+and simulates work, for testing), or "module:function" taking (job_dict, progress) and returning a
+JSON-serializable dict. progress(fraction, message) updates the job's status file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import importlib
+import os
+import signal
+import sys
+import time
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+if _THIS_DIR not in sys.path:
+    sys.path.insert(0, _THIS_DIR)
+
+import ftrack_publish_spool as spool  # noqa: E402
+from ftrack_content_hash import HashCache, annotate_job_hashes  # noqa: E402
+from ftrack_sequence_check import format_report, verify_job  # noqa: E402
+
+ProgressFn = Callable[[Optional[float], str], None]
+
+# Status files are rewritten at most this often per job (the final state is always written).
+_STATUS_MIN_INTERVAL = 0.25
+
+# A running/ job without an owner pid in its status is requeued only after this long (claim to first status
+# write takes milliseconds; a younger file may belong to a worker that is starting it right now).
+_UNOWNED_GRACE_SECONDS = 60.0
+
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_ERROR_ACCESS_DENIED = 5
+_STILL_ACTIVE = 259
+
+
+def _bootstrap_mroya() -> bool:
+    """Add mroya ftrack_plugins to sys.path. Returns True if MROYA_FTRACK_CONNECT is set."""
+    mroya_root = os.environ.get("MROYA_FTRACK_CONNECT", "").strip()
+    if not mroya_root or not os.path.isdir(mroya_root):
+        return False
+    plugins_root = os.path.join(os.path.normpath(mroya_root), "ftrack_plugins")
+    if os.path.isdir(plugins_root) and plugins_root not in sys.path:
+        sys.path.insert(0, plugins_root)
+    inout_deps = os.path.join(plugins_root, "ftrack_inout", "dependencies")
+    if os.path.isdir(inout_deps) and inout_deps not in sys.path:
+        sys.path.insert(0, inout_deps)
+    return True
+
+
+def stub_publish(job: Dict[str, Any], progress: ProgressFn) -> Dict[str, Any]:
+    """Local stand-in publisher: checks the job shape and sleeps per component instead of uploading.
+
+    MROYA_FTRACK_STUB_PUBLISH_SECONDS sets the simulated time per component (default 0.2). A component
+    whose file_path does not exist is reported in "missing", not treated as a failure.
+    """
+    if not (job.get("task_id") or "").strip():
+        raise ValueError("Job has no task_id.")
+    components = [c for c in job.get("components") or [] if c.get("export_enabled", True)]
+    delay = float(os.environ.get("MROYA_FTRACK_STUB_PUBLISH_SECONDS", "0.2"))
+    missing = []
+    for i, comp in enumerate(components):
+        progress(i / max(len(components), 1), "Publishing %s" % comp.get("name"))
+        path = comp.get("file_path")
+        if path and not os.path.exists(path) and not comp.get("sequence_pattern"):
+            missing.append(path)
+        time.sleep(delay)
+    return {"publisher": "stub", "components": len(components), "missing": missing, "pid": os.getpid()}
+
+
+_session = None
+
+
+def ftrack_publish(job: Dict[str, Any], progress: ProgressFn) -> Dict[str, Any]:
+    """Publish with ftrack_inout (one ftrack_api.Session per worker process, reused across jobs)."""
+    global _session
+    if not _bootstrap_mroya():
+        raise RuntimeError("MROYA_FTRACK_CONNECT is not set or not a directory.")
+    import ftrack_api
+    from ftrack_inout.publisher.core import JobBuilder, Publisher
+
+    if _session is None:
+        progress(None, "Connecting to ftrack")
+        _session = ftrack_api.Session(auto_connect_event_hub=False)
+    progress(0.05, "Publishing")
+    result = Publisher(_session).execute(JobBuilder.from_dict(job))
+    out: Dict[str, Any] = {"publisher": "ftrack", "pid": os.getpid()}
+    if isinstance(result, dict):
+        out.update({k: v if isinstance(v, (str, int, float, bool, type(None))) else str(v) for k, v in result.items()})
+    elif result is not None:
+        out["result"] = str(result)
+    return out
+
+
+def _load_publisher(spec: str) -> Callable[[Dict[str, Any], ProgressFn], Dict[str, Any]]:
+    if spec == "stub":
+        return stub_publish
+    if spec == "ftrack":
+        return ftrack_publish
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError("Publisher must be 'ftrack', 'stub' or 'module:function', got %r." % spec)
+    return getattr(importlib.import_module(module_name), attr)
+
+
+_hash_cache: Optional[HashCache] = None
+
+
+def run_job(
+    root: str,
+    envelope: Dict[str, Any],
+    publisher_spec: str,
+    check_sequences: bool = True,
+    content_hash: bool = True,
+) -> Dict[str, Any]:
+    """Pool entry point: publish one claimed job, writing progress to its status file."""
+    global _hash_cache
+    job_id = envelope["job_id"]
+    last = [0.0]
+
+    def progress(fraction: Optional[float], message: str = "") -> None:
+        now = time.monotonic()
+        if now - last[0] < _STATUS_MIN_INTERVAL:
+            return
+        last[0] = now
+        spool.write_status(root, job_id, spool.RUNNING, progress=fraction, message=message, worker_pid=os.getpid())
+
+    spool.write_status(root, job_id, spool.RUNNING, progress=0.0,
+                       message="Checking frames" if check_sequences else "Started", worker_pid=os.getpid())
+    if check_sequences:
+        # Frames may have changed since the editor queued the job; fail before any upload starts.
+        check = verify_job(envelope["job"])
+        bad = [format_report(r) for r in check["sequences"] if not r["ok"]]
+        if bad:
+            raise RuntimeError("Incomplete frame sequence(s): " + " | ".join(bad))
+    if content_hash:
+        # metadata content_hash/content_size let the publisher skip uploading unchanged files.
+        if _hash_cache is None:
+            _hash_cache = HashCache(os.path.join(root, "content_hash_cache.json"))
+        spool.write_status(root, job_id, spool.RUNNING, progress=0.0, message="Hashing files", worker_pid=os.getpid())
+        annotate_job_hashes(envelope["job"], cache=_hash_cache)
+    publisher = _load_publisher(publisher_spec)
+    return publisher(envelope["job"], progress) or {}
+
+
+def _recover_orphans(root: str) -> int:
+    """Requeue running/ jobs whose worker process no longer exists (previous worker crashed or was killed).
+
+    Only jobs owned by a process on this host are checked: a pid from another machine says nothing here,
+    and requeueing a job that is still running there would publish it twice. A job with no owner yet
+    (claimed, but the worker died before writing its status) is requeued once its file is
+    _UNOWNED_GRACE_SECONDS old.
+    """
+    n = 0
+    running_dir = os.path.join(root, spool.RUNNING)
+    for name in os.listdir(running_dir):
+        if not name.endswith(".json"):
+            continue
+        job_id = name[:-5]
+        status = spool.read_status(job_id, root) or {}
+        pid = status.get("worker_pid") or status.get("supervisor_pid")
+        if pid:
+            if status.get("host") != spool.HOST or _pid_alive(int(pid)):
+                continue
+        else:
+            try:
+                if time.time() - os.path.getmtime(os.path.join(running_dir, name)) < _UNOWNED_GRACE_SECONDS:
+                    continue
+            except OSError:
+                continue
+        if spool.requeue_job(root, job_id):
+            n += 1
+    return n
+
+
+def _pid_alive(pid: int) -> bool:
+    """True if a process with this pid exists on this host (or it cannot be told)."""
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        return _pid_alive_windows(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists but not ours, or platform cannot tell
+    return True
+
+
+def _pid_alive_windows(pid: int) -> bool:
+    # os.kill(pid, 0) sends CTRL_C_EVENT on Windows; ask the process handle for its exit code instead.
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.GetExitCodeProcess.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ctypes.get_last_error() == _ERROR_ACCESS_DENIED  # exists but not ours
+    try:
+        code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+            return True
+        return code.value == _STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def serve(
+    root: str,
+    workers: int,
+    publisher_spec: str,
+    *,
+    once: bool = False,
+    poll_interval: float = 1.0,
+    check_sequences: bool = True,
+    content_hash: bool = True,
+) -> int:
+    """Claim jobs while fewer than `workers` are in flight. Returns the number of failed jobs."""
+    root = spool.ensure_layout(spool.spool_root(root))
+    _load_publisher(publisher_spec)  # fail fast on a bad spec
+    recovered = _recover_orphans(root)
+    print("[worker] spool=%s workers=%d publisher=%s recovered=%d" % (root, workers, publisher_spec, recovered), flush=True)
+
+    stopping = []
+    signal.signal(signal.SIGINT, lambda *a: stopping.append(True))
+    failed = 0
+    in_flight: Dict[concurrent.futures.Future, str] = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while not stopping and len(in_flight) < workers:
+                envelope = spool.claim_next(root)
+                if envelope is None:
+                    break
+                job_id = envelope["job_id"]
+                spool.write_status(root, job_id, spool.RUNNING, progress=0.0, message="Queued in worker",
+                                   supervisor_pid=os.getpid())
+                in_flight[pool.submit(run_job, root, envelope, publisher_spec, check_sequences, content_hash)] = job_id
+                print("[worker] started %s" % job_id, flush=True)
+
+            if not in_flight:
+                if once or stopping:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            done, _ = concurrent.futures.wait(in_flight, timeout=poll_interval,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                job_id = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed += 1
+                    detail = "".join(traceback.format_exception_only(type(e), e)).strip()
+                    spool.finish_job(root, job_id, error=detail)
+                    print("[worker] failed %s: %s" % (job_id, detail), flush=True)
+                else:
+                    spool.finish_job(root, job_id, result=result)
+                    print("[worker] done %s" % job_id, flush=True)
+    return failed
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Drain a Mroya ftrack publish spool with a process pool.")
+    parser.add_argument("--spool", help="Spool root (default: MROYA_FTRACK_PUBLISH_SPOOL).")
+    parser.add_argument("--workers", type=int, default=max(1, min(4, os.cpu_count() or 1)),
+                        help="Parallel publishes (default: min(4, CPU count)).")
+    parser.add_argument("--publisher", default="ftrack", help="ftrack | stub | module:function (default: ftrack).")
+    parser.add_argument("--once", action="store_true", help="Exit when the pending queue is empty.")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between spool scans.")
+    parser.add_argument("--no-sequence-check", action="store_true",
+                        help="Skip the missing/zero-byte frame check before each publish.")
+    parser.add_argument("--no-content-hash", action="store_true",
+                        help="Do not add content_hash/content_size to component metadata before publishing.")
+    parser.add_argument("--submit-jsonl", metavar="PATH",
+                        help="Queue every job of a write_publish_jobs_jsonl() export before serving.")
+    args = parser.parse_args(argv)
+
+    root = spool.spool_root(args.spool)
+    if args.submit_jsonl:
+        ids = spool.submit_jsonl(args.submit_jsonl, root)
+        print("[worker] queued %d job(s) from %s" % (len(ids), args.submit_jsonl), flush=True)
+    failed = serve(root, max(1, args.workers), args.publisher, once=args.once, poll_interval=args.poll_interval,
+                   check_sequences=not args.no_sequence_check, content_hash=not args.no_content_hash)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# :coding: utf-8
+"""
+Component-to-path resolution cache for Ftrack Asset Handles.
+
+Entries are keyed by (component_id, version_id, location) and kept in memory with LRU eviction.
+The cache is persisted as JSON under the project's Saved/MroyaFtrack folder so re-imports and editor
+restarts do not need the ftrack server when the answer is already known.
+
+Entries resolved for a pinned version (handle has AssetVersionId) never expire; other entries expire
+after ttl_seconds. Use invalidate() to drop entries explicitly (e.g. after a component was re-published
+to a different location). Callers must still check that the returned path exists.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_CACHE_FILE_NAME = "resolve_cache.json"
+_FORMAT_VERSION = 1
+
+
+def current_location_key() -> str:
+    """Location part of the cache key: MROYA_FTRACK_LOCATION if set (multi-site setups), else "default"."""
+    return os.environ.get("MROYA_FTRACK_LOCATION", "").strip() or "default"
+
+
+def _default_cache_path() -> Optional[str]:
+    if unreal is None:
+        return None
+    try:
+        saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    except Exception:
+        return None
+    return os.path.join(saved, "MroyaFtrack", _CACHE_FILE_NAME)
+
+
+class ResolveCache:
+    """Thread-safe LRU map of (component_id, version_id, location) -> resolved file path."""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 4096, ttl_seconds: float = 3600.0):
+        self._path = path
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str, str], Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._path or not os.path.isfile(self._path):
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            return
+        for e in data.get("entries") or []:
+            try:
+                key = (e["component_id"], e["version_id"], e["location"])
+                self._entries[key] = {"path": e["path"], "pinned": bool(e.get("pinned")), "time": float(e.get("time", 0))}
+            except (KeyError, TypeError, ValueError):
+                continue
+        self._evict()
+
+    def _expired(self, entry: Dict, now: float) -> bool:
+        return not entry["pinned"] and now - entry["time"] > self._ttl
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get(self, component_id: str, version_id: Optional[str] = None, location: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """Return (version_id, path) or None. version_id=None matches any version of the component."""
+        location = location or current_location_key()
+        now = time.time()
+        with self._lock:
+            self._ensure_loaded()
+            if version_id:
+                keys = [(component_id, version_id, location)]
+            else:
+                keys = [k for k in self._entries if k[0] == component_id and k[2] == location]
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if self._expired(entry, now):
+                    del self._entries[key]
+                    self._dirty = True
+                    continue
+                self._entries.move_to_end(key)
+                return key[1], entry["path"]
+        return None
+
+    def put(self, component_id: str, version_id: str, path: str, *, pinned: bool = False, location: Optional[str] = None) -> None:
+        if not component_id or not version_id or not path:
+            return
+        key = (component_id, version_id, location or current_location_key())
+        with self._lock:
+            self._ensure_loaded()
+            old = self._entries.pop(key, None)
+            self._entries[key] = {
+                "path": path,
+                "pinned": bool(pinned) or bool(old and old["pinned"]),
+                "time": time.time(),
+            }
+            self._dirty = True
+            self._evict()
+
+    def invalidate(self, component_id: Optional[str] = None, version_id: Optional[str] = None, location: Optional[str] = None) -> int:
+        """Drop entries matching all given fields (no fields = everything). Returns number of entries removed."""
+        with self._lock:
+            self._ensure_loaded()
+            doomed = [
+                k for k in self._entries
+                if (component_id is None or k[0] == component_id)
+                and (version_id is None or k[1] == version_id)
+                and (location is None or k[2] == location)
+            ]
+            for k in doomed:
+                del self._entries[k]
+            if doomed:
+                self._dirty = True
+            return len(doomed)
+
+    def save(self) -> bool:
+        """Write the cache to disk if it changed. Returns True if a file was written."""
+        if not self._path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            entries = [
+                {"component_id": k[0], "version_id": k[1], "location": k[2],
+                 "path": e["path"], "pinned": e["pinned"], "time": e["time"]}
+                for k, e in self._entries.items()
+            ]
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            tmp = self._path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": _FORMAT_VERSION, "entries": entries}, f)
+            os.replace(tmp, self._path)
+            return True
+        except OSError as e:
+            with self._lock:
+                self._dirty = True  # not written; try again on the next save()
+            if unreal:
+                unreal.log_warning("Ftrack: Could not save resolve cache: %s" % e)
+            return False
+
+
+_cache: Optional[ResolveCache] = None
+
+
+def get_resolve_cache() -> ResolveCache:
+    """Shared cache persisted under the project's Saved folder (memory-only outside Unreal)."""
+    global _cache
+    if _cache is None:
+        _cache = ResolveCache(_default_cache_path())
+    return _cache
+
+
+def invalidate(component_id: Optional[str] = None, version_id: Optional[str] = None, location: Optional[str] = None) -> int:
+    """Invalidation hook: drop matching entries from the shared cache and persist the change."""
+    cache = get_resolve_cache()
+    n = cache.invalidate(component_id=component_id, version_id=version_id, location=location)
+    cache.save()
+    return n
@@ -0,0 +1,220 @@
+# :coding: utf-8
+"""
+Pre-flight check of image sequences in publish jobs: are all frames on disk, and non-empty?
+
+Frame patterns: printf (%04d, %d), hashes (####, one # per digit), @ (same as #) and Houdini-style
+$F4 / $F. Each sequence folder is listed once with os.scandir and frame numbers are parsed from the
+names, instead of one stat per expected frame. Sizes come from the listing on Windows; elsewhere the
+matched files are stat'ed from a thread pool (network storage is latency-bound). Components are
+checked in parallel.
+
+Works inside and outside Unreal (no unreal import), on job dicts from out_handle_to_publish_job_dict.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_TOKEN_RE = re.compile(r"%(0?)(\d*)d|#+|@+|\$F(\d*)")
+
+# Stat pool size per sequence on non-Windows platforms.
+_STAT_WORKERS = 16
+
+
+def parse_pattern(pattern: str) -> Optional[Tuple[str, str, str, int]]:
+    """Split a frame pattern into (directory, prefix, suffix, padding), or None if it has no frame token.
+
+    The last token in the file name is the frame number. padding 0 means unpadded.
+    """
+    directory, name = os.path.split(pattern)
+    matches = list(_TOKEN_RE.finditer(name))
+    if not matches:
+        return None
+    m = matches[-1]
+    token = m.group(0)
+    if token.startswith("%"):
+        padding = int(m.group(2) or 0)
+    elif token.startswith("$F"):
+        padding = int(m.group(3) or 0)
+    else:
+        padding = len(token)
+    return directory, name[:m.start()], name[m.end():], padding
+
+
+def frame_file_name(prefix: str, suffix: str, padding: int, frame: int) -> str:
+    digits = "%0*d" % (padding, frame) if padding else str(frame)
+    return prefix + digits + suffix
+
+
+def _frame_from_name(name: str, prefix: str, suffix: str, padding: int) -> Optional[int]:
+    if len(name) <= len(prefix) + len(suffix) or not name.startswith(prefix) or not name.endswith(suffix):
+        return None
+    digits = name[len(prefix):len(name) - len(suffix)]
+    body = digits[1:] if digits.startswith("-") else digits
+    if not body.isdigit():
+        return None
+    # Padded: exactly `padding` digits, or wider without leading zeros (frame 10000 with ####).
+    # Unpadded: no leading zeros.
+    if len(body) != padding and len(body) > 1 and body.startswith("0"):
+        return None
+    if padding and len(body) < padding:
+        return None
+    return int(digits)
+
+
+def _frames_to_ranges(frames: Sequence[int]) -> List[Tuple[int, int]]:
+    ranges: List[Tuple[int, int]] = []
+    for f in frames:
+        if ranges and f == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], f)
+        else:
+            ranges.append((f, f))
+    return ranges
+
+
+def _sizes(paths: List[str]) -> List[int]:
+    def size(p: str) -> int:
+        try:
+            return os.stat(p).st_size
+        except OSError:
+            return -1
+
+    if len(paths) < 64:
+        return [size(p) for p in paths]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_STAT_WORKERS, thread_name_prefix="MroyaSeqStat") as pool:
+        return list(pool.map(size, paths, chunksize=64))
+
+
+def verify_sequence(pattern: str, frame_range: Sequence[int]) -> Dict[str, Any]:
+    """Check frames frame_range[0]..frame_range[1] (inclusive) of pattern.
+
+    Returns {"pattern", "directory", "expected", "found", "missing", "missing_ranges", "zero_byte",
+    "total_bytes", "ok", "error"}. "missing" and "zero_byte" are sorted frame numbers.
+    """
+    report: Dict[str, Any] = {
+        "pattern": pattern,
+        "directory": None,
+        "expected": 0,
+        "found": 0,
+        "missing": [],
+        "missing_ranges": [],
+        "zero_byte": [],
+        "total_bytes": 0,
+        "ok": False,
+        "error": None,
+    }
+    parsed = parse_pattern(pattern)
+    if parsed is None:
+        report["error"] = "No frame token in pattern."
+        return report
+    directory, prefix, suffix, padding = parsed
+    report["directory"] = directory
+    start, end = int(frame_range[0]), int(frame_range[1])
+    if end < start:
+        report["error"] = "Frame range end is before start."
+        return report
+    report["expected"] = end - start + 1
+
+    # frame -> size (None until known)
+    present: Dict[int, Optional[int]] = {}
+    paths: List[str] = []
+    windows = os.name == "nt"
+    try:
+        with os.scandir(directory or ".") as it:
+            for entry in it:
+                frame = _frame_from_name(entry.name, prefix, suffix, padding)
+                if frame is None or frame < start or frame > end or frame in present:
+                    continue
+                if windows:
+                    try:
+                        present[frame] = entry.stat().st_size  # from the directory listing, no extra I/O
+                    except OSError:
+                        continue
+                else:
+                    present[frame] = None
+                    paths.append(entry.path)
+    except OSError as e:
+        report["error"] = "Cannot list %s: %s" % (directory, e)
+        report["missing"] = list(range(start, end + 1))
+        report["missing_ranges"] = [(start, end)]
+        return report
+
+    if paths:
+        frames = [f for f, s in present.items() if s is None]
+        for f, size in zip(frames, _sizes(paths)):
+            if size < 0:
+                del present[f]
+            else:
+                present[f] = size
+
+    report["found"] = len(present)
+    missing = [f for f in range(start, end + 1) if f not in present]
+    report["missing"] = missing
+    report["missing_ranges"] = _frames_to_ranges(missing)
+    report["zero_byte"] = sorted(f for f, s in present.items() if not s)
+    report["total_bytes"] = sum(s for s in present.values() if s)
+    report["ok"] = not missing and not report["zero_byte"]
+    return report
+
+
+def _component_sequence(comp: Dict[str, Any]) -> Optional[Tuple[str, Tuple[int, int]]]:
+    frame_range = comp.get("frame_range")
+    if not frame_range or not comp.get("export_enabled", True):
+        return None
+    for candidate in (comp.get("sequence_pattern"), comp.get("file_path")):
+        if candidate and parse_pattern(candidate) is not None:
+            return candidate, (int(frame_range[0]), int(frame_range[1]))
+    return None
+
+
+def verify_components(components: Iterable[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+    """Verify every enabled component that has a frame pattern and frame_range, in parallel.
+
+    Returns one report per checked component (with "component" set to its name), in component order.
+    """
+    todo = []
+    for comp in components:
+        seq = _component_sequence(comp)
+        if seq is not None:
+            todo.append((comp.get("name"), seq[0], seq[1]))
+    if not todo:
+        return []
+
+    def run(item):
+        name, pattern, frame_range = item
+        report = verify_sequence(pattern, frame_range)
+        report["component"] = name
+        return report
+
+    if len(todo) == 1:
+        return [run(todo[0])]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(todo)), thread_name_prefix="MroyaSeqCheck") as pool:
+        return list(pool.map(run, todo))
+
+
+def verify_job(job: Dict[str, Any], max_workers: int = 8) -> Dict[str, Any]:
+    """Pre-flight a publish job dict: {"ok", "sequences": [reports], "total_bytes"}."""
+    reports = verify_components(job.get("components") or [], max_workers=max_workers)
+    return {
+        "ok": all(r["ok"] for r in reports),
+        "sequences": reports,
+        "total_bytes": sum(r["total_bytes"] for r in reports),
+    }
+
+
+def format_report(report: Dict[str, Any], max_ranges: int = 10) -> str:
+    """One-line summary of a verify_sequence() report for logs."""
+    if report.get("error") and not report.get("found"):
+        return "%s: %s" % (report["pattern"], report["error"])
+    parts = ["%s: %d/%d frames, %.1f MB" % (report["pattern"], report["found"], report["expected"], report["total_bytes"] / 1e6)]
+    if report["missing_ranges"]:
+        ranges = ["%d" % a if a == b else "%d-%d" % (a, b) for a, b in report["missing_ranges"][:max_ranges]]
+        if len(report["missing_ranges"]) > max_ranges:
+            ranges.append("...")
+        parts.append("missing %d (%s)" % (len(report["missing"]), ", ".join(ranges)))
+    if report["zero_byte"]:
+        parts.append("%d zero-byte" % len(report["zero_byte"]))
+    return "; ".join(parts)
@@ -0,0 +1,168 @@
+# :coding: utf-8
+"""
+Lightweight tracing spans for startup, browser open, import and publish paths.
+
+Off by default. Set MROYA_FTRACK_TRACE=1 to record spans and write a Chrome trace JSON (open in
+chrome://tracing or https://ui.perfetto.dev) to Saved/MroyaFtrack/traces/ when the editor exits,
+or set it to a directory or .json file path to choose where. dump() writes the trace on demand.
+
+When disabled, span() returns a shared no-op context manager and @traced returns the function
+unchanged, so instrumented code pays one function call (or nothing) per span.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_ENV = "MROYA_FTRACK_TRACE"
+_setting = os.environ.get(_ENV, "").strip()
+_enabled = _setting.lower() not in ("", "0", "false", "no", "off")
+
+_events: List[Dict[str, Any]] = []
+_thread_names: Dict[int, str] = {}
+_pid = os.getpid()
+_trace_path: Optional[str] = None
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: Dict[str, Any]):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        tid = threading.get_ident()
+        if tid not in _thread_names:
+            _thread_names[tid] = threading.current_thread().name
+        event = {
+            "name": self.name,
+            "cat": "mroya_ftrack",
+            "ph": "X",
+            "ts": self.start * 1e6,
+            "dur": (end - self.start) * 1e6,
+            "pid": _pid,
+            "tid": tid,
+        }
+        if exc_type is not None:
+            self.args["error"] = "%s: %s" % (exc_type.__name__, exc)
+        if self.args:
+            event["args"] = {k: str(v) for k, v in self.args.items()}
+        _events.append(event)  # list.append is atomic; spans may close on any thread
+        return False
+
+    def set(self, **args: Any) -> None:
+        """Attach extra args (e.g. counts known only at the end of the span)."""
+        self.args.update(args)
+
+
+def span(name: str, **args: Any):
+    """Context manager recording one nested span (no-op when tracing is disabled)."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator form of span(); returns the function untouched when tracing is disabled."""
+    def decorator(fn: Callable) -> Callable:
+        if not _enabled:
+            return fn
+        span_name = name or "%s.%s" % (fn.__module__, fn.__qualname__)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Span(span_name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _default_trace_path() -> str:
+    if _setting and _setting.lower() not in ("1", "true", "yes", "on"):
+        if _setting.lower().endswith(".json"):
+            return _setting
+        folder = _setting
+    else:
+        folder = None
+        if unreal is not None:
+            try:
+                saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+                folder = os.path.join(saved, "MroyaFtrack", "traces")
+            except Exception:
+                folder = None
+        if folder is None:
+            folder = os.path.join(os.getcwd(), "traces")
+    return os.path.join(folder, "mroya_ftrack_%s_%d.json" % (time.strftime("%Y%m%d_%H%M%S"), _pid))
+
+
+def _trace_metadata() -> Dict[str, str]:
+    meta = {"mroya_root": os.environ.get("MROYA_FTRACK_CONNECT", "")}
+    if unreal is not None:
+        try:
+            meta["engine_version"] = str(unreal.SystemLibrary.get_engine_version())
+        except Exception:
+            pass
+    return meta
+
+
+def dump(path: Optional[str] = None) -> Optional[str]:
+    """Write recorded spans as Chrome trace JSON. Returns the file path, or None if tracing is off."""
+    if not _enabled:
+        return None
+    path = path or _trace_path
+    events = list(_events)
+    for tid, tname in list(_thread_names.items()):
+        events.append({"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": tname}})
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": _trace_metadata()}, f)
+    except OSError as e:
+        if unreal is not None:
+            unreal.log_warning("Ftrack: Could not write trace %s: %s" % (path, e))
+        return None
+    return path
+
+
+if _enabled:
+    # Resolve the output path now: Saved/ lookups may no longer work while the editor shuts down.
+    _trace_path = _default_trace_path()
+    atexit.register(dump)
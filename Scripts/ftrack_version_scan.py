@@ -0,0 +1,326 @@
+# :coding: utf-8
+"""
+Find Ftrack Asset Handles that point at an older AssetVersion than the latest one, and update them.
+
+The scan is batched: for N handles it issues one Component query, one AssetVersion query
+(is_latest_version) and one Component query for the latest versions per chunk of up to 100 IDs, so
+thousands of handles need a few dozen round trips instead of several per handle.
+
+scan_versions(session, handles) is pure (no unreal import needed) and takes any object with
+session.query(expr) returning an iterable of mappings, so it can be tested against a mocked session.
+
+Editor entry points:
+    scan_project_async()     - all handles under /Game; writes the staleness index, runs off the game thread
+    update_handles(paths)    - scan the given handles, point stale ones at the latest version, re-import in place
+
+The staleness index is JSON at Saved/MroyaFtrack/staleness_index.json:
+    {"version": 1, "scanned_at": <epoch>, "stale": <count>, "handles": {<handle path>: <entry>}}
+(entry keys are listed in _new_entry). The Resources panel reads it to show stale handles.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ftrack_trace import span, traced
+
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+_QUERY_ID_CHUNK = 100
+_INDEX_FILE_NAME = "staleness_index.json"
+_FORMAT_VERSION = 1
+
+
+def _chunks(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _in_clause(ids: Iterable[str]) -> str:
+    return ", ".join('"%s"' % i for i in ids)
+
+
+def _new_entry(handle: str, component_id: Optional[str], pinned_version_id: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "handle": handle,
+        "component_id": component_id,
+        "component_name": None,
+        "asset_id": None,
+        "current_version_id": pinned_version_id,
+        "current_version": None,
+        "latest_version_id": None,
+        "latest_version": None,
+        "latest_component_id": None,
+        "stale": False,
+        "error": None if component_id else "Handle has no ComponentId.",
+    }
+
+
+def _query(session, lock, expr: str, count: int) -> list:
+    with lock, span("version_scan.query", count=count):
+        return list(session.query(expr))
+
+
+@traced("version_scan.scan_versions")
+def scan_versions(session, handles: Iterable[Dict[str, Any]], lock=None) -> List[Dict[str, Any]]:
+    """Resolve the latest version for each handle's asset with batched queries.
+
+    handles: dicts with "handle" (asset path), "component_id" and optional "version_id" (AssetVersionId).
+    lock: optional lock held around each query (the shared editor session is not thread-safe).
+    Returns one entry per handle; "stale" is True when a newer version has a component with the same name.
+    """
+    lock = lock or contextlib.nullcontext()
+    entries = [_new_entry(h["handle"], h.get("component_id"), h.get("version_id")) for h in handles]
+    component_ids = sorted({e["component_id"] for e in entries if e["component_id"]})
+
+    # 1) Handle component -> name, version, asset.
+    components: Dict[str, Dict[str, Any]] = {}
+    for chunk in _chunks(component_ids, _QUERY_ID_CHUNK):
+        rows = _query(
+            session, lock,
+            "select id, name, version_id, version.version, version.asset_id from Component where id in (%s)" % _in_clause(chunk),
+            len(chunk),
+        )
+        for comp in rows:
+            version = comp.get("version") or {}
+            components[str(comp["id"])] = {
+                "name": comp.get("name"),
+                "version_id": comp.get("version_id"),
+                "version": version.get("version"),
+                "asset_id": version.get("asset_id"),
+            }
+
+    # 2) Latest version per asset.
+    asset_ids = sorted({c["asset_id"] for c in components.values() if c["asset_id"]})
+    latest: Dict[str, Dict[str, Any]] = {}
+    for chunk in _chunks(asset_ids, _QUERY_ID_CHUNK):
+        rows = _query(
+            session, lock,
+            "select id, version, asset_id from AssetVersion where asset_id in (%s) and is_latest_version is True"
+            % _in_clause(chunk),
+            len(chunk),
+        )
+        for v in rows:
+            aid = str(v["asset_id"])
+            if aid not in latest or (v.get("version") or 0) > (latest[aid]["version"] or 0):
+                latest[aid] = {"id": str(v["id"]), "version": v.get("version")}
+
+    # 3) Components of the latest versions that are newer than what the handles use.
+    newer_version_ids = sorted({
+        latest[c["asset_id"]]["id"]
+        for c in components.values()
+        if c["asset_id"] in latest and latest[c["asset_id"]]["id"] != c["version_id"]
+    })
+    latest_components: Dict[tuple, str] = {}  # (version_id, component name) -> component id
+    for chunk in _chunks(newer_version_ids, _QUERY_ID_CHUNK):
+        rows = _query(
+            session, lock,
+            "select id, name, version_id from Component where version_id in (%s)" % _in_clause(chunk),
+            len(chunk),
+        )
+        for comp in rows:
+            latest_components[(str(comp["version_id"]), comp.get("name"))] = str(comp["id"])
+
+    for e in entries:
+        if e["error"]:
+            continue
+        comp = components.get(e["component_id"])
+        if comp is None:
+            e["error"] = "Component not found on the server."
+            continue
+        e["component_name"] = comp["name"]
+        e["asset_id"] = comp["asset_id"]
+        e["current_version_id"] = comp["version_id"]
+        e["current_version"] = comp["version"]
+        newest = latest.get(comp["asset_id"])
+        if newest is None:
+            e["error"] = "No latest version found for asset."
+            continue
+        e["latest_version_id"] = newest["id"]
+        e["latest_version"] = newest["version"]
+        if newest["id"] == comp["version_id"]:
+            e["latest_component_id"] = e["component_id"]
+            continue
+        e["latest_component_id"] = latest_components.get((newest["id"], comp["name"]))
+        if e["latest_component_id"]:
+            e["stale"] = True
+        else:
+            e["error"] = "Latest version v%s has no component named %r." % (newest["version"], comp["name"])
+    return entries
+
+
+def staleness_index_path() -> Optional[str]:
+    if unreal is None:
+        return None
+    saved = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved, "MroyaFtrack", _INDEX_FILE_NAME)
+
+
+def write_staleness_index(entries: List[Dict[str, Any]], path: Optional[str] = None, merge: bool = False) -> Optional[str]:
+    """Write entries as the staleness index (merge=True keeps other handles' entries). Returns the path."""
+    path = path or staleness_index_path()
+    if not path:
+        return None
+    handles: Dict[str, Any] = {}
+    if merge:
+        handles = (load_staleness_index(path) or {}).get("handles") or {}
+    for e in entries:
+        handles[e["handle"]] = e
+    data = {
+        "version": _FORMAT_VERSION,
+        "scanned_at": time.time(),
+        "stale": sum(1 for e in handles.values() if e.get("stale")),
+        "handles": handles,
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+    return path
+
+
+def load_staleness_index(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    path = path or staleness_index_path()
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION or not isinstance(data.get("handles"), dict):
+        return None
+    return data
+
+
+def iter_asset_handle_paths(content_path: str = "/Game") -> Iterable[str]:
+    """Object paths of every UFtrackAssetHandle under content_path (asset registry; nothing is loaded)."""
+    from ftrack_handle_registry import iter_handle_asset_data
+
+    for data in iter_handle_asset_data(content_path):
+        yield "%s.%s" % (data.package_name, data.asset_name)
+
+
+def _read_handle_refs(handle_paths: Iterable[str]) -> List[Dict[str, Any]]:
+    """[{handle, component_id, version_id}] for the given handles (game thread; registry tags, loads only untagged handles)."""
+    import init_ftrack_menu
+
+    return [
+        {"handle": r["handle"], "component_id": r["component_id"], "version_id": r["version_id"]}
+        for r in init_ftrack_menu._read_handles(list(handle_paths))
+    ]
+
+
+def _shared_session_and_lock():
+    import init_ftrack_menu
+
+    session = init_ftrack_menu.wait_for_shared_session()
+    if session is None:
+        raise RuntimeError("No ftrack session (check MROYA_FTRACK_CONNECT and FTRACK_* env).")
+    return session, init_ftrack_menu._session_lock
+
+
+def scan_handles_async(
+    handle_paths: Iterable[str],
+    on_done: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    *,
+    merge_index: bool = True,
+) -> None:
+    """Scan the given handles on a background thread; write the index and call on_done(entries) on the game thread."""
+    import ftrack_game_thread
+    import init_ftrack_menu
+
+    init_ftrack_menu.start_shared_session_warmup()
+    refs = _read_handle_refs(handle_paths)
+    ftrack_game_thread.hold()
+
+    def _finish(entries, error):
+        try:
+            if error is not None:
+                unreal.log_error("Ftrack: Version scan failed: %s" % error)
+                return
+            path = write_staleness_index(entries, merge=merge_index)
+            stale = sum(1 for e in entries if e["stale"])
+            errors = sum(1 for e in entries if e["error"])
+            unreal.log("Ftrack: Version scan: %s handle(s), %s stale, %s error(s). Index: %s" % (len(entries), stale, errors, path))
+            for e in entries:
+                if e["stale"]:
+                    unreal.log("Ftrack:   %s: v%s -> v%s" % (e["handle"], e["current_version"], e["latest_version"]))
+                elif e["error"]:
+                    unreal.log_warning("Ftrack:   %s: %s" % (e["handle"], e["error"]))
+            if on_done:
+                on_done(entries)
+        finally:
+            ftrack_game_thread.release()
+
+    def _scan():
+        entries, error = None, None
+        try:
+            session, lock = _shared_session_and_lock()
+            entries = scan_versions(session, refs, lock=lock)
+        except Exception as e:
+            error = e
+        ftrack_game_thread.run_on_game_thread(_finish, entries, error)
+
+    threading.Thread(target=_scan, name="MroyaFtrackVersionScan", daemon=True).start()
+
+
+def scan_project_async(content_path: str = "/Game", on_done=None) -> None:
+    """Editor command: scan every Ftrack Asset Handle under content_path and rewrite the staleness index."""
+    if unreal is None:
+        return
+    scan_handles_async(list(iter_asset_handle_paths(content_path)), on_done, merge_index=False)
+
+
+def apply_updates(entries: List[Dict[str, Any]]) -> List[str]:
+    """Point stale handles at their latest component/version and save them in one batch. Returns updated paths."""
+    updated_assets, updated_paths = [], []
+    for e in entries:
+        if not e["stale"] or not e["latest_component_id"]:
+            continue
+        handle = unreal.load_asset(e["handle"])
+        if not handle:
+            continue
+        handle.set_editor_property("ComponentId", e["latest_component_id"])
+        handle.set_editor_property("AssetVersionId", e["latest_version_id"])
+        updated_assets.append(handle)
+        updated_paths.append(e["handle"])
+    if updated_assets:
+        unreal.EditorAssetLibrary.save_loaded_assets(updated_assets, only_if_is_dirty=False)
+    return updated_paths
+
+
+def update_handles(handle_paths: Iterable[str], reimport: bool = True) -> None:
+    """Panel Update action: scan the handles, move stale ones to the latest version, then re-import those.
+
+    Up-to-date handles are left alone. Runs the server queries off the game thread.
+    """
+    if unreal is None:
+        return
+    handle_paths = list(handle_paths)
+
+    def _on_scanned(entries):
+        paths = apply_updates(entries)
+        if not paths:
+            unreal.log("Ftrack: Update: %s handle(s) already at the latest version." % len(handle_paths))
+            return
+        unreal.log("Ftrack: Update: %s handle(s) moved to the latest version." % len(paths))
+        for e in entries:
+            if e["handle"] in paths:
+                e.update(stale=False, component_id=e["latest_component_id"],
+                         current_version_id=e["latest_version_id"], current_version=e["latest_version"])
+        write_staleness_index(entries, merge=True)
+        if reimport:
+            import init_ftrack_menu
+            init_ftrack_menu.reimport_handles_async(paths)
+
+    scan_handles_async(handle_paths, _on_scanned)
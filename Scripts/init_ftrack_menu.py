@@ -11,7 +11,11 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+from ftrack_trace import span, traced
 
 try:
     import unreal
@@ -19,6 +23,30 @@ except ImportError:
     unreal = None
 
 
+def _create_handle_asset(asset_tools, handle_class, component_id: str, content_subpath: str | None, asset_version_id: str | None):
+    """Create and fill one FtrackAssetHandle without saving its package. Returns the asset or None."""
+    sub = (content_subpath or "").strip().strip("/").replace("\\", "/")
+    base_path = "/Game/" + (sub if sub else "FtrackImport")
+    from ftrack_asset_names import allocate_asset_name
+    asset_name = allocate_asset_name(base_path, "FtrackHandle")
+    factory = unreal.DataAssetFactory()
+    new_asset = asset_tools.create_asset(asset_name, base_path, handle_class, factory)
+    if not new_asset:
+        return None
+    new_asset.set_editor_property("ComponentId", component_id.strip())
+    new_asset.set_editor_property("ContentSubpath", (content_subpath or "").strip())
+    if asset_version_id and str(asset_version_id).strip():
+        new_asset.set_editor_property("AssetVersionId", str(asset_version_id).strip())
+    return new_asset
+
+
+def _load_handle_class():
+    handle_class = unreal.load_object(None, "/Script/MroyaFtrack.FtrackAssetHandle")
+    if not handle_class:
+        unreal.log_error("Ftrack: FtrackAssetHandle class not found. Is the plugin built?")
+    return handle_class
+
+
 def create_ftrack_handle(component_id: str, content_subpath: str | None = None, asset_version_id: str | None = None) -> str | None:
     """Create a Ftrack Asset Handle (DataAsset) with the given component ID and content subpath.
     The handle is created at the same path as the import destination: /Game/{content_subpath}.
@@ -30,33 +58,13 @@ def create_ftrack_handle(component_id: str, content_subpath: str | None = None,
         unreal.log_warning("Ftrack: create_ftrack_handle requires component_id.")
         return None
     try:
-        sub = (content_subpath or "").strip().strip("/").replace("\\", "/")
-        base_path = "/Game/" + (sub if sub else "FtrackImport")
-        asset_name_base = "FtrackHandle"
         asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-        # Find unique name
-        existing = unreal.EditorAssetLibrary.list_assets(base_path, recursive=False, include_folder=False)
-        used = set()
-        for p in existing:
-            name = unreal.SystemLibrary.get_object_name(unreal.load_asset(p))
-            used.add(name)
-        idx = 0
-        asset_name = asset_name_base
-        while asset_name in used:
-            idx += 1
-            asset_name = "%s_%d" % (asset_name_base, idx)
-        handle_class = unreal.load_object(None, "/Script/MroyaFtrack.FtrackAssetHandle")
+        handle_class = _load_handle_class()
         if not handle_class:
-            unreal.log_error("Ftrack: FtrackAssetHandle class not found. Is the plugin built?")
             return None
-        factory = unreal.DataAssetFactory()
-        new_asset = asset_tools.create_asset(asset_name, base_path, handle_class, factory)
+        new_asset = _create_handle_asset(asset_tools, handle_class, component_id, content_subpath, asset_version_id)
         if not new_asset:
             return None
-        new_asset.set_editor_property("ComponentId", component_id.strip())
-        new_asset.set_editor_property("ContentSubpath", (content_subpath or "").strip())
-        if asset_version_id and str(asset_version_id).strip():
-            new_asset.set_editor_property("AssetVersionId", str(asset_version_id).strip())
         unreal.EditorAssetLibrary.save_loaded_asset(new_asset)
         path = unreal.SystemLibrary.get_path_name(new_asset)
         unreal.log("Ftrack: Created Ftrack Asset Handle: %s (ComponentId=%s)" % (path, component_id[:16] + "..."))
@@ -67,6 +75,61 @@ def create_ftrack_handle(component_id: str, content_subpath: str | None = None,
         return None
 
 
+def _handle_entry_fields(entry) -> tuple:
+    """(component_id, content_subpath, asset_version_id) from a dict, a tuple/list or a bare component ID."""
+    if isinstance(entry, dict):
+        return entry.get("component_id"), entry.get("content_subpath"), entry.get("asset_version_id")
+    if isinstance(entry, (tuple, list)):
+        padded = list(entry) + [None, None, None]
+        return padded[0], padded[1], padded[2]
+    return entry, None, None
+
+
+def create_ftrack_handles(entries: list) -> dict:
+    """Create many Ftrack Asset Handles, then save all their packages in one pass.
+
+    Each entry is a dict with component_id / content_subpath / asset_version_id, a
+    (component_id, content_subpath, asset_version_id) tuple, or a component ID string.
+    Returns {"paths": [asset path or None per entry], "created": n, "create_seconds": t, "save_seconds": t}.
+    """
+    report = {"paths": [], "created": 0, "create_seconds": 0.0, "save_seconds": 0.0}
+    if unreal is None or not entries:
+        return report
+    handle_class = _load_handle_class()
+    if not handle_class:
+        report["paths"] = [None] * len(entries)
+        return report
+    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    t0 = time.perf_counter()
+    assets = []
+    for entry in entries:
+        component_id, content_subpath, asset_version_id = _handle_entry_fields(entry)
+        new_asset = None
+        if not component_id or not str(component_id).strip():
+            unreal.log_warning("Ftrack: create_ftrack_handles: entry without component_id skipped.")
+        else:
+            try:
+                new_asset = _create_handle_asset(asset_tools, handle_class, str(component_id), content_subpath, asset_version_id)
+            except Exception as e:
+                unreal.log_error("Ftrack: create_ftrack_handles failed for %s: %s" % (str(component_id)[:16], e))
+        report["paths"].append(unreal.SystemLibrary.get_path_name(new_asset) if new_asset else None)
+        if new_asset:
+            assets.append(new_asset)
+    t1 = time.perf_counter()
+    if assets:
+        try:
+            unreal.EditorAssetLibrary.save_loaded_assets(assets, only_if_is_dirty=False)
+        except Exception as e:
+            unreal.log_error("Ftrack: create_ftrack_handles save failed: %s" % e)
+    t2 = time.perf_counter()
+    report["created"] = len(assets)
+    report["create_seconds"] = t1 - t0
+    report["save_seconds"] = t2 - t1
+    unreal.log("Ftrack: Created %s Ftrack Asset Handle(s): create %.2fs, save %.2fs." % (len(assets), t1 - t0, t2 - t1))
+    return report
+
+
+@traced("init_ftrack_menu._bootstrap_mroya")
 def _bootstrap_mroya() -> bool:
     """Add mroya and ftrack_plugins to sys.path. Returns True if MROYA_FTRACK_CONNECT is set."""
     mroya_root = os.environ.get("MROYA_FTRACK_CONNECT", "").strip()
@@ -82,100 +145,818 @@ def _bootstrap_mroya() -> bool:
     return True
 
 
-def import_handle_in_unreal(handle_asset_path: str) -> int:
-    """Resolve the Ftrack Handle's component to a file path and run import. Returns number of assets imported or 0 on failure."""
-    if unreal is None:
-        return 0
+# ftrack query strings get long with many IDs; keep each "in (...)" clause bounded.
+_QUERY_ID_CHUNK = 100
+
+# ftrack_api.Session is not thread-safe; worker threads take this lock around server calls.
+_session_lock = threading.Lock()
+
+
+def _content_destination(content_subpath: str | None) -> str:
+    """Return /Game/{content_subpath} or /Game/FtrackImport if not set."""
+    if content_subpath and content_subpath.strip():
+        sub = content_subpath.strip().strip("/").replace("\\", "/")
+        if sub:
+            return "/Game/" + sub
+    return "/Game/FtrackImport"
+
+
+def _chunks(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _new_handle_result(handle_asset_path: str) -> dict:
+    return {
+        "handle": handle_asset_path,
+        "component_id": None,
+        "version_id": None,
+        "pinned": False,
+        "content_subpath": None,
+        "destination": None,
+        "path": None,
+        "imported": 0,
+        "imported_object_paths": [],
+        "reimport_reason": None,
+        "preset": None,
+        "import_seconds": None,
+        "local_path": None,
+        "error": None,
+    }
+
+
+def _read_handle(handle_asset_path: str) -> dict:
+    """Load a Ftrack Asset Handle and return its fields as a per-handle result dict."""
+    result = _new_handle_result(handle_asset_path)
+    handle = unreal.load_asset(handle_asset_path)
+    if not handle:
+        result["error"] = "Could not load handle: %s" % handle_asset_path
+        return result
+    return _fill_handle_result(
+        result,
+        handle.get_editor_property("ComponentId"),
+        handle.get_editor_property("ContentSubpath"),
+        handle.get_editor_property("AssetVersionId"),
+    )
+
+
+def _fill_handle_result(result: dict, component_id, content_subpath, version_id) -> dict:
+    result["component_id"] = (component_id or "").strip() or None
+    result["content_subpath"] = (content_subpath or "").strip() or None
+    result["version_id"] = (version_id or "").strip() or None
+    result["pinned"] = bool(result["version_id"])
+    result["destination"] = _content_destination(result["content_subpath"])
+    if not result["component_id"]:
+        result["error"] = "Handle has no ComponentId."
+    return result
+
+
+def _resolve_version_ids(session, component_ids: list) -> dict:
+    """Return {component_id: version_id} using one Component query per chunk of IDs."""
+    out = {}
+    for chunk in _chunks(sorted(set(component_ids)), _QUERY_ID_CHUNK):
+        ids = ", ".join('"%s"' % cid for cid in chunk)
+        with _session_lock, span("import.query_component_versions", count=len(chunk)):
+            comps = list(session.query("select id, version_id from Component where id in (%s)" % ids))
+        for comp in comps:
+            out[str(comp["id"])] = comp.get("version_id")
+    return out
+
+
+def _apply_cached_paths(results: list) -> None:
+    """Fill "path" from the resolution cache where a cached file still exists."""
+    from ftrack_resolve_cache import get_resolve_cache
+
+    cache = get_resolve_cache()
+    for r in results:
+        if r["error"] or r["path"]:
+            continue
+        hit = cache.get(r["component_id"], r["version_id"])
+        if not hit:
+            continue
+        version_id, p = hit
+        if os.path.isfile(p):
+            r["version_id"] = version_id
+            r["path"] = p
+        else:
+            cache.invalidate(component_id=r["component_id"], version_id=version_id)
+
+
+def _resolve_version_paths(client, version_id: str, version_results: list) -> None:
+    """Resolve one asset version's component paths and check the handles' files exist."""
+    from ftrack_resolve_cache import get_resolve_cache
+
     try:
-        handle = unreal.load_asset(handle_asset_path)
-        if not handle:
-            unreal.log_error("Ftrack: Could not load handle: %s" % handle_asset_path)
-            return 0
-        component_id = (handle.get_editor_property("ComponentId") or "").strip()
-        content_subpath = (handle.get_editor_property("ContentSubpath") or "").strip() or None
-        asset_version_id = (handle.get_editor_property("AssetVersionId") or "").strip() or None
-        if not component_id:
-            unreal.log_warning("Ftrack: Handle has no ComponentId.")
-            return 0
+        with _session_lock, span("import.resolve_version_paths", version_id=version_id):
+            components = client.get_components_with_paths_for_version(version_id)
+    except Exception as e:
+        for r in version_results:
+            r["error"] = "Could not resolve components for version %s: %s" % (version_id, e)
+        return
+    paths = {}
+    for c in (components or []):
+        p = (c.get("path") or "").strip()
+        if p and p != "N/A":
+            paths[str(c.get("id"))] = p
+    cache = get_resolve_cache()
+    pinned_ids = set(r["component_id"] for r in version_results if r["pinned"])
+    for cid, p in paths.items():
+        cache.put(cid, version_id, p, pinned=cid in pinned_ids)
+    for r in version_results:
+        p = paths.get(str(r["component_id"]))
+        if p and _isfile_traced(p):
+            r["path"] = p
+        else:
+            r["error"] = "Component path not resolved or file not found. Check location."
+
+
+def _resolve_handle_paths(session, results: list, executor=None, on_version_done=None) -> None:
+    """Fill "path" (or "error") on each pending result, with one path lookup per asset version.
+
+    With an executor, versions are resolved concurrently (server calls are serialized by
+    _session_lock; file checks run in parallel). on_version_done(done, total) reports progress.
+    """
+    from ftrack_inout.browser.simple_api_client import SimpleFtrackApiClient
+
+    pending = [r for r in results if not r["error"] and not r["path"]]
+    unversioned = [r["component_id"] for r in pending if not r["version_id"]]
+    if unversioned:
+        try:
+            version_ids = _resolve_version_ids(session, unversioned)
+        except Exception as e:
+            version_ids = {}
+            for r in pending:
+                if not r["version_id"]:
+                    r["error"] = "Could not get version for component %s: %s" % (r["component_id"][:16], e)
+        for r in pending:
+            if not r["version_id"] and not r["error"]:
+                r["version_id"] = version_ids.get(r["component_id"])
+                if not r["version_id"]:
+                    r["error"] = "Could not determine asset version for component."
+
+    by_version = {}
+    for r in pending:
+        if not r["error"]:
+            by_version.setdefault(r["version_id"], []).append(r)
+    client = SimpleFtrackApiClient(session=session)
+    total = len(by_version)
+    if executor is None:
+        for done, (version_id, version_results) in enumerate(by_version.items(), 1):
+            _resolve_version_paths(client, version_id, version_results)
+            if on_version_done:
+                on_version_done(done, total)
+        return
+    futures = [executor.submit(_resolve_version_paths, client, vid, vres) for vid, vres in by_version.items()]
+    for done, f in enumerate(as_completed(futures), 1):
+        f.result()
+        if on_version_done:
+            on_version_done(done, total)
+
+
+@traced("import.check_file")
+def _isfile_traced(path: str) -> bool:
+    return os.path.isfile(path)
+
+
+@traced("import.resolve")
+def _resolve_results(results: list, executor=None, on_version_done=None) -> None:
+    """Resolve paths for all readable handles. Does not touch unreal, so it may run on a worker thread."""
+    try:
+        with span("import.resolve_cache_lookup"):
+            _apply_cached_paths(results)
+    except Exception:
+        pass
+    if any(not r["error"] and not r["path"] for r in results):
+        session = None
         if not _bootstrap_mroya():
-            unreal.log_error("Ftrack: MROYA_FTRACK_CONNECT not set. Cannot resolve component.")
-            return 0
+            error = "MROYA_FTRACK_CONNECT not set. Cannot resolve component."
+        else:
+            with span("import.wait_for_session"):
+                session = wait_for_shared_session()
+            error = None if session else "No ftrack session."
+        if session is not None:
+            try:
+                _resolve_handle_paths(session, results, executor=executor, on_version_done=on_version_done)
+            except Exception as e:
+                error = "Could not resolve components: %s" % e
+        if error:
+            for r in results:
+                if not r["error"] and not r["path"]:
+                    r["error"] = error
+    try:
+        from ftrack_resolve_cache import get_resolve_cache
+        get_resolve_cache().save()
+    except Exception:
+        pass
+
+
+@traced("import.prefetch")
+def _prefetch_results(results: list, on_progress=None, only=None, log=None) -> None:
+    """Copy remote source files of resolved results to the local prefetch folder (worker-thread safe).
+
+    Sets "local_path" (the file to import from); "path" stays the resolved location path. only: optional
+    predicate choosing which results to prefetch. A failed copy is logged and the import reads the
+    original path. on_progress(done_bytes, total_bytes) may be called from copy threads.
+    log(log_fn, message) defaults to _log_on_game_thread (for workers whose caller holds
+    ftrack_game_thread); game-thread callers pass _log_now.
+    """
+    log = log or _log_on_game_thread
+    from ftrack_component_cache import cache_key, get_component_cache
+    from ftrack_prefetch import prefetch_files
+
+    todo = [r for r in results if not r["error"] and r["path"] and (only is None or only(r))]
+    if not todo:
+        return
+    items = [{"path": r["path"], "key": cache_key(r["component_id"], r["version_id"])} for r in todo]
+    try:
+        prefetched = prefetch_files(items, progress=on_progress, cache=get_component_cache())
+    except Exception as e:
+        log(unreal.log_warning, "Ftrack: Prefetch failed, importing from resolved paths: %s" % e)
+        return
+    for r, out in zip(todo, prefetched):
+        if out["error"]:
+            log(unreal.log_warning, "Ftrack: %s: %s (importing from %s)" % (r["handle"], out["error"], r["path"]))
+        elif out["status"] != "local":
+            r["local_path"] = out["local"]
+    copied = [out for out in prefetched if out["status"] == "copied"]
+    cached = [out for out in prefetched if out["status"] == "cached"]
+    if copied or cached:
+        log(unreal.log, "Ftrack: Prefetch: %d file(s) copied (%.1f MB), %d from the local cache (%.1f MB)." % (
+            len(copied), sum(o["copied_bytes"] for o in copied) / 1024 ** 2,
+            len(cached), sum(o["bytes"] for o in cached) / 1024 ** 2))
+
+
+def _pin_level_components() -> None:
+    """Keep cached files of handles used by the open level out of cache eviction (game thread).
+
+    Cheap after the first call for a level: the dependency walk only runs when another level is open.
+    """
+    try:
+        from ftrack_component_cache import pin_current_level
+        pin_current_level()
+    except Exception as e:
+        unreal.log_warning("Ftrack: Could not pin the open level's cached components: %s" % e)
+
+
+@traced("import.read_handles")
+def _read_handles(handle_asset_paths: list) -> list:
+    """Per-handle result dicts from asset registry tags; only handles without tags are loaded."""
+    try:
+        from ftrack_handle_registry import read_handle_tags
+        with span("import.read_handle_tags", count=len(handle_asset_paths)):
+            tags = read_handle_tags(handle_asset_paths)
+    except Exception:
+        tags = {}
+    results = []
+    for handle_asset_path in handle_asset_paths:
+        fields = tags.get(handle_asset_path)
+        if fields is not None:
+            results.append(_fill_handle_result(
+                _new_handle_result(handle_asset_path),
+                fields["component_id"], fields["content_subpath"], fields["version_id"],
+            ))
+            continue
         try:
-            from ftrack_inout.common.session_factory import get_shared_session
-            from ftrack_inout.browser.simple_api_client import SimpleFtrackApiClient
-        except ImportError as e:
-            unreal.log_error("Ftrack: import_handle_in_unreal failed to import ftrack_inout: %s" % e)
-            return 0
-        session = get_shared_session()
-        if not session:
-            unreal.log_error("Ftrack: No ftrack session.")
-            return 0
-        version_id = asset_version_id
-        if not version_id:
+            results.append(_read_handle(handle_asset_path))
+        except Exception as e:
+            result = _new_handle_result(handle_asset_path)
+            result["error"] = "Could not read handle: %s" % e
+            results.append(result)
+    return results
+
+
+@traced("import.submit")
+def _submit_imports(results: list, *, replace_existing: bool = False, automated: bool = False) -> list:
+    """Run one import batch per destination for resolved results, then log per-handle errors (game thread).
+
+    Successful imports are recorded in the import manifest (ftrack_import_manifest) for re-import.
+    automated=True imports every destination in one unattended batch with import presets.
+    """
+    by_destination = {}
+    for r in results:
+        if not r["error"]:
+            by_destination.setdefault(r["destination"], []).append(r)
+    if automated:
+        # No dialogs, so every destination goes into one batch.
+        pending = [r for r in results if not r["error"]]
+        if pending:
             try:
-                comp = session.get("Component", component_id)
-                version_id = comp.get("version_id") if comp else None
+                done = import_files_automated(
+                    [{"path": r.get("local_path") or r["path"], "destination": r["destination"],
+                      "destination_name": r.get("destination_name")}
+                     for r in pending],
+                    replace_existing=replace_existing,
+                    log_errors=False,
+                )
             except Exception as e:
-                unreal.log_error("Ftrack: Could not get version for component %s: %s" % (component_id[:16], e))
-                return 0
-        if not version_id:
-            unreal.log_error("Ftrack: Could not determine asset version for component.")
-            return 0
-        client = SimpleFtrackApiClient(session=session)
-        components = client.get_components_with_paths_for_version(version_id)
-        path = None
-        for c in (components or []):
-            if str(c.get("id")) == str(component_id):
-                p = (c.get("path") or "").strip()
-                if p and p != "N/A" and os.path.isfile(p):
-                    path = p
-                    break
-        if not path:
-            unreal.log_warning("Ftrack: Component path not resolved or file not found. Check location.")
-            return 0
-        return import_paths_into_unreal([path], content_subpath=content_subpath)
+                done = [{"error": "Import failed: %s" % e}] * len(pending)
+            for r, d in zip(pending, done):
+                r["imported_object_paths"] = d.get("imported_object_paths") or []
+                r["imported"] = 1 if r["imported_object_paths"] else 0
+                r["preset"] = d.get("preset")
+                r["import_seconds"] = d.get("seconds")
+                if d.get("error"):
+                    r["error"] = d["error"]
+        by_destination = {}
+    for destination, dest_results in by_destination.items():
+        try:
+            tasks = _import_paths_with_tasks(
+                [r.get("local_path") or r["path"] for r in dest_results],
+                destination,
+                replace_existing=replace_existing,
+                automated=automated,
+                destination_names=[r.get("destination_name") or "" for r in dest_results],
+            )
+        except Exception as e:
+            for r in dest_results:
+                r["error"] = "Import failed: %s" % e
+            continue
+        for r, task in zip(dest_results, tasks):
+            if task is None:
+                r["error"] = "File not found at import time: %s" % r["path"]
+                continue
+            r["imported_object_paths"] = [str(p) for p in (task.imported_object_paths or [])]
+            r["imported"] = 1 if r["imported_object_paths"] else 0
+
+    try:
+        from ftrack_import_manifest import record_imports
+        record_imports(results)
     except Exception as e:
-        if unreal:
-            unreal.log_error("Ftrack: import_handle_in_unreal failed: %s" % e)
-        return 0
+        unreal.log_warning("Ftrack: Could not update import manifest: %s" % e)
+    try:
+        from ftrack_component_cache import pin_imported_sources
+        pin_imported_sources(r["path"] for r in results if r.get("imported") and not r["error"])
+    except Exception as e:
+        unreal.log_warning("Ftrack: Could not pin imported components: %s" % e)
+    for r in results:
+        if r["error"]:
+            unreal.log_warning("Ftrack: %s: %s" % (r["handle"], r["error"]))
+    return results
+
+
+def import_handles_in_unreal(handle_asset_paths: list, automated: bool = False) -> list:
+    """Resolve many Ftrack Handles at once and import them with one import batch per destination.
+
+    Paths already in the resolution cache (ftrack_resolve_cache) skip the server. Remaining component
+    versions are looked up in chunked queries and paths once per asset version, so a large selection
+    costs a handful of server round trips instead of two per handle.
+    Returns one result dict per handle (same order): handle, component_id, version_id, pinned,
+    content_subpath, destination, path, imported (1 if the file produced assets),
+    imported_object_paths, preset and import_seconds (automated only) and error (None on success).
+    automated=True imports without dialogs using import presets (see import_files_automated).
+    """
+    if unreal is None or not handle_asset_paths:
+        return []
+    with span("import_handles_in_unreal", handles=len(handle_asset_paths)):
+        results = _read_handles(handle_asset_paths)
+        _pin_level_components()
+        _resolve_results(results)
+        _prefetch_results(results, log=_log_now)
+        return _submit_imports(results, automated=automated)
+
+
+def import_handle_in_unreal(handle_asset_path: str) -> int:
+    """Resolve the Ftrack Handle's component to a file path and run import. Returns number of assets imported or 0 on failure."""
+    results = import_handles_in_unreal([handle_asset_path])
+    return results[0]["imported"] if results else 0
+
+
+class HandleImportJob:
+    """Progress and result of import_handles_async. future resolves to the per-handle result list."""
+
+    def __init__(self, handle_count: int):
+        self.future = Future()
+        self.handle_count = handle_count
+        self.stage = "reading"  # reading -> resolving -> prefetching -> importing -> done
+        self.versions_done = 0
+        self.versions_total = 0
+        self.prefetch_bytes_done = 0
+        self.prefetch_bytes_total = 0
+
+    def progress(self) -> float:
+        """Fraction in [0, 1]: resolution 0-50%, copying remote files 50-90%, the import batch the rest."""
+        if self.stage == "done":
+            return 1.0
+        if self.stage == "importing":
+            return 0.9
+        if self.stage == "prefetching":
+            if self.prefetch_bytes_total:
+                return 0.5 + 0.4 * self.prefetch_bytes_done / self.prefetch_bytes_total
+            return 0.5
+        if self.stage == "resolving" and self.versions_total:
+            return 0.5 * self.versions_done / self.versions_total
+        return 0.0
+
+
+_RESOLVE_WORKERS = 4
+_resolve_executor = None
+
+
+def _get_resolve_executor() -> ThreadPoolExecutor:
+    global _resolve_executor
+    if _resolve_executor is None:
+        _resolve_executor = ThreadPoolExecutor(max_workers=_RESOLVE_WORKERS, thread_name_prefix="MroyaFtrackResolve")
+    return _resolve_executor
+
+
+def import_handles_async(handle_asset_paths: list, on_progress=None, on_done=None, automated: bool = False) -> HandleImportJob | None:
+    """Like import_handles_in_unreal, but session queries, path resolution and file checks run on a worker pool.
+
+    Must be called on the game thread (handles are loaded here). Only the AssetImportTask batch is
+    submitted back on the game thread via a Slate tick. on_progress(job) and on_done(results) are
+    called on the game thread. Returns a HandleImportJob; its future resolves to the result list.
+    """
+    if unreal is None or not handle_asset_paths:
+        return None
+    import ftrack_game_thread
+
+    job = HandleImportJob(len(handle_asset_paths))
+    start_shared_session_warmup()
+    results = _read_handles(handle_asset_paths)
+    _pin_level_components()
+    job.stage = "resolving"
+    ftrack_game_thread.hold()
+
+    def _notify():
+        if on_progress:
+            try:
+                on_progress(job)
+            except Exception as e:
+                unreal.log_warning("Ftrack: import progress callback failed: %s" % e)
 
+    def _on_version_done(done, total):
+        job.versions_done, job.versions_total = done, total
+        ftrack_game_thread.run_on_game_thread(_notify)
 
-def import_paths_into_unreal(paths: list, content_subpath: str | None = None) -> int:
-    """Import given file paths into Unreal. Destination: /Game/{content_subpath} or /Game/FtrackImport if not set."""
+    def _finish():
+        try:
+            job.stage = "importing"
+            _notify()
+            _submit_imports(results, automated=automated)
+            job.stage = "done"
+            _notify()
+            job.future.set_result(results)
+            if on_done:
+                on_done(results)
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+            unreal.log_error("Ftrack: import_handles_async failed: %s" % e)
+        finally:
+            ftrack_game_thread.release()
+
+    def _on_prefetch_progress(done, total):
+        job.prefetch_bytes_done, job.prefetch_bytes_total = done, total
+        ftrack_game_thread.run_on_game_thread(_notify)
+
+    def _resolve():
+        try:
+            _resolve_results(results, executor=_get_resolve_executor(), on_version_done=_on_version_done)
+        except Exception as e:
+            for r in results:
+                if not r["error"] and not r["path"]:
+                    r["error"] = "Could not resolve components: %s" % e
+        job.stage = "prefetching"
+        _prefetch_results(results, on_progress=_on_prefetch_progress)
+        ftrack_game_thread.run_on_game_thread(_finish)
+
+    # Dedicated thread for the coordinator so it never waits on a slot in the pool it feeds.
+    threading.Thread(target=_resolve, name="MroyaFtrackImport", daemon=True).start()
+    return job
+
+
+def _classify_reimports(results: list) -> None:
+    """Set reimport_reason on resolved results whose source differs from the manifest (worker-thread safe)."""
+    from ftrack_import_manifest import get_import_manifest, source_change
+
+    manifest = get_import_manifest()
+    for r in results:
+        if r["error"] or not r["path"]:
+            continue
+        try:
+            reason, digest = source_change(manifest.get(r["handle"]), r["path"], r["version_id"])
+        except Exception as e:
+            r["error"] = "Could not check for changes: %s" % e
+            continue
+        r["reimport_reason"] = reason
+        if digest:
+            r["content_hash"] = digest
+
+
+def _missing_imported_objects(entry: dict | None) -> bool:
+    if not entry or not entry.get("imported_object_paths"):
+        return False
+    return any(
+        not unreal.EditorAssetLibrary.does_asset_exist(p.split(".", 1)[0])
+        for p in entry["imported_object_paths"]
+    )
+
+
+def reimport_handles_async(handle_asset_paths: list | None = None, force: bool = False, on_done=None) -> HandleImportJob | None:
+    """Re-resolve handles and re-import, in place, only those whose source changed since the last import.
+
+    handle_asset_paths None means every handle recorded in the import manifest. A source counts as
+    changed when its version, path or size differs from the manifest, or its mtime differs and the
+    content hash does too. Handles never imported, or whose imported assets were deleted, are imported.
+    force=True re-imports everything. Changed handles are imported with replace_existing=True, without
+    the options dialog, into the previously imported asset name. on_done(results) runs on the game
+    thread; unchanged handles have imported=0 and reimport_reason None.
+    """
     if unreal is None:
-        return 0
-    if not paths:
-        return 0
+        return None
+    from ftrack_import_manifest import get_import_manifest
+    import ftrack_game_thread
+
+    manifest = get_import_manifest()
+    if handle_asset_paths is None:
+        handle_asset_paths = manifest.handles()
+    if not handle_asset_paths:
+        unreal.log("Ftrack: Re-import: no handles.")
+        return None
+
+    job = HandleImportJob(len(handle_asset_paths))
+    start_shared_session_warmup()
+    results = _read_handles(handle_asset_paths)
+    _pin_level_components()
+    job.stage = "resolving"
+    ftrack_game_thread.hold()
+
+    def _finish():
+        try:
+            job.stage = "importing"
+            changed = []
+            for r in results:
+                if r["error"]:
+                    continue
+                entry = manifest.get(r["handle"])
+                if not force and r["reimport_reason"] is None:
+                    if not _missing_imported_objects(entry):
+                        continue
+                    r["reimport_reason"] = "imported assets missing"
+                elif force and r["reimport_reason"] is None:
+                    r["reimport_reason"] = "forced"
+                objects = (entry or {}).get("imported_object_paths") or []
+                if len(objects) == 1 and entry.get("destination") == r["destination"]:
+                    r["destination_name"] = objects[0].rsplit("/", 1)[-1].split(".", 1)[0]
+                changed.append(r)
+            if changed:
+                _submit_imports(changed, replace_existing=True, automated=True)
+            errors = [r for r in results if r["error"]]
+            for r in results:
+                if r["error"] and r not in changed:
+                    unreal.log_warning("Ftrack: %s: %s" % (r["handle"], r["error"]))
+            for r in changed:
+                if not r["error"]:
+                    unreal.log("Ftrack:   re-imported %s (%s)" % (r["handle"], r["reimport_reason"]))
+            unreal.log("Ftrack: Re-import: %s handle(s) checked, %s changed, %s unchanged, %s error(s)." % (
+                len(results), len(changed), len([r for r in results if r not in changed and not r["error"]]), len(errors)))
+            job.stage = "done"
+            job.future.set_result(results)
+            if on_done:
+                on_done(results)
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+            unreal.log_error("Ftrack: reimport_handles_async failed: %s" % e)
+        finally:
+            ftrack_game_thread.release()
+
+    def _resolve():
+        try:
+            _resolve_results(results, executor=_get_resolve_executor())
+        except Exception as e:
+            for r in results:
+                if not r["error"] and not r["path"]:
+                    r["error"] = "Could not resolve components: %s" % e
+        try:
+            with span("import.classify_reimports"):
+                _classify_reimports(results)
+        except Exception as e:
+            # Unclassified results must not pass for unchanged ones.
+            for r in results:
+                if not r["error"] and r["path"] and r["reimport_reason"] is None:
+                    r["error"] = "Could not check for changes: %s" % e
+        try:
+            _prefetch_results(results, only=lambda r: force or r["reimport_reason"] is not None)
+        except Exception as e:
+            _log_on_game_thread(unreal.log_warning, "Ftrack: Prefetch failed, importing from resolved paths: %s" % e)
+        ftrack_game_thread.run_on_game_thread(_finish)
+
+    threading.Thread(target=_resolve, name="MroyaFtrackReimport", daemon=True).start()
+    return job
+
+
+def _new_import_task(
+    file_path: str,
+    destination_path: str,
+    destination_name: str = "",
+    *,
+    automated: bool = False,
+    replace_existing: bool = False,
+    preset: str | None = None,
+):
+    """AssetImportTask for one file. Automated tasks get their options from the matching import preset."""
+    task = unreal.AssetImportTask()
+    task.filename = os.path.abspath(file_path)
+    task.destination_path = destination_path
+    task.destination_name = destination_name or ""
+    task.automated = automated  # False: show import options dialog
+    task.save = True
+    task.replace_existing = replace_existing
+    if automated:
+        from ftrack_import_presets import apply_preset
+        apply_preset(task, file_path, preset)
+    return task
+
+
+class _ImportEventTimes:
+    """Collects (time, object path) for each asset the ImportSubsystem reports as imported (editor only)."""
+
+    def __init__(self):
+        self.events = []
+        self._subsystem = None
+
+        def _on_post_import(factory, created_object):
+            try:
+                self.events.append((time.perf_counter(), created_object.get_path_name()))
+            except Exception:
+                pass
+
+        self._callback = _on_post_import
+
+    def __enter__(self):
+        try:
+            self._subsystem = unreal.get_editor_subsystem(unreal.ImportSubsystem)
+            self._subsystem.on_asset_post_import.add_callable(self._callback)
+        except Exception:
+            self._subsystem = None
+        return self
+
+    def __exit__(self, *exc):
+        if self._subsystem is not None:
+            try:
+                self._subsystem.on_asset_post_import.remove_callable(self._callback)
+            except Exception:
+                pass
+        return False
+
+
+def _per_file_seconds(items: list, events: list, batch_seconds: float) -> None:
+    """Set "seconds" and "timing" on each submitted item of one import batch.
+
+    Tasks run one after another inside import_asset_tasks, so a file's time is measured from the
+    previous file's last post-import event to its own last one ("measured"). Without any events
+    (e.g. an importer that does not broadcast them) the batch time is split by file size ("estimated").
+    """
+    submitted = [it for it in items if it.get("_task") is not None]
+    if not submitted:
+        return
+    last_seen = {}
+    for t, path in events:
+        last_seen[path] = t
+    if last_seen:
+        previous = submitted[0]["_batch_start"]
+        for it in submitted:
+            ends = [last_seen[p] for p in it["imported_object_paths"] if p in last_seen]
+            if ends:
+                end = max(ends)
+                it["seconds"], it["timing"] = end - previous, "measured"
+                previous = end
+        return
+    sizes = [it.get("size") or 0 for it in submitted]
+    total = sum(sizes)
+    for it, size in zip(submitted, sizes):
+        share = size / total if total else 1.0 / len(submitted)
+        it["seconds"], it["timing"] = batch_seconds * share, "estimated"
+
+
+@traced("import.automated_batch")
+def import_files_automated(items: list, *, replace_existing: bool = False, log_errors: bool = True) -> list:
+    """Import files unattended, all in one import_asset_tasks batch, with per-file results.
+
+    items: dicts with "path", "destination" (/Game/...) and optional "destination_name" and "preset"
+    (otherwise chosen by ftrack_import_presets rules). No dialogs and no Slate tick needed, so this
+    also works in headless editor runs (-run=pythonscript / -ExecutePythonScript).
+    Returns one dict per item: path, destination, preset, size, imported_object_paths, seconds,
+    timing ("measured" from import events, "estimated" from the batch time by size, or None) and
+    error. Logs a summary, and per-file errors unless log_errors=False.
+    """
+    if unreal is None:
+        return []
+    results = []
+    for item in items:
+        r = {
+            "path": item.get("path"),
+            "destination": item.get("destination") or _content_destination(None),
+            "preset": None,
+            "size": None,
+            "imported_object_paths": [],
+            "seconds": None,
+            "timing": None,
+            "error": None,
+            "_task": None,
+        }
+        results.append(r)
+        path = r["path"]
+        if not path or not os.path.isfile(path):
+            r["error"] = "File not found: %s" % path
+            continue
+        try:
+            from ftrack_import_presets import choose_preset
+            r["preset"] = item.get("preset") or choose_preset(path)
+            r["size"] = os.path.getsize(path)
+            r["_task"] = _new_import_task(
+                path, r["destination"], item.get("destination_name") or "",
+                automated=True, replace_existing=replace_existing, preset=r["preset"],
+            )
+        except Exception as e:
+            r["error"] = "Could not prepare import: %s" % e
+
+    tasks = [r["_task"] for r in results if r["_task"] is not None]
+    batch_seconds = 0.0
+    if tasks:
+        t0 = time.perf_counter()
+        for r in results:
+            r["_batch_start"] = t0
+        with _ImportEventTimes() as times, span("import.import_asset_tasks", tasks=len(tasks), automated=True):
+            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
+        batch_seconds = time.perf_counter() - t0
+        for r in results:
+            if r["_task"] is None:
+                continue
+            r["imported_object_paths"] = [str(p) for p in (r["_task"].imported_object_paths or [])]
+            if not r["imported_object_paths"]:
+                r["error"] = "Importer produced no assets."
+        _per_file_seconds(results, times.events, batch_seconds)
+    for r in results:
+        r.pop("_task", None)
+        r.pop("_batch_start", None)
+    ok = sum(1 for r in results if not r["error"])
+    unreal.log("Ftrack: Automated import: %s/%s file(s) imported in one batch, %.2fs." % (ok, len(results), batch_seconds))
+    if log_errors:
+        for r in results:
+            if r["error"]:
+                unreal.log_warning("Ftrack:   %s: %s" % (r["path"], r["error"]))
+    return results
+
+
+def _import_paths_with_tasks(
+    paths: list,
+    destination_path: str,
+    *,
+    replace_existing: bool = False,
+    automated: bool = False,
+    destination_names: list | None = None,
+) -> list:
+    """Run one import_asset_tasks batch; returns the AssetImportTask per path (None for skipped paths).
+
+    destination_names (one per path, "" = from file name) lets re-import target the existing asset.
+    automated=True applies the import preset for each file (ftrack_import_presets) instead of the dialog.
+    """
     t0 = time.perf_counter()
-    destination_path = "/Game/FtrackImport"
-    if content_subpath and content_subpath.strip():
-        sub = content_subpath.strip().strip("/").replace("\\", "/")
-        if sub:
-            destination_path = "/Game/" + sub
     unreal.log("Ftrack: Import starting for %s -> %s" % (paths[0][:80] + "..." if len(paths[0]) > 80 else paths[0], destination_path))
     asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
     tasks = []
-    for file_path in paths:
+    for i, file_path in enumerate(paths):
         if not file_path or not os.path.isfile(file_path):
             unreal.log_warning("Ftrack: Skip missing path: %s" % file_path)
+            tasks.append(None)
             continue
-        task = unreal.AssetImportTask()
-        task.filename = os.path.abspath(file_path)
-        task.destination_path = destination_path
-        task.destination_name = ""
-        task.automated = False  # show import options dialog
-        task.save = True
-        task.replace_existing = False
-        tasks.append(task)
-    if not tasks:
-        return 0
+        tasks.append(_new_import_task(
+            file_path,
+            destination_path,
+            destination_names[i] if destination_names else "",
+            automated=automated,
+            replace_existing=replace_existing,
+        ))
+    submitted = [t for t in tasks if t is not None]
+    if not submitted:
+        return tasks
     t_before = time.perf_counter()
-    asset_tools.import_asset_tasks(tasks)
+    with span("import.import_asset_tasks", destination=destination_path, tasks=len(submitted)):
+        asset_tools.import_asset_tasks(submitted)
     t_after = time.perf_counter()
     unreal.log("Ftrack: import_asset_tasks took %.2fs" % (t_after - t_before))
-    imported = sum(1 for t in tasks if t.imported_object_paths)
+    imported = sum(1 for t in submitted if t.imported_object_paths)
     unreal.log("Ftrack: Imported %s asset(s) to %s. Total %.2fs." % (imported, destination_path, time.perf_counter() - t0))
-    return imported
+    return tasks
+
+
+def import_paths_into_unreal(paths: list, content_subpath: str | None = None, automated: bool = False) -> int:
+    """Import given file paths into Unreal. Destination: /Game/{content_subpath} or /Game/FtrackImport if not set.
+
+    automated=True skips the options dialog and uses import presets (one batch, see import_files_automated).
+    """
+    if unreal is None:
+        return 0
+    if not paths:
+        return 0
+    destination = _content_destination(content_subpath)
+    if automated:
+        results = import_files_automated([{"path": p, "destination": destination} for p in paths])
+        return sum(1 for r in results if r["imported_object_paths"])
+    tasks = _import_paths_with_tasks(paths, destination)
+    return sum(1 for t in tasks if t is not None and t.imported_object_paths)
 
 
 def _open_browser_inprocess() -> None:
@@ -193,28 +974,108 @@ def _open_browser_inprocess() -> None:
             print("Ftrack: Failed to open browser: %s" % e, file=sys.stderr)
 
 
+_session_future = None
+_session_future_lock = threading.Lock()
+
+
+def _log_now(log_fn, msg: str) -> None:
+    """Log directly (caller is on the game thread)."""
+    log_fn(msg)
+
+
+def _log_on_game_thread(log_fn, msg: str) -> None:
+    """Log from a worker thread via the Slate tick queue (caller holds ftrack_game_thread)."""
+    import ftrack_game_thread
+    ftrack_game_thread.run_on_game_thread(log_fn, msg)
+
+
 def _warm_shared_session() -> None:
-    """Bootstrap mroya paths and create shared session early so browser/Import are fast."""
-    if not _bootstrap_mroya():
-        return
+    """Bootstrap mroya paths and create the shared session (runs on the warmup thread)."""
+    import ftrack_game_thread
+
+    session = None
     try:
-        from ftrack_inout.common.session_factory import get_shared_session
-        session = get_shared_session()
+        if not _bootstrap_mroya():
+            return
+        with span("startup.warm_shared_session"):
+            from ftrack_inout.common.session_factory import get_shared_session
+            session = get_shared_session()
         if unreal:
             if session:
-                unreal.log("Ftrack: Shared session ready.")
+                _log_on_game_thread(unreal.log, "Ftrack: Shared session ready.")
             else:
-                unreal.log_warning("Ftrack: Shared session creation returned None (check FTRACK_* env).")
+                _log_on_game_thread(unreal.log_warning, "Ftrack: Shared session creation returned None (check FTRACK_* env).")
     except Exception as e:
         if unreal:
-            unreal.log_warning("Ftrack: Could not warm shared session: %s" % e)
+            _log_on_game_thread(unreal.log_warning, "Ftrack: Could not warm shared session: %s" % e)
+    finally:
+        _session_future.set_result(session)
+        ftrack_game_thread.run_on_game_thread(ftrack_game_thread.release)
+
+
+def start_shared_session_warmup() -> Future:
+    """Start creating the shared session on a background thread (once; call on the game thread).
+
+    Returns a future that resolves to the session (or None if it could not be created).
+    """
+    global _session_future
+    import ftrack_game_thread
+
+    with _session_future_lock:
+        if _session_future is None:
+            _session_future = Future()
+            ftrack_game_thread.hold()
+            threading.Thread(target=_warm_shared_session, name="MroyaFtrackSessionWarmup", daemon=True).start()
+        return _session_future
+
+
+def shared_session_ready() -> bool:
+    """True once warmup has finished (successfully or not)."""
+    return _session_future is not None and _session_future.done()
+
 
+def wait_for_shared_session(timeout: float | None = None):
+    """Return the shared session, starting warmup if needed and blocking until it finishes.
 
+    Returns None if the session could not be created or timeout expired.
+    """
+    future = _session_future if _session_future is not None else start_shared_session_warmup()
+    try:
+        session = future.result(timeout=timeout)
+    except Exception:
+        return None
+    if session is None:
+        # Warmup failed (server down, env not set yet): retry once inline, as callers did before warmup existed.
+        try:
+            if _bootstrap_mroya():
+                from ftrack_inout.common.session_factory import get_shared_session
+                session = get_shared_session()
+        except Exception:
+            session = None
+    return session
+
+
+def _schedule_browser_prewarm() -> None:
+    """Opt-in (MROYA_FTRACK_PREWARM_BROWSER=1): build the browser hidden during idle ticks after startup."""
+    if os.environ.get("MROYA_FTRACK_PREWARM_BROWSER", "").strip().lower() not in ("1", "true", "yes", "on"):
+        return
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    if this_dir not in sys.path:
+        sys.path.insert(0, this_dir)
+    try:
+        import open_browser_inprocess
+        if open_browser_inprocess.schedule_browser_prewarm():
+            unreal.log("Ftrack: Browser prewarm scheduled.")
+    except Exception as e:
+        unreal.log_warning("Ftrack: Could not schedule browser prewarm: %s" % e)
+
+
+@traced("init_ftrack_menu.register_ftrack_menu")
 def register_ftrack_menu() -> None:
     """Add Ftrack menu to the Level Editor main menu."""
     if unreal is None:
         return
-    _warm_shared_session()
+    start_shared_session_warmup()
     menus = unreal.ToolMenus.get()
     main_menu = menus.find_menu("LevelEditor.MainMenu")
     if not main_menu:
@@ -248,12 +1109,38 @@ def register_ftrack_menu() -> None:
         script_object=OpenBrowserEntryScript(),
     )
 
+    @unreal.uclass()
+    class ExportPublishJobsEntryScript(unreal.ToolMenuEntryScript):
+        @unreal.ufunction(override=True)
+        def get_label(self, context):
+            return "Export publish jobs"
+
+        @unreal.ufunction(override=True)
+        def get_tool_tip(self, context):
+            return "Write every Ftrack Out Handle in /Game as a publish job (JSON Lines) to Saved/MroyaFtrack/publish_spool."
+
+        @unreal.ufunction(override=True)
+        def execute(self, context):
+            from ftrack_out_handle import export_all_publish_jobs
+            export_all_publish_jobs()
+
+    entry_export = unreal.ToolMenuEntry(
+        name="FtrackExportPublishJobs",
+        type=unreal.MultiBlockType.MENU_ENTRY,
+        script_object=ExportPublishJobsEntryScript(),
+    )
+
     ftrack_menu.add_menu_entry("FtrackActions", entry_open)
+    ftrack_menu.add_menu_entry("FtrackActions", entry_export)
     menus.refresh_all_widgets()
-    unreal.log("Ftrack: Menu registered (Ftrack -> Open browser).")
+    unreal.log("Ftrack: Menu registered (Ftrack -> Open browser, Export publish jobs).")
+    _schedule_browser_prewarm()
 
 
-if __name__ == "__main__":
-    register_ftrack_menu()
-else:
+def _headless() -> bool:
+    """True for batch runs (ftrack_batch_cli), which import this module only for its import functions."""
+    return os.environ.get("MROYA_FTRACK_HEADLESS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+if not _headless():
     register_ftrack_menu()
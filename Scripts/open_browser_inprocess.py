@@ -21,6 +21,8 @@ except ImportError:
     QApplication = None  # type: ignore[assignment]
     QWidget = None  # type: ignore[assignment]
 
+from ftrack_trace import span, traced
+
 # Resolve plugin root (this file is in PluginRoot/Scripts/)
 _THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 _PLUGIN_ROOT = os.path.dirname(_THIS_DIR)
@@ -64,6 +66,7 @@ def _bring_browser_to_front(w) -> None:
         pass
 
 
+@traced("open_browser_inprocess._bootstrap_paths")
 def _bootstrap_paths() -> bool:
     """Add mroya and plugin paths to sys.path. Returns True if mroya root is set."""
     mroya_root = os.environ.get("MROYA_FTRACK_CONNECT", "").strip()
@@ -99,58 +102,47 @@ def _bootstrap_paths() -> bool:
     return True
 
 
-class _UnrealStderrWrapper:
-    """Send stderr to unreal.log() so Unreal does not show it as LogPython: Error."""
-
-    def __init__(self, unreal_module):
-        self._unreal = unreal_module
-
-    def write(self, msg):
-        if msg and msg.strip():
-            self._unreal.log(msg.rstrip())
-
-    def flush(self):
-        pass
-
-    def writable(self):
-        return True
-
-
-class _UnrealLogHandler(logging.Handler):
-    """Send Python logging to Unreal: INFO/DEBUG -> log(), WARNING -> log_warning(), ERROR+ -> log_error()."""
-
-    def __init__(self, unreal_module):
-        super().__init__()
-        self._unreal = unreal_module
-
-    def emit(self, record):
+def _handle_callbacks():
+    """Browser Import callbacks: (one component -> handle path, list of components -> list of handle paths)."""
+    try:
+        import init_ftrack_menu as _menu
+    except Exception:
+        return None, None
+    _create_handle = getattr(_menu, "create_ftrack_handle", None)
+    _create_handles = getattr(_menu, "create_ftrack_handles", None)
+    single = batch = None
+    if _create_handle:
+        def single(component_id, content_subpath=None, asset_version_id=None):
+            return _create_handle(component_id, content_subpath=content_subpath, asset_version_id=asset_version_id)
+    if _create_handles:
+        def batch(entries):
+            # entries: dicts (component_id, content_subpath, asset_version_id) or tuples in that order.
+            return _create_handles(list(entries))["paths"]
+    return single, batch
+
+
+def _new_browser(browser_cls, on_create_handle, on_create_handles):
+    """Create FtrackBrowser, handing over the batch callback when the browser version accepts it."""
+    if on_create_handles is not None:
         try:
-            msg = self.format(record)
-            if record.levelno >= logging.ERROR:
-                self._unreal.log_error(msg)
-            elif record.levelno >= logging.WARNING:
-                self._unreal.log_warning(msg)
-            else:
-                self._unreal.log(msg)
-        except Exception:
-            self.handleError(record)
+            return browser_cls(on_create_handle=on_create_handle, on_create_handles=on_create_handles, dcc="unreal")
+        except TypeError as e:
+            if "on_create_handles" not in str(e):
+                raise
+    return browser_cls(on_create_handle=on_create_handle, dcc="unreal")
 
 
-def open_browser() -> None:
-    """Run bootstrap, then create and show FtrackBrowser in-process with unreal_qt."""
-    global _browser_widget_ref
-    if not _bootstrap_paths():
-        try:
-            import unreal
-            unreal.log_warning(
-                "Ftrack (in-process): MROYA_FTRACK_CONNECT is not set or not a valid directory. "
-                "Set it to the mroya root (e.g. G:\\mroya)."
-            )
-        except ImportError:
-            print("Ftrack: MROYA_FTRACK_CONNECT not set or invalid.", file=sys.stderr)
-        return
+def _log_error(msg: str, fallback: str | None = None) -> None:
+    try:
+        import unreal
+        unreal.log_error(msg)
+    except ImportError:
+        print(fallback or msg, file=sys.stderr)
 
-    # Load credentials: Ftrack Connect config.json first, then .env
+
+@traced("browser.load_credentials")
+def _load_credentials() -> None:
+    """Load credentials: Ftrack Connect config.json first, then .env"""
     try:
         from pathlib import Path
         from ftrack_inout.common.credentials_loader import load_ftrack_credentials_into_env
@@ -164,52 +156,67 @@ def open_browser() -> None:
         if mroya_root:
             _load_dotenv(os.path.join(mroya_root, "config", ".env"))
 
+
+def _setup_unreal_qt() -> bool:
     # dependencies/ relative to plugin root (works with symlink: project points to dev folder)
-    deps_dir = os.path.join(_PLUGIN_ROOT, "dependencies")
     try:
-        import unreal_qt
-        unreal_qt.setup()
+        with span("browser.unreal_qt_setup"):
+            import unreal_qt
+            unreal_qt.setup()
     except ImportError:
-        try:
-            import unreal
-            unreal.log_error(
-                "Ftrack (in-process): unreal_qt not found. "
-                "From plugin root run: py -3.11 -m pip install -r requirements.txt -t dependencies"
-            )
-        except ImportError:
-            print("Ftrack: unreal_qt not found. From plugin root run: pip install -r requirements.txt -t dependencies", file=sys.stderr)
-        return
+        _log_error(
+            "Ftrack (in-process): unreal_qt not found. "
+            "From plugin root run: py -3.11 -m pip install -r requirements.txt -t dependencies",
+            "Ftrack: unreal_qt not found. From plugin root run: pip install -r requirements.txt -t dependencies",
+        )
+        return False
     except Exception as e:
-        try:
-            import unreal
-            unreal.log_error("Ftrack (in-process): unreal_qt setup failed: %s" % e)
-        except ImportError:
-            print("Ftrack: unreal_qt setup failed: %s" % e, file=sys.stderr)
-        return
+        _log_error("Ftrack (in-process): unreal_qt setup failed: %s" % e, "Ftrack: unreal_qt setup failed: %s" % e)
+        return False
+    return True
+
+
+def _route_logging_to_unreal() -> None:
+    """Route Python logging to Unreal (INFO -> log, WARNING -> log_warning, ERROR -> log_error).
+
+    Records are queued (safe from any thread) and forwarded in batches on Slate tick; see ftrack_log_bridge.
+    """
+    try:
+        import unreal
+        from ftrack_log_bridge import install_root_handler
+        install_root_handler(unreal)
+    except Exception:
+        pass
+
 
-    # Route Python logging to Unreal (INFO -> log, WARNING -> log_warning, ERROR -> log_error).
+def _redirect_stderr() -> None:
+    """While the browser is shown, send stderr to unreal.log() so any remaining logging to stderr
+    (e.g. from ftrack loggers created later) does not show as LogPython: Error. Output is line-buffered;
+    the original stream comes back when the browser closes (_restore_stderr)."""
     try:
         import unreal
-        _root = logging.getLogger()
-        for h in _root.handlers[:]:
-            _root.removeHandler(h)
-        _root.addHandler(_UnrealLogHandler(unreal))
-        _root.setLevel(logging.DEBUG)
-        # Redirect stderr to unreal.log() so any remaining logging to stderr
-        # (e.g. from ftrack loggers created later) does not show as LogPython: Error.
-        sys.stderr = _UnrealStderrWrapper(unreal)
+        from ftrack_log_bridge import redirect_stderr
+        redirect_stderr(unreal)
+    except Exception:
+        pass
+
+
+def _restore_stderr() -> None:
+    try:
+        from ftrack_log_bridge import restore_stderr
+        restore_stderr()
     except Exception:
         pass
 
+
+@traced("browser.import_ftrack_browser")
+def _import_browser_class():
+    """Import FtrackBrowser and detach ftrack loggers from stderr. Returns the class or None."""
     try:
         from ftrack_inout.browser import FtrackBrowser
     except ImportError as e:
-        try:
-            import unreal
-            unreal.log_error("Ftrack (in-process): Failed to import FtrackBrowser: %s" % e)
-        except ImportError:
-            print("Ftrack: Failed to import FtrackBrowser: %s" % e, file=sys.stderr)
-        return
+        _log_error("Ftrack (in-process): Failed to import FtrackBrowser: %s" % e, "Ftrack: Failed to import FtrackBrowser: %s" % e)
+        return None
 
     # Remove handlers from ftrack loggers so they don't write to stderr (Unreal shows as Error).
     try:
@@ -219,131 +226,325 @@ def open_browser() -> None:
                     _logger.removeHandler(_h)
     except Exception:
         pass
+    return FtrackBrowser
+
+
+def _live_browser_widget():
+    """Return _browser_widget_ref if the Qt object is still alive, else clear it and return None."""
+    global _browser_widget_ref
+    w = _browser_widget_ref
+    if w is None:
+        return None
+    try:
+        _ = w.isVisible()
+    except RuntimeError:
+        _browser_widget_ref = None
+        return None
+    return w
+
+
+@traced("browser.show_existing")
+def _show_existing_browser() -> bool:
+    """Show/raise the kept browser widget (open or prewarmed hidden). Returns False if there is none."""
+    global _browser_widget_ref
+    w = _live_browser_widget()
+    if w is None:
+        return False
+    try:
+        was_visible = w.isVisible()
+        _redirect_stderr()
+        if QtCore is not None and hasattr(w, "isMinimized") and w.isMinimized():
+            w.showNormal()
+        w.show()
+        w.raise_()
+        w.activateWindow()
+        if QApplication is not None:
+            app = QApplication.instance()
+            if app is not None:
+                app.processEvents()
+        if QtCore is not None:
+            QTimer = getattr(QtCore, "QTimer", None)
+            if QTimer is not None:
+                QTimer.singleShot(250, lambda: _bring_browser_to_front(w))
+        try:
+            import unreal
+            if was_visible:
+                unreal.log("Ftrack: Browser already open, brought to front.")
+            else:
+                unreal.log("Ftrack: Browser opened in-process.")
+        except ImportError:
+            pass
+        return True
+    except RuntimeError:
+        _browser_widget_ref = None
+    except Exception:
+        _browser_widget_ref = None
+    return False
+
 
+@traced("browser.build_widget")
+def _build_browser_widget(browser_cls):
+    """Create FtrackBrowser, parent it to the editor with unreal_qt and size it, without showing it.
+
+    Raises TypeError if the browser does not accept on_create_handle (too old).
+    """
+    global _browser_widget_ref
     # Unreal: "Create Ftrack Handle" mode - browser Import button creates a handle; real import is in Ftrack Resources Control.
-    _create_handle_callback = None
+    _create_handle_callback, _create_handles_callback = _handle_callbacks()
+
+    # The session is warmed on a background thread at startup; wait for it here (the browser needs it)
+    # so the browser reuses it instead of creating a second one.
     try:
         import init_ftrack_menu as _menu
-        _create_handle = getattr(_menu, "create_ftrack_handle", None)
-        if _create_handle:
-            def _create_handle_callback(component_id, content_subpath=None, asset_version_id=None):
-                return _create_handle(component_id, content_subpath=content_subpath, asset_version_id=asset_version_id)
+        with span("browser.wait_for_session"):
+            _menu.wait_for_shared_session()
     except Exception:
         pass
 
-    # Reuse existing browser window only if the widget is still valid (not destroyed by another panel/focus).
-    if _browser_widget_ref is not None:
-        w = _browser_widget_ref
+    # Explicitly pass DCC identifier so browser can apply Unreal-specific behavior and filters.
+    with span("browser.construct"):
+        widget = _new_browser(browser_cls, _create_handle_callback, _create_handles_callback)
+    _browser_widget_ref = widget  # keep reference so widget is not GC'd when we return
+    try:
+        import unreal_qt as _uq
+        if hasattr(_uq, "exclude_from_parenting"):
+            _uq.exclude_from_parenting(widget)
+    except Exception:
+        pass
+    # unreal_qt.wrap() parents the widget to Unreal's window. It may do widget.close.connect(...).
+    # In PySide6 QWidget has no close signal, so add one and emit it from closeEvent.
+    if QtCore is not None and QWidget is not None:
         try:
-            _ = w.isVisible()
-        except RuntimeError:
-            w = None
-            _browser_widget_ref = None
-        if w is not None:
-            try:
-                if QtCore is not None and hasattr(w, "isMinimized") and w.isMinimized():
-                    w.showNormal()
-                w.show()
-                w.raise_()
-                w.activateWindow()
-                if QApplication is not None:
-                    app = QApplication.instance()
-                    if app is not None:
-                        app.processEvents()
-                if QtCore is not None:
-                    QTimer = getattr(QtCore, "QTimer", None)
-                    if QTimer is not None:
-                        QTimer.singleShot(250, lambda: _bring_browser_to_front(w))
-                try:
-                    import unreal
-                    unreal.log("Ftrack: Browser already open, brought to front.")
-                except ImportError:
-                    pass
-                return
-            except RuntimeError:
-                _browser_widget_ref = None
-            except Exception:
-                _browser_widget_ref = None
+            class _CloseSignalHolder(QtCore.QObject):
+                close = QtCore.Signal()
+
+            _holder = _CloseSignalHolder(widget)
+            _original_close_event = widget.closeEvent
 
+            def _close_event(event):
+                _holder.close.emit()
+                if _original_close_event:
+                    _original_close_event(event)
+                _restore_stderr()
+
+            widget.closeEvent = _close_event
+            widget.close = _holder.close  # so unreal_qt.wrap() can widget.close.connect(...)
+        except Exception:
+            pass
     try:
-        # Explicitly pass DCC identifier so browser can apply Unreal-specific behavior and filters.
-        widget = FtrackBrowser(on_create_handle=_create_handle_callback, dcc="unreal")
-        _browser_widget_ref = widget  # keep reference so widget is not GC'd when we return
+        import unreal_qt as _uq
+        _uq.wrap(widget)
+    except (AttributeError, TypeError, Exception):
+        pass
+    if QtCore is not None:
         try:
-            import unreal_qt as _uq
-            if hasattr(_uq, "exclude_from_parenting"):
-                _uq.exclude_from_parenting(widget)
+            widget.setWindowFlags(widget.windowFlags() | QtCore.Qt.Window)
+            widget.setMinimumSize(900, 600)
+            widget.resize(1000, 700)
         except Exception:
             pass
-        # unreal_qt.wrap() parents the widget to Unreal's window. It may do widget.close.connect(...).
-        # In PySide6 QWidget has no close signal, so add one and emit it from closeEvent.
-        if QtCore is not None and QWidget is not None:
-            try:
-                class _CloseSignalHolder(QtCore.QObject):
-                    close = QtCore.Signal()
-
-                _holder = _CloseSignalHolder(widget)
-                _original_close_event = widget.closeEvent
+    return widget
 
-                def _close_event(event):
-                    _holder.close.emit()
-                    if _original_close_event:
-                        _original_close_event(event)
 
-                widget.closeEvent = _close_event
-                widget.close = _holder.close  # so unreal_qt.wrap() can widget.close.connect(...)
-            except Exception:
-                pass
+@traced("browser.show_and_raise")
+def _show_new_browser(widget) -> None:
+    _redirect_stderr()
+    widget.show()
+    if QtCore is not None:
+        try:
+            widget.raise_()
+            widget.activateWindow()
+        except Exception:
+            pass
+    # Force Qt to process show/raise so the window is visible before the menu callback returns.
+    if QApplication is not None:
         try:
-            import unreal_qt as _uq
-            _uq.wrap(widget)
-        except (AttributeError, TypeError, Exception):
+            app = QApplication.instance()
+            if app is not None:
+                app.processEvents()
+        except Exception:
             pass
-        if QtCore is not None:
-            try:
-                widget.setWindowFlags(widget.windowFlags() | QtCore.Qt.Window)
-                widget.setMinimumSize(900, 600)
-                widget.resize(1000, 700)
-            except Exception:
-                pass
-        widget.show()
-        if QtCore is not None:
-            try:
-                widget.raise_()
-                widget.activateWindow()
-            except Exception:
-                pass
-        # Force Qt to process show/raise so the window is visible before the menu callback returns.
-        if QApplication is not None:
-            try:
-                app = QApplication.instance()
-                if app is not None:
-                    app.processEvents()
-            except Exception:
-                pass
+    try:
+        import unreal
+        unreal.log("Ftrack: Browser opened in-process.")
+    except ImportError:
+        pass
+
+
+def _log_browser_too_old(e: TypeError) -> None:
+    if "on_create_handle" in str(e):
+        _log_error(
+            "Ftrack (in-process): Browser version is too old. "
+            "Update mroya ftrack_plugins (browser) to a version that supports on_create_handle.",
+            "Ftrack: Update mroya ftrack_plugins browser (on_create_handle not supported).",
+        )
+    else:
+        raise e
+
+
+@traced("open_browser")
+def open_browser() -> None:
+    """Run bootstrap, then create and show FtrackBrowser in-process with unreal_qt.
+
+    If the browser already exists (open, or built hidden by schedule_browser_prewarm), only show/raise it.
+    """
+    # Reuse existing browser window only if the widget is still valid (not destroyed by another panel/focus).
+    if _show_existing_browser():
+        return
+    if not _bootstrap_paths():
         try:
             import unreal
-            unreal.log("Ftrack: Browser opened in-process.")
+            unreal.log_warning(
+                "Ftrack (in-process): MROYA_FTRACK_CONNECT is not set or not a valid directory. "
+                "Set it to the mroya root (e.g. G:\\mroya)."
+            )
         except ImportError:
-            pass
+            print("Ftrack: MROYA_FTRACK_CONNECT not set or invalid.", file=sys.stderr)
+        return
+
+    _load_credentials()
+    if not _setup_unreal_qt():
+        return
+    _route_logging_to_unreal()
+    browser_cls = _import_browser_class()
+    if browser_cls is None:
+        return
+
+    try:
+        widget = _build_browser_widget(browser_cls)
+        _show_new_browser(widget)
     except TypeError as e:
-        if "on_create_handle" in str(e):
-            try:
-                import unreal
-                unreal.log_error(
-                    "Ftrack (in-process): Browser version is too old. "
-                    "Update mroya ftrack_plugins (browser) to a version that supports on_create_handle."
-                )
-            except ImportError:
-                print("Ftrack: Update mroya ftrack_plugins browser (on_create_handle not supported).", file=sys.stderr)
-        else:
-            raise
+        _log_browser_too_old(e)
+    except Exception as e:
+        _log_error("Ftrack (in-process): Failed to show browser: %s" % e, "Ftrack: Failed to show browser: %s" % e)
+
+
+# Opt-in prewarm: build the browser hidden during editor idle ticks so the first open is only show/raise.
+_PREWARM_ENV = "MROYA_FTRACK_PREWARM_BROWSER"
+_PREWARM_DELAY_ENV = "MROYA_FTRACK_PREWARM_DELAY"
+_PREWARM_DEFAULT_DELAY = 10.0
+# A tick longer than this means the editor is busy (shader compilation, asset loading, PIE startup).
+_PREWARM_BUSY_FRAME_SECONDS = 0.1
+# Consecutive short ticks required before each prewarm stage runs.
+_PREWARM_IDLE_TICKS = 30
+
+_prewarm_state = None
+
+
+def prewarm_enabled() -> bool:
+    return os.environ.get(_PREWARM_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _prewarm_stage_env() -> bool:
+    if not _bootstrap_paths():
+        return False
+    _load_credentials()
+    return True
+
+
+def _prewarm_stage_qt() -> bool:
+    if not _setup_unreal_qt():
+        return False
+    _route_logging_to_unreal()
+    return True
+
+
+def _prewarm_stage_import() -> bool:
+    _prewarm_state["browser_cls"] = _import_browser_class()
+    return _prewarm_state["browser_cls"] is not None
+
+
+def _prewarm_stage_build() -> bool | None:
+    if _live_browser_widget() is not None:
+        return True  # opened by the user meanwhile
+    try:
+        import init_ftrack_menu as _menu
+        if not _menu.shared_session_ready():
+            return None  # not ready yet: retry on a later idle window instead of blocking the tick
+    except Exception:
+        pass
+    try:
+        _build_browser_widget(_prewarm_state["browser_cls"])
+    except TypeError as e:
+        _log_browser_too_old(e)
+        return False
+    try:
+        import unreal
+        unreal.log("Ftrack: Browser prewarmed (hidden).")
+    except ImportError:
+        pass
+    return True
+
+
+_PREWARM_STAGES = (_prewarm_stage_env, _prewarm_stage_qt, _prewarm_stage_import, _prewarm_stage_build)
+
+
+def _stop_prewarm() -> None:
+    global _prewarm_state
+    if _prewarm_state is None:
+        return
+    try:
+        import unreal
+        unreal.unregister_slate_post_tick_callback(_prewarm_state["tick_handle"])
+    except Exception:
+        pass
+    _prewarm_state = None
+
+
+def _on_prewarm_tick(delta_seconds):
+    state = _prewarm_state
+    if state is None:
+        return
+    state["elapsed"] += delta_seconds
+    if state["elapsed"] < state["delay"]:
+        return
+    if delta_seconds > _PREWARM_BUSY_FRAME_SECONDS:
+        state["idle_ticks"] = 0  # editor busy: back off
+        return
+    state["idle_ticks"] += 1
+    if state["idle_ticks"] < _PREWARM_IDLE_TICKS:
+        return
+    state["idle_ticks"] = 0
+    if _live_browser_widget() is not None:
+        _stop_prewarm()
+        return
+    try:
+        ok = _PREWARM_STAGES[state["stage"]]()
     except Exception as e:
+        _log_error("Ftrack (in-process): Browser prewarm failed: %s" % e)
+        ok = False
+    if ok is None:
+        return
+    if not ok:
+        _stop_prewarm()
+        return
+    state["stage"] += 1
+    if state["stage"] >= len(_PREWARM_STAGES):
+        _stop_prewarm()
+
+
+def schedule_browser_prewarm(delay_seconds: float | None = None) -> bool:
+    """Build the browser hidden in _browser_widget_ref once the editor has been idle after delay_seconds.
+
+    Stages (paths/credentials, unreal_qt, FtrackBrowser import, widget construction) run one per idle
+    window; long frames reset the idle counter so the work backs off while the editor is busy.
+    delay_seconds defaults to MROYA_FTRACK_PREWARM_DELAY (or 10). Returns True if scheduled.
+    """
+    global _prewarm_state
+    if _prewarm_state is not None or _live_browser_widget() is not None:
+        return False
+    if delay_seconds is None:
         try:
-            import unreal
-            unreal.log_error("Ftrack (in-process): Failed to show browser: %s" % e)
-        except ImportError:
-            print("Ftrack: Failed to show browser: %s" % e, file=sys.stderr)
+            delay_seconds = float(os.environ.get(_PREWARM_DELAY_ENV, "") or _PREWARM_DEFAULT_DELAY)
+        except ValueError:
+            delay_seconds = _PREWARM_DEFAULT_DELAY
+    try:
+        import unreal
+    except ImportError:
+        return False
+    _prewarm_state = {"delay": max(0.0, delay_seconds), "elapsed": 0.0, "idle_ticks": 0, "stage": 0, "browser_cls": None}
+    _prewarm_state["tick_handle"] = unreal.register_slate_post_tick_callback(_on_prewarm_tick)
+    return True
 
 
 def open_browser_embedded(parent_hwnd: int) -> bool:
@@ -367,16 +568,8 @@ def open_browser_embedded(parent_hwnd: int) -> bool:
         unreal_qt.setup()
     except Exception:
         return False
-    try:
-        import unreal
-        _root = logging.getLogger()
-        for h in _root.handlers[:]:
-            _root.removeHandler(h)
-        _root.addHandler(_UnrealLogHandler(unreal))
-        _root.setLevel(logging.DEBUG)
-        sys.stderr = _UnrealStderrWrapper(unreal)
-    except Exception:
-        pass
+    _route_logging_to_unreal()
+    _redirect_stderr()
     try:
         from ftrack_inout.browser import FtrackBrowser
     except ImportError:
@@ -399,18 +592,10 @@ def open_browser_embedded(parent_hwnd: int) -> bool:
         pass
     if QtCore is None or QApplication is None or QWidget is None:
         return False
-    _create_handle_embedded = None
-    try:
-        import init_ftrack_menu as _menu
-        _create_handle = getattr(_menu, "create_ftrack_handle", None)
-        if _create_handle:
-            def _create_handle_embedded(cid, content_subpath=None, asset_version_id=None):
-                return _create_handle(cid, content_subpath=content_subpath, asset_version_id=asset_version_id)
-    except Exception:
-        pass
+    _create_handle_embedded, _create_handles_embedded = _handle_callbacks()
     try:
         # Explicitly pass DCC identifier so browser can apply Unreal-specific behavior and filters.
-        widget = FtrackBrowser(on_create_handle=_create_handle_embedded, dcc="unreal")
+        widget = _new_browser(FtrackBrowser, _create_handle_embedded, _create_handles_embedded)
         _browser_widget_ref = widget
         widget.setWindowFlags(QtCore.Qt.Widget)
         widget.show()
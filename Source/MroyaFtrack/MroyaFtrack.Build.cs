@@ -23,6 +23,7 @@ public class MroyaFtrack : ModuleRules
 			"UnrealEd",
 			"LevelEditor",
 			"AssetRegistry",
+			"Json",
 			"InputCore",
 			"Projects",
 			"ToolMenus",
@@ -1,2 +1,53 @@
 // Copyright Mroya. Ftrack Out Handle.
 #include "FtrackOutHandle.h"
+
+#include "HAL/PlatformAtomics.h"
+
+namespace
+{
+	volatile int64 GFtrackOutHandleGeneration = 0;
+}
+
+void UFtrackOutHandle::BumpEditGeneration()
+{
+	EditGeneration = FPlatformAtomics::InterlockedIncrement(&GFtrackOutHandleGeneration);
+}
+
+void UFtrackOutHandle::PostInitProperties()
+{
+	Super::PostInitProperties();
+	BumpEditGeneration();
+}
+
+void UFtrackOutHandle::PostLoad()
+{
+	Super::PostLoad();
+	BumpEditGeneration();
+}
+
+void UFtrackOutHandle::PostDuplicate(bool bDuplicateForPIE)
+{
+	Super::PostDuplicate(bDuplicateForPIE);
+	BumpEditGeneration();
+}
+
+bool UFtrackOutHandle::Modify(bool bAlwaysMarkDirty)
+{
+	const bool bSavedToTransactionBuffer = Super::Modify(bAlwaysMarkDirty);
+	BumpEditGeneration();
+	return bSavedToTransactionBuffer;
+}
+
+#if WITH_EDITOR
+void UFtrackOutHandle::PostEditChangeProperty(FPropertyChangedEvent& PropertyChangedEvent)
+{
+	Super::PostEditChangeProperty(PropertyChangedEvent);
+	BumpEditGeneration();
+}
+
+void UFtrackOutHandle::PostEditUndo()
+{
+	Super::PostEditUndo();
+	BumpEditGeneration();
+}
+#endif
@@ -0,0 +1,117 @@
+// Copyright Mroya. C++ -> Python command bridge implementation.
+
+#include "FtrackPythonBridge.h"
+#include "Framework/Notifications/NotificationManager.h"
+#include "Widgets/Notifications/SNotificationList.h"
+#include "Interfaces/IPluginManager.h"
+#include "Misc/Paths.h"
+#include "IPythonScriptPlugin.h"
+#include "Serialization/JsonSerializer.h"
+#include "Serialization/JsonWriter.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
+
+#define LOCTEXT_NAMESPACE "FtrackPythonBridge"
+
+// Named (not anonymous) so unity builds do not clash with the panels' local helpers.
+namespace FtrackPythonBridgePrivate
+{
+	bool bBridgeInitialized = false;
+
+	void Notify(const FText& Text, float ExpireDuration)
+	{
+		FNotificationInfo Info(Text);
+		Info.ExpireDuration = ExpireDuration;
+		FSlateNotificationManager::Get().AddNotification(Info);
+	}
+
+	/** Single-quoted Python string literal. */
+	FString QuotePython(const FString& Value)
+	{
+		FString Quoted;
+		Quoted.Reserve(Value.Len() + 4);
+		Quoted += TEXT("'");
+		for (TCHAR c : Value)
+		{
+			if (c == TEXT('\\')) Quoted += TEXT("\\\\");
+			else if (c == TEXT('\'')) Quoted += TEXT("\\'");
+			else if (c == TEXT('\n')) Quoted += TEXT("\\n");
+			else if (c == TEXT('\r')) Quoted += TEXT("\\r");
+			else Quoted += c;
+		}
+		Quoted += TEXT("'");
+		return Quoted;
+	}
+
+	IPythonScriptPlugin* GetPython()
+	{
+		IPythonScriptPlugin* PythonPlugin = IPythonScriptPlugin::Get();
+		if (!PythonPlugin || !PythonPlugin->IsPythonAvailable())
+		{
+			Notify(LOCTEXT("PythonNotAvailable", "Python Editor Script plugin is not available. Enable it in Edit -> Plugins."), 4.0f);
+			return nullptr;
+		}
+		return PythonPlugin;
+	}
+}
+
+bool FtrackPythonBridge::EnsureInitialized()
+{
+	if (FtrackPythonBridgePrivate::bBridgeInitialized) return true;
+	TSharedPtr<IPlugin> Plugin = IPluginManager::Get().FindPlugin(TEXT("MroyaFtrack"));
+	if (!Plugin.IsValid())
+	{
+		FtrackPythonBridgePrivate::Notify(LOCTEXT("PluginNotFound", "MroyaFtrack plugin not found."), 3.0f);
+		return false;
+	}
+	IPythonScriptPlugin* PythonPlugin = FtrackPythonBridgePrivate::GetPython();
+	if (!PythonPlugin) return false;
+
+	FString ScriptsDir = FPaths::ConvertRelativePathToFull(FPaths::Combine(Plugin->GetBaseDir(), TEXT("Scripts")));
+	FPaths::NormalizeDirectoryName(ScriptsDir);
+	// init_unreal.py normally added the folder already; compare normalized paths so it is never added twice.
+	const FString Code = FString::Printf(
+		TEXT("import os, sys\n")
+		TEXT("_p = os.path.normcase(os.path.abspath(%s))\n")
+		TEXT("if not any(os.path.normcase(os.path.abspath(x)) == _p for x in sys.path if x):\n")
+		TEXT("    sys.path.insert(0, %s)\n")
+		TEXT("del _p\n")
+		TEXT("import ftrack_commands\n")
+		TEXT("ftrack_commands.register_builtin_commands()\n"),
+		*FtrackPythonBridgePrivate::QuotePython(ScriptsDir), *FtrackPythonBridgePrivate::QuotePython(ScriptsDir));
+	FtrackPythonBridgePrivate::bBridgeInitialized = PythonPlugin->ExecPythonCommand(*Code);
+	return FtrackPythonBridgePrivate::bBridgeInitialized;
+}
+
+bool FtrackPythonBridge::RunCommand(const FString& Name, const TSharedPtr<FJsonObject>& Args)
+{
+	if (!EnsureInitialized()) return false;
+	IPythonScriptPlugin* PythonPlugin = FtrackPythonBridgePrivate::GetPython();
+	if (!PythonPlugin) return false;
+
+	FString ArgsJson;
+	if (Args.IsValid())
+	{
+		TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&ArgsJson);
+		FJsonSerializer::Serialize(Args.ToSharedRef(), Writer);
+	}
+
+	FPythonCommandEx Command;
+	Command.ExecutionMode = EPythonCommandExecutionMode::EvaluateStatement;
+	Command.Command = FString::Printf(TEXT("__import__('ftrack_commands').dispatch(%s, %s)"), *FtrackPythonBridgePrivate::QuotePython(Name), *FtrackPythonBridgePrivate::QuotePython(ArgsJson));
+	return PythonPlugin->ExecPythonCommandEx(Command) && Command.CommandResult == TEXT("True");
+}
+
+TSharedRef<FJsonObject> FtrackPythonBridge::MakePathsArgs(const TArray<FString>& Paths)
+{
+	TArray<TSharedPtr<FJsonValue>> Values;
+	Values.Reserve(Paths.Num());
+	for (const FString& Path : Paths)
+	{
+		Values.Add(MakeShared<FJsonValueString>(Path));
+	}
+	TSharedRef<FJsonObject> Args = MakeShared<FJsonObject>();
+	Args->SetArrayField(TEXT("paths"), Values);
+	return Args;
+}
+
+#undef LOCTEXT_NAMESPACE
@@ -9,20 +9,107 @@
 #include "Widgets/Layout/SScrollBox.h"
 #include "Widgets/Input/SButton.h"
 #include "Widgets/Views/SListView.h"
+#include "Widgets/Views/SHeaderRow.h"
+#include "Widgets/Views/STableRow.h"
+#include "Widgets/Input/SSearchBox.h"
+#include "Widgets/Input/SComboBox.h"
+#include "Widgets/Input/SCheckBox.h"
 #include "Widgets/Text/STextBlock.h"
 #include "Widgets/Layout/SUniformGridPanel.h"
 #include "Framework/Notifications/NotificationManager.h"
 #include "Widgets/Notifications/SNotificationList.h"
 #include "Styling/AppStyle.h"
-#include "Interfaces/IPluginManager.h"
+#include "FtrackPythonBridge.h"
 #include "Misc/Paths.h"
-#include "IPythonScriptPlugin.h"
+
+#include "Misc/FileHelper.h"
+#include "Dom/JsonObject.h"
+#include "Serialization/JsonReader.h"
+#include "Serialization/JsonSerializer.h"
 
 #define LOCTEXT_NAMESPACE "FtrackResourcesPanel"
 
+namespace
+{
+	void Notify(const FText& Text, float ExpireDuration)
+	{
+		FNotificationInfo Info(Text);
+		Info.ExpireDuration = ExpireDuration;
+		FSlateNotificationManager::Get().AddNotification(Info);
+	}
+
+	/** Object paths of the given rows, for commands that take a batch of handles. */
+	TArray<FString> RowPaths(const TArray<TSharedPtr<FFtrackHandleRow>>& Rows)
+	{
+		TArray<FString> Paths;
+		Paths.Reserve(Rows.Num());
+		for (const TSharedPtr<FFtrackHandleRow>& Row : Rows)
+		{
+			Paths.Add(Row->ObjectPath);
+		}
+		return Paths;
+	}
+
+	/** Handle field from the asset registry tags (UFtrackAssetHandle properties are AssetRegistrySearchable). */
+	FString GetHandleTag(const FAssetData& Data, FName Tag)
+	{
+		FString Value;
+		Data.GetTagValue(Tag, Value);
+		return Value;
+	}
+
+	const FName ColumnName(TEXT("Name"));
+	const FName ColumnComponent(TEXT("Component"));
+	const FName ColumnVersion(TEXT("Version"));
+	const FName ColumnStatus(TEXT("Status"));
+	const FName ColumnPath(TEXT("Path"));
+
+	/** True for UFtrackAssetHandle and subclasses (native class, so nothing is loaded). */
+	bool IsHandleAsset(const FAssetData& Data)
+	{
+		const UClass* Class = Data.GetClass();
+		return Class && Class->IsChildOf(UFtrackAssetHandle::StaticClass());
+	}
+
+	/** List row; texts read the shared row each paint, so in-place row updates show without regenerating. */
+	class SFtrackHandleRowWidget : public SMultiColumnTableRow<TSharedPtr<FFtrackHandleRow>>
+	{
+	public:
+		SLATE_BEGIN_ARGS(SFtrackHandleRowWidget) {}
+		SLATE_END_ARGS()
+
+		void Construct(const FArguments& InArgs, const TSharedRef<STableViewBase>& OwnerTable, TSharedPtr<FFtrackHandleRow> InRow)
+		{
+			Row = InRow;
+			SMultiColumnTableRow<TSharedPtr<FFtrackHandleRow>>::Construct(FSuperRowType::FArguments(), OwnerTable);
+		}
+
+		virtual TSharedRef<SWidget> GenerateWidgetForColumn(const FName& Column) override
+		{
+			TSharedPtr<FFtrackHandleRow> R = Row;
+			return SNew(STextBlock)
+				.Text_Lambda([R, Column]()
+				{
+					if (Column == ColumnName) return FText::FromString(R->Name);
+					if (Column == ColumnComponent) return R->ComponentId.IsEmpty() ? LOCTEXT("NoComponentTag", "(no tag; resave)") : FText::FromString(R->ComponentId);
+					if (Column == ColumnVersion) return R->AssetVersionId.IsEmpty() ? LOCTEXT("LatestVersion", "latest") : FText::FromString(R->AssetVersionId);
+					if (Column == ColumnStatus) return FText::FromString(R->StatusLabel);
+					return FText::FromString(R->ObjectPath);
+				});
+		}
+
+	private:
+		TSharedPtr<FFtrackHandleRow> Row;
+	};
+}
+
 void SFtrackResourcesPanel::Construct(const FArguments& InArgs)
 {
-	RefreshHandleList();
+	for (EFtrackHandleFilterColumn Column : { EFtrackHandleFilterColumn::All, EFtrackHandleFilterColumn::Name,
+		EFtrackHandleFilterColumn::Component, EFtrackHandleFilterColumn::Version, EFtrackHandleFilterColumn::Status })
+	{
+		FilterColumnOptions.Add(MakeShared<EFtrackHandleFilterColumn>(Column));
+	}
 
 	ChildSlot
 	[
@@ -38,6 +125,7 @@ void SFtrackResourcesPanel::Construct(const FArguments& InArgs)
 			[
 				SNew(SButton)
 				.Text(LOCTEXT("Refresh", "Refresh"))
+				.ToolTipText(LOCTEXT("RefreshTip", "Reload all handles and the version check results."))
 				.OnClicked(this, &SFtrackResourcesPanel::OnRefresh)
 			]
 			+ SHorizontalBox::Slot()
@@ -46,6 +134,7 @@ void SFtrackResourcesPanel::Construct(const FArguments& InArgs)
 			[
 				SNew(SButton)
 				.Text(LOCTEXT("Import", "Import"))
+				.ToolTipText(LOCTEXT("ImportTip", "Import the selected handles in one batch."))
 				.OnClicked(this, &SFtrackResourcesPanel::OnImportSelected)
 			]
 			+ SHorizontalBox::Slot()
@@ -54,6 +143,7 @@ void SFtrackResourcesPanel::Construct(const FArguments& InArgs)
 			[
 				SNew(SButton)
 				.Text(LOCTEXT("Reimport", "Re-import"))
+				.ToolTipText(LOCTEXT("ReimportTip", "Re-import in place the selected handles (or all imported handles) whose source file changed since the last import."))
 				.OnClicked(this, &SFtrackResourcesPanel::OnReimportSelected)
 			]
 			+ SHorizontalBox::Slot()
@@ -62,8 +152,67 @@ void SFtrackResourcesPanel::Construct(const FArguments& InArgs)
 			[
 				SNew(SButton)
 				.Text(LOCTEXT("Update", "Update"))
+				.ToolTipText(LOCTEXT("UpdateTip", "Point the selected stale handles at the latest version of their component and re-import them."))
 				.OnClicked(this, &SFtrackResourcesPanel::OnUpdateSelected)
 			]
+			+ SHorizontalBox::Slot()
+			.AutoWidth()
+			.Padding(2.0f)
+			[
+				SNew(SButton)
+				.Text(LOCTEXT("CheckVersions", "Check versions"))
+				.ToolTipText(LOCTEXT("CheckVersionsTip", "Find handles whose asset has a newer version in ftrack (all handles, batched queries)."))
+				.OnClicked(this, &SFtrackResourcesPanel::OnCheckVersions)
+			]
+		]
+		+ SVerticalBox::Slot()
+		.AutoHeight()
+		.Padding(4.0f)
+		[
+			SNew(SHorizontalBox)
+			+ SHorizontalBox::Slot()
+			.FillWidth(1.0f)
+			.Padding(2.0f)
+			[
+				SNew(SSearchBox)
+				.HintText(LOCTEXT("FilterHint", "Filter handles"))
+				.OnTextChanged(this, &SFtrackResourcesPanel::OnFilterTextChanged)
+			]
+			+ SHorizontalBox::Slot()
+			.AutoWidth()
+			.Padding(2.0f)
+			[
+				SNew(SComboBox<TSharedPtr<EFtrackHandleFilterColumn>>)
+				.OptionsSource(&FilterColumnOptions)
+				.InitiallySelectedItem(FilterColumnOptions[0])
+				.OnGenerateWidget_Lambda([this](TSharedPtr<EFtrackHandleFilterColumn> Item) -> TSharedRef<SWidget>
+				{
+					return SNew(STextBlock).Text(GetFilterColumnLabel(*Item));
+				})
+				.OnSelectionChanged_Lambda([this](TSharedPtr<EFtrackHandleFilterColumn> Item, ESelectInfo::Type)
+				{
+					if (Item.IsValid())
+					{
+						FilterColumn = *Item;
+						ApplyFilter();
+					}
+				})
+				[
+					SNew(STextBlock).Text_Lambda([this]() { return GetFilterColumnLabel(FilterColumn); })
+				]
+			]
+			+ SHorizontalBox::Slot()
+			.AutoWidth()
+			.VAlign(VAlign_Center)
+			.Padding(6.0f, 2.0f)
+			[
+				SNew(SCheckBox)
+				.IsChecked_Lambda([this]() { return bStaleOnly ? ECheckBoxState::Checked : ECheckBoxState::Unchecked; })
+				.OnCheckStateChanged(this, &SFtrackResourcesPanel::OnStaleOnlyChanged)
+				[
+					SNew(STextBlock).Text(LOCTEXT("StaleOnly", "Stale only"))
+				]
+			]
 		]
 		+ SVerticalBox::Slot()
 		.FillHeight(1.0f)
@@ -73,175 +222,354 @@ void SFtrackResourcesPanel::Construct(const FArguments& InArgs)
 			.BorderImage(FAppStyle::GetBrush("ToolPanel.GroupBorder"))
 			.Padding(4.0f)
 			[
-				SAssignNew(HandleListView, SListView<TSharedPtr<FAssetData>>)
-				.ListItemsSource(&HandleList)
+				SAssignNew(HandleListView, SListView<TSharedPtr<FFtrackHandleRow>>)
+				.ListItemsSource(&FilteredRows)
 				.OnGenerateRow(this, &SFtrackResourcesPanel::OnGenerateRow)
-				.SelectionMode(ESelectionMode::Single)
+				.SelectionMode(ESelectionMode::Multi)
+				.HeaderRow
+				(
+					SNew(SHeaderRow)
+					+ SHeaderRow::Column(ColumnName).DefaultLabel(LOCTEXT("ColumnName", "Name")).FillWidth(0.2f)
+					+ SHeaderRow::Column(ColumnComponent).DefaultLabel(LOCTEXT("ColumnComponent", "Component")).FillWidth(0.2f)
+					+ SHeaderRow::Column(ColumnVersion).DefaultLabel(LOCTEXT("ColumnVersion", "Version")).FillWidth(0.15f)
+					+ SHeaderRow::Column(ColumnStatus).DefaultLabel(LOCTEXT("ColumnStatus", "Status")).FillWidth(0.15f)
+					+ SHeaderRow::Column(ColumnPath).DefaultLabel(LOCTEXT("ColumnPath", "Path")).FillWidth(0.3f)
+				)
+			]
+		]
+		+ SVerticalBox::Slot()
+		.AutoHeight()
+		.Padding(4.0f)
+		[
+			SNew(SHorizontalBox)
+			+ SHorizontalBox::Slot()
+			.FillWidth(1.0f)
+			[
+				SNew(STextBlock)
+				.Text(this, &SFtrackResourcesPanel::GetSelectedHandleSummary)
+			]
+			+ SHorizontalBox::Slot()
+			.AutoWidth()
+			[
+				SNew(STextBlock)
+				.Text(this, &SFtrackResourcesPanel::GetCountText)
 			]
 		]
 	];
+
+	RefreshHandleList();
+
+	IAssetRegistry& Registry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>("AssetRegistry").Get();
+	Registry.OnAssetAdded().AddSP(this, &SFtrackResourcesPanel::OnAssetAdded);
+	Registry.OnAssetRemoved().AddSP(this, &SFtrackResourcesPanel::OnAssetRemoved);
+	Registry.OnAssetRenamed().AddSP(this, &SFtrackResourcesPanel::OnAssetRenamed);
+	Registry.OnAssetUpdated().AddSP(this, &SFtrackResourcesPanel::OnAssetUpdated);
+}
+
+SFtrackResourcesPanel::~SFtrackResourcesPanel()
+{
+	if (FAssetRegistryModule* Module = FModuleManager::GetModulePtr<FAssetRegistryModule>("AssetRegistry"))
+	{
+		IAssetRegistry& Registry = Module->Get();
+		Registry.OnAssetAdded().RemoveAll(this);
+		Registry.OnAssetRemoved().RemoveAll(this);
+		Registry.OnAssetRenamed().RemoveAll(this);
+		Registry.OnAssetUpdated().RemoveAll(this);
+	}
 }
 
 void SFtrackResourcesPanel::RefreshHandleList()
 {
-	HandleList.Reset();
+	LoadStalenessIndex();
 	IAssetRegistry& Registry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>("AssetRegistry").Get();
 	FARFilter Filter;
 	Filter.ClassPaths.Add(UFtrackAssetHandle::StaticClass()->GetClassPathName());
 	Filter.bRecursiveClasses = true;
 	TArray<FAssetData> OutAssets;
 	Registry.GetAssets(Filter, OutAssets);
+
+	// Reuse row objects that still exist so the list keeps its selection.
+	TMap<FString, TSharedPtr<FFtrackHandleRow>> Previous = MoveTemp(RowsByPath);
+	RowsByPath.Reset();
+	RowsByPath.Reserve(OutAssets.Num());
 	for (const FAssetData& Data : OutAssets)
 	{
-		HandleList.Add(MakeShared<FAssetData>(Data));
+		const FString Path = Data.GetObjectPathString();
+		TSharedPtr<FFtrackHandleRow> Row = Previous.FindRef(Path);
+		if (!Row.IsValid())
+		{
+			Row = MakeShared<FFtrackHandleRow>();
+		}
+		FillRow(*Row, Data);
+		RowsByPath.Add(Path, Row);
 	}
+	ApplyFilter();
+}
+
+void SFtrackResourcesPanel::OnAssetAdded(const FAssetData& Data)
+{
+	if (UpsertRow(Data)) RequestRefilter();
+}
+
+void SFtrackResourcesPanel::OnAssetRemoved(const FAssetData& Data)
+{
+	if (RowsByPath.Remove(Data.GetObjectPathString()) > 0) RequestRefilter();
+}
+
+void SFtrackResourcesPanel::OnAssetRenamed(const FAssetData& Data, const FString& OldObjectPath)
+{
+	const bool bRemoved = RowsByPath.Remove(OldObjectPath) > 0;
+	if (UpsertRow(Data) || bRemoved) RequestRefilter();
+}
+
+void SFtrackResourcesPanel::OnAssetUpdated(const FAssetData& Data)
+{
+	// Tags change when a handle is saved with new values.
+	if (UpsertRow(Data)) RequestRefilter();
+}
+
+bool SFtrackResourcesPanel::UpsertRow(const FAssetData& Data)
+{
+	if (!IsHandleAsset(Data)) return false;
+	TSharedPtr<FFtrackHandleRow>& Row = RowsByPath.FindOrAdd(Data.GetObjectPathString());
+	if (!Row.IsValid())
+	{
+		Row = MakeShared<FFtrackHandleRow>();
+	}
+	FillRow(*Row, Data);
+	return true;
+}
+
+void SFtrackResourcesPanel::FillRow(FFtrackHandleRow& Row, const FAssetData& Data) const
+{
+	Row.Name = Data.AssetName.ToString();
+	Row.ObjectPath = Data.GetObjectPathString();
+	Row.ComponentId = GetHandleTag(Data, GET_MEMBER_NAME_CHECKED(UFtrackAssetHandle, ComponentId));
+	Row.AssetVersionId = GetHandleTag(Data, GET_MEMBER_NAME_CHECKED(UFtrackAssetHandle, AssetVersionId));
+	Row.ContentSubpath = GetHandleTag(Data, GET_MEMBER_NAME_CHECKED(UFtrackAssetHandle, ContentSubpath));
+	ApplyStatusLabel(Row);
+}
+
+void SFtrackResourcesPanel::ApplyStatusLabel(FFtrackHandleRow& Row) const
+{
+	const FString* Label = StaleLabels.Find(Row.ObjectPath);
+	Row.StatusLabel = Label ? *Label : FString();
+	Row.bStale = StaleHandles.Contains(Row.ObjectPath);
+}
+
+void SFtrackResourcesPanel::RequestRefilter()
+{
+	if (bRefilterPending) return;
+	bRefilterPending = true;
+	RegisterActiveTimer(0.0f, FWidgetActiveTimerDelegate::CreateSP(this, &SFtrackResourcesPanel::OnRefilterTimer));
+}
+
+EActiveTimerReturnType SFtrackResourcesPanel::OnRefilterTimer(double InCurrentTime, float InDeltaTime)
+{
+	bRefilterPending = false;
+	ApplyFilter();
+	return EActiveTimerReturnType::Stop;
+}
+
+void SFtrackResourcesPanel::ApplyFilter()
+{
+	FilteredRows.Reset(RowsByPath.Num());
+	for (const TPair<FString, TSharedPtr<FFtrackHandleRow>>& Pair : RowsByPath)
+	{
+		if (PassesFilter(*Pair.Value))
+		{
+			FilteredRows.Add(Pair.Value);
+		}
+	}
+	FilteredRows.Sort([](const TSharedPtr<FFtrackHandleRow>& A, const TSharedPtr<FFtrackHandleRow>& B)
+	{
+		const int32 ByName = A->Name.Compare(B->Name, ESearchCase::IgnoreCase);
+		return ByName != 0 ? ByName < 0 : A->ObjectPath < B->ObjectPath;
+	});
 	if (HandleListView.IsValid())
 	{
 		HandleListView->RequestListRefresh();
 	}
 }
 
-FReply SFtrackResourcesPanel::OnRefresh()
+bool SFtrackResourcesPanel::PassesFilter(const FFtrackHandleRow& Row) const
 {
-	RefreshHandleList();
-	return FReply::Handled();
+	if (bStaleOnly && !Row.bStale) return false;
+	if (FilterText.IsEmpty()) return true;
+	auto Matches = [this](const FString& Value) { return Value.Contains(FilterText, ESearchCase::IgnoreCase); };
+	switch (FilterColumn)
+	{
+	case EFtrackHandleFilterColumn::Name: return Matches(Row.Name);
+	case EFtrackHandleFilterColumn::Component: return Matches(Row.ComponentId);
+	case EFtrackHandleFilterColumn::Version: return Matches(Row.AssetVersionId);
+	case EFtrackHandleFilterColumn::Status: return Matches(Row.StatusLabel);
+	default:
+		return Matches(Row.Name) || Matches(Row.ComponentId) || Matches(Row.AssetVersionId)
+			|| Matches(Row.StatusLabel) || Matches(Row.ObjectPath);
+	}
 }
 
-UFtrackAssetHandle* SFtrackResourcesPanel::GetSelectedHandle() const
+void SFtrackResourcesPanel::OnFilterTextChanged(const FText& Text)
 {
-	if (!HandleListView.IsValid()) return nullptr;
-	TArray<TSharedPtr<FAssetData>> Selected = HandleListView->GetSelectedItems();
-	if (Selected.Num() != 1) return nullptr;
-	FSoftObjectPath Path(Selected[0]->GetSoftObjectPath());
-	return Cast<UFtrackAssetHandle>(Path.TryLoad());
+	FilterText = Text.ToString().TrimStartAndEnd();
+	ApplyFilter();
 }
 
-FReply SFtrackResourcesPanel::OnImportSelected()
+void SFtrackResourcesPanel::OnStaleOnlyChanged(ECheckBoxState State)
 {
-	if (!HandleListView.IsValid()) return FReply::Handled();
-	TArray<TSharedPtr<FAssetData>> Selected = HandleListView->GetSelectedItems();
-	if (Selected.Num() != 1)
+	bStaleOnly = State == ECheckBoxState::Checked;
+	ApplyFilter();
+}
+
+FText SFtrackResourcesPanel::GetFilterColumnLabel(EFtrackHandleFilterColumn Column) const
+{
+	switch (Column)
 	{
-		FNotificationInfo Info(LOCTEXT("NoSelection", "Select one Ftrack Asset Handle in the list."));
-		Info.ExpireDuration = 3.0f;
-		FSlateNotificationManager::Get().AddNotification(Info);
-		return FReply::Handled();
+	case EFtrackHandleFilterColumn::Name: return LOCTEXT("FilterName", "Name");
+	case EFtrackHandleFilterColumn::Component: return LOCTEXT("FilterComponent", "Component");
+	case EFtrackHandleFilterColumn::Version: return LOCTEXT("FilterVersion", "Version");
+	case EFtrackHandleFilterColumn::Status: return LOCTEXT("FilterStatus", "Status");
+	default: return LOCTEXT("FilterAll", "All columns");
 	}
-	FString HandlePath = Selected[0]->GetSoftObjectPath().ToString();
-	TSharedPtr<IPlugin> Plugin = IPluginManager::Get().FindPlugin(TEXT("MroyaFtrack"));
-	if (!Plugin.IsValid())
+}
+
+TArray<TSharedPtr<FFtrackHandleRow>> SFtrackResourcesPanel::GetSelectedRows() const
+{
+	return HandleListView.IsValid() ? HandleListView->GetSelectedItems() : TArray<TSharedPtr<FFtrackHandleRow>>();
+}
+
+FReply SFtrackResourcesPanel::OnRefresh()
+{
+	RefreshHandleList();
+	return FReply::Handled();
+}
+
+FReply SFtrackResourcesPanel::OnImportSelected()
+{
+	TArray<TSharedPtr<FFtrackHandleRow>> Selected = GetSelectedRows();
+	if (Selected.Num() == 0)
 	{
-		FNotificationInfo Info(LOCTEXT("PluginNotFound", "MroyaFtrack plugin not found."));
-		Info.ExpireDuration = 3.0f;
-		FSlateNotificationManager::Get().AddNotification(Info);
+		Notify(LOCTEXT("NoSelection", "Select one or more Ftrack Asset Handles in the list."), 3.0f);
 		return FReply::Handled();
 	}
-	FString ScriptsDir = FPaths::Combine(Plugin->GetBaseDir(), TEXT("Scripts"));
-	FPaths::NormalizeDirectoryName(ScriptsDir);
-	FString QuotedPath;
-	QuotedPath.Reserve(ScriptsDir.Len() + 4);
-	QuotedPath += TEXT("'");
-	for (TCHAR c : ScriptsDir.Replace(TEXT("\\"), TEXT("/")))
-	{
-		if (c == TEXT('\\')) QuotedPath += TEXT("\\\\");
-		else if (c == TEXT('\'')) QuotedPath += TEXT("\\'");
-		else QuotedPath += c;
-	}
-	QuotedPath += TEXT("'");
-	FString QuotedHandlePath;
-	QuotedHandlePath.Reserve(HandlePath.Len() + 4);
-	QuotedHandlePath += TEXT("'");
-	for (TCHAR c : HandlePath)
-	{
-		if (c == TEXT('\\')) QuotedHandlePath += TEXT("\\\\");
-		else if (c == TEXT('\'')) QuotedHandlePath += TEXT("\\'");
-		else QuotedHandlePath += c;
-	}
-	QuotedHandlePath += TEXT("'");
-	IPythonScriptPlugin* PythonPlugin = IPythonScriptPlugin::Get();
-	if (!PythonPlugin || !PythonPlugin->IsPythonAvailable())
-	{
-		FNotificationInfo Info(LOCTEXT("PythonNotAvailable", "Python Editor Script plugin is not available."));
-		Info.ExpireDuration = 4.0f;
-		FSlateNotificationManager::Get().AddNotification(Info);
-		return FReply::Handled();
-	}
-	FString Code = FString::Printf(
-		TEXT("import sys\nsys.path.insert(0, %s)\nimport init_ftrack_menu\nn = init_ftrack_menu.import_handle_in_unreal(%s)\n"),
-		*QuotedPath, *QuotedHandlePath);
-	bool bOk = PythonPlugin->ExecPythonCommand(*Code);
-	if (bOk)
+	if (FtrackPythonBridge::RunCommand(TEXT("handles.import"), FtrackPythonBridge::MakePathsArgs(RowPaths(Selected))))
 	{
-		FNotificationInfo Info(LOCTEXT("ImportDone", "Import triggered. Check Output Log and import dialog."));
-		Info.ExpireDuration = 3.0f;
-		FSlateNotificationManager::Get().AddNotification(Info);
+		Notify(LOCTEXT("ImportDone", "Resolving in background; import starts when ready. Check Output Log and import dialog."), 3.0f);
 	}
 	else
 	{
-		FNotificationInfo Info(LOCTEXT("ImportFailed", "Import failed. Check Output Log for errors."));
-		Info.ExpireDuration = 4.0f;
-		FSlateNotificationManager::Get().AddNotification(Info);
+		Notify(LOCTEXT("ImportFailed", "Import failed. Check Output Log for errors."), 4.0f);
 	}
 	return FReply::Handled();
 }
 
 FReply SFtrackResourcesPanel::OnReimportSelected()
 {
-	UFtrackAssetHandle* Handle = GetSelectedHandle();
-	if (!Handle)
+	// No selection: check every handle recorded in the import manifest.
+	TArray<TSharedPtr<FFtrackHandleRow>> Selected = GetSelectedRows();
+	const TSharedPtr<FJsonObject> Args = Selected.Num() > 0 ? FtrackPythonBridge::MakePathsArgs(RowPaths(Selected)) : TSharedPtr<FJsonObject>();
+	if (FtrackPythonBridge::RunCommand(TEXT("handles.reimport"), Args))
 	{
-		FNotificationInfo Info(LOCTEXT("NoSelection", "Select one Ftrack Asset Handle in the list."));
-		Info.ExpireDuration = 3.0f;
-		FSlateNotificationManager::Get().AddNotification(Info);
-		return FReply::Handled();
+		Notify(LOCTEXT("ReimportStarted", "Checking sources; only changed handles are re-imported. See Output Log."), 4.0f);
+	}
+	else
+	{
+		Notify(LOCTEXT("ReimportFailed", "Re-import failed. Check Output Log for errors."), 4.0f);
 	}
-	// TODO: re-import component for this handle
-	FNotificationInfo Info(FText::Format(
-		LOCTEXT("ReimportPlanned", "Re-import for \"{0}\" will be wired to import pipeline."),
-		FText::FromString(Handle->GetName())));
-	Info.ExpireDuration = 4.0f;
-	FSlateNotificationManager::Get().AddNotification(Info);
 	return FReply::Handled();
 }
 
 FReply SFtrackResourcesPanel::OnUpdateSelected()
 {
-	UFtrackAssetHandle* Handle = GetSelectedHandle();
-	if (!Handle)
+	TArray<TSharedPtr<FFtrackHandleRow>> Selected = GetSelectedRows();
+	if (Selected.Num() == 0)
 	{
-		FNotificationInfo Info(LOCTEXT("NoSelection", "Select one Ftrack Asset Handle in the list."));
-		Info.ExpireDuration = 3.0f;
-		FSlateNotificationManager::Get().AddNotification(Info);
+		Notify(LOCTEXT("NoSelection", "Select one or more Ftrack Asset Handles in the list."), 3.0f);
 		return FReply::Handled();
 	}
-	// TODO: update component (e.g. pull latest version) for this handle
-	FNotificationInfo Info(FText::Format(
-		LOCTEXT("UpdatePlanned", "Update for \"{0}\" will be wired to update pipeline."),
-		FText::FromString(Handle->GetName())));
-	Info.ExpireDuration = 4.0f;
-	FSlateNotificationManager::Get().AddNotification(Info);
+	if (FtrackPythonBridge::RunCommand(TEXT("handles.update"), FtrackPythonBridge::MakePathsArgs(RowPaths(Selected))))
+	{
+		Notify(LOCTEXT("UpdateStarted", "Checking for newer versions; stale handles are updated and re-imported. See Output Log."), 4.0f);
+	}
+	else
+	{
+		Notify(LOCTEXT("UpdateFailed", "Update failed. Check Output Log for errors."), 4.0f);
+	}
 	return FReply::Handled();
 }
 
-TSharedRef<ITableRow> SFtrackResourcesPanel::OnGenerateRow(TSharedPtr<FAssetData> Item, const TSharedRef<STableViewBase>& OwnerTable)
+FReply SFtrackResourcesPanel::OnCheckVersions()
 {
-	if (!Item.IsValid())
+	if (FtrackPythonBridge::RunCommand(TEXT("versions.scan")))
 	{
-		return SNew(STableRow<TSharedPtr<FAssetData>>, OwnerTable)[ SNew(STextBlock).Text(LOCTEXT("Invalid", "(invalid)"))];
+		Notify(LOCTEXT("ScanStarted", "Checking all handles for newer versions. Press Refresh when the Output Log reports the scan is done."), 4.0f);
 	}
-	FString Display = FString::Printf(TEXT("%s  |  %s"), *Item->AssetName.ToString(), *Item->GetObjectPathString());
-	return SNew(STableRow<TSharedPtr<FAssetData>>, OwnerTable)
-		[
-			SNew(STextBlock)
-			.Text(FText::FromString(Display))
-		];
+	else
+	{
+		Notify(LOCTEXT("ScanFailed", "Version check failed. Check Output Log for errors."), 4.0f);
+	}
+	return FReply::Handled();
+}
+
+void SFtrackResourcesPanel::LoadStalenessIndex()
+{
+	StaleLabels.Reset();
+	StaleHandles.Reset();
+	const FString IndexPath = FPaths::Combine(FPaths::ProjectSavedDir(), TEXT("MroyaFtrack"), TEXT("staleness_index.json"));
+	FString Text;
+	if (!FFileHelper::LoadFileToString(Text, *IndexPath)) return;
+	TSharedPtr<FJsonObject> Root;
+	if (!FJsonSerializer::Deserialize(TJsonReaderFactory<>::Create(Text), Root) || !Root.IsValid()) return;
+	const TSharedPtr<FJsonObject>* Handles = nullptr;
+	if (!Root->TryGetObjectField(TEXT("handles"), Handles)) return;
+	for (const auto& Pair : (*Handles)->Values)
+	{
+		const TSharedPtr<FJsonObject> Entry = Pair.Value.IsValid() ? Pair.Value->AsObject() : nullptr;
+		if (!Entry.IsValid()) continue;
+		bool bStale = false;
+		Entry->TryGetBoolField(TEXT("stale"), bStale);
+		FString Error;
+		if (bStale)
+		{
+			StaleHandles.Add(Pair.Key);
+			StaleLabels.Add(Pair.Key, FString::Printf(TEXT("v%d -> v%d available"),
+				(int32)Entry->GetNumberField(TEXT("current_version")), (int32)Entry->GetNumberField(TEXT("latest_version"))));
+		}
+		else if (Entry->TryGetStringField(TEXT("error"), Error) && !Error.IsEmpty())
+		{
+			StaleLabels.Add(Pair.Key, FString::Printf(TEXT("check failed: %s"), *Error));
+		}
+	}
+}
+
+TSharedRef<ITableRow> SFtrackResourcesPanel::OnGenerateRow(TSharedPtr<FFtrackHandleRow> Item, const TSharedRef<STableViewBase>& OwnerTable)
+{
+	return SNew(SFtrackHandleRowWidget, OwnerTable, Item);
 }
 
 FText SFtrackResourcesPanel::GetSelectedHandleSummary() const
 {
-	UFtrackAssetHandle* Handle = GetSelectedHandle();
-	if (!Handle) return LOCTEXT("NoHandle", "No handle selected");
-	return FText::FromString(Handle->GetName());
+	// Evaluated every frame: reads the cached row, never loads the handle.
+	const int32 NumSelected = HandleListView.IsValid() ? HandleListView->GetNumItemsSelected() : 0;
+	if (NumSelected == 0) return LOCTEXT("NoHandle", "No handle selected");
+	if (NumSelected > 1) return FText::Format(LOCTEXT("HandlesSelected", "{0} handles selected"), FText::AsNumber(NumSelected));
+	const TSharedPtr<FFtrackHandleRow> Row = HandleListView->GetSelectedItems()[0];
+	if (!Row.IsValid()) return LOCTEXT("NoHandle", "No handle selected");
+	if (Row->ComponentId.IsEmpty())
+	{
+		return FText::Format(LOCTEXT("HandleSummaryNoTags", "{0} (no ComponentId tag; resave the handle)"), FText::FromString(Row->Name));
+	}
+	return FText::Format(
+		LOCTEXT("HandleSummary", "{0}  |  component {1}  |  version {2}  |  {3}"),
+		FText::FromString(Row->Name),
+		FText::FromString(Row->ComponentId),
+		FText::FromString(Row->AssetVersionId.IsEmpty() ? FString(TEXT("latest")) : Row->AssetVersionId),
+		FText::FromString(Row->ContentSubpath.IsEmpty() ? FString(TEXT("/Game/FtrackImport")) : TEXT("/Game/") + Row->ContentSubpath));
+}
+
+FText SFtrackResourcesPanel::GetCountText() const
+{
+	return FText::Format(LOCTEXT("HandleCount", "{0} of {1} handles"), FText::AsNumber(FilteredRows.Num()), FText::AsNumber(RowsByPath.Num()));
 }
 
 #undef LOCTEXT_NAMESPACE
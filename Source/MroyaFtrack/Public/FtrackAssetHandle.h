@@ -11,6 +11,7 @@
  * DataAsset that holds a reference to an ftrack component by ID.
  * Used for "handle" workflow: create handle in Content, then Load/Re-import resolves path and imports.
  * Only ComponentId (and optional ContentSubpath) are stored - no machine-specific paths.
+ * All fields are asset registry tags, so panels and Python can read them without loading the asset.
  */
 UCLASS(BlueprintType)
 class MROYAFTRACK_API UFtrackAssetHandle : public UDataAsset
@@ -19,14 +20,14 @@ class MROYAFTRACK_API UFtrackAssetHandle : public UDataAsset
 
 public:
 	/** Ftrack Component ID - used to resolve file path at import time. */
-	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Ftrack")
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, AssetRegistrySearchable, Category = "Ftrack")
 	FString ComponentId;
 
 	/** Optional: Content subpath for import (e.g. "Assets/Props/Table"). Empty = use default. */
-	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Ftrack")
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, AssetRegistrySearchable, Category = "Ftrack")
 	FString ContentSubpath;
 
 	/** Optional: Ftrack Asset Version ID (for display or version pinning). */
-	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Ftrack")
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, AssetRegistrySearchable, Category = "Ftrack")
 	FString AssetVersionId;
 };
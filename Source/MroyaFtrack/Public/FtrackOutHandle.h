@@ -139,4 +139,24 @@ public:
 
 	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Ftrack|Job")
 	TArray<FFtrackPublishComponentEntry> Components;
+
+	/**
+	 * Changes whenever the payload may have changed: load/reload, duplicate, Modify (package dirtied),
+	 * property edit, undo/redo. Values come from one process-wide counter, so a reloaded asset never
+	 * repeats an earlier value. Not saved; read by the Python publish-job cache.
+	 */
+	UPROPERTY(Transient, VisibleInstanceOnly, BlueprintReadOnly, Category = "Ftrack|Internal", meta = (DisplayName = "edit_generation"))
+	int64 EditGeneration = 0;
+
+	virtual void PostInitProperties() override;
+	virtual void PostLoad() override;
+	virtual void PostDuplicate(bool bDuplicateForPIE) override;
+	virtual bool Modify(bool bAlwaysMarkDirty = true) override;
+#if WITH_EDITOR
+	virtual void PostEditChangeProperty(FPropertyChangedEvent& PropertyChangedEvent) override;
+	virtual void PostEditUndo() override;
+#endif
+
+private:
+	void BumpEditGeneration();
 };
@@ -0,0 +1,26 @@
+// Copyright Mroya. Calls registered Python commands (Scripts/ftrack_commands.py) from Slate panels.
+
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Dom/JsonObject.h"
+
+/**
+ * C++ -> Python entry point for the plugin's panels.
+ * The first call puts the plugin's Scripts folder on sys.path (once per session) and registers the
+ * built-in commands; every call afterwards runs the same one-line statement,
+ * ftrack_commands.dispatch(Name, ArgsJson), with the arguments serialized as JSON.
+ * Failures (no Python, unknown command, exception) are logged on the Python side and reported
+ * here as false, with a notification when Python itself is unavailable.
+ */
+namespace FtrackPythonBridge
+{
+	/** Configure sys.path and register commands. Returns false if Python or the plugin is unavailable. */
+	MROYAFTRACK_API bool EnsureInitialized();
+
+	/** Run a registered command with keyword arguments. Returns true if the command ran without raising. */
+	MROYAFTRACK_API bool RunCommand(const FString& Name, const TSharedPtr<FJsonObject>& Args = nullptr);
+
+	/** Args object {"paths": [...]} for commands that take a batch of handle object paths. */
+	MROYAFTRACK_API TSharedRef<FJsonObject> MakePathsArgs(const TArray<FString>& Paths);
+}
@@ -4,14 +4,40 @@
 
 #include "CoreMinimal.h"
 #include "Widgets/SCompoundWidget.h"
+#include "Widgets/Views/SListView.h"
+#include "Styling/SlateTypes.h"
 #include "AssetRegistry/AssetData.h"
 
-class UFtrackAssetHandle;
+/** One cached panel row: handle fields read once from asset registry tags (no asset loads). */
+struct FFtrackHandleRow
+{
+	FString Name;
+	FString ObjectPath;
+	FString ComponentId;
+	FString AssetVersionId;
+	FString ContentSubpath;
+	/** From the staleness index: "v1 -> v3 available", "check failed: ..." or empty. */
+	FString StatusLabel;
+	bool bStale = false;
+};
+
+/** Column the filter text is matched against. */
+enum class EFtrackHandleFilterColumn : uint8
+{
+	All,
+	Name,
+	Component,
+	Version,
+	Status,
+};
 
 /**
  * Slate panel that shows all UFtrackAssetHandle assets in the project
- * and provides toolbar actions: Refresh, Import, Re-import, Update.
+ * and provides toolbar actions: Refresh, Import, Re-import, Update, Check versions.
  * Used as the content of the "Ftrack Resources Control" dockable tab.
+ *
+ * Rows are built once from the asset registry and then kept up to date from registry
+ * added/removed/renamed/updated events; filtering runs on the cached rows.
  */
 class MROYAFTRACK_API SFtrackResourcesPanel : public SCompoundWidget
 {
@@ -20,17 +46,52 @@ public:
 	SLATE_END_ARGS()
 
 	void Construct(const FArguments& InArgs);
+	virtual ~SFtrackResourcesPanel() override;
 
 private:
+	/** Rebuild all rows from one registry query and reload the staleness index. */
 	void RefreshHandleList();
-	UFtrackAssetHandle* GetSelectedHandle() const;
+	void OnAssetAdded(const FAssetData& Data);
+	void OnAssetRemoved(const FAssetData& Data);
+	void OnAssetRenamed(const FAssetData& Data, const FString& OldObjectPath);
+	void OnAssetUpdated(const FAssetData& Data);
+	/** Add or replace the row for Data if it is a handle. Returns true if the row set changed. */
+	bool UpsertRow(const FAssetData& Data);
+	void FillRow(FFtrackHandleRow& Row, const FAssetData& Data) const;
+	void ApplyStatusLabel(FFtrackHandleRow& Row) const;
+	/** Re-filter once on the next tick, however many registry events arrive before it. */
+	void RequestRefilter();
+	EActiveTimerReturnType OnRefilterTimer(double InCurrentTime, float InDeltaTime);
+	void ApplyFilter();
+	bool PassesFilter(const FFtrackHandleRow& Row) const;
+	void OnFilterTextChanged(const FText& Text);
+	void OnStaleOnlyChanged(ECheckBoxState State);
+	FText GetFilterColumnLabel(EFtrackHandleFilterColumn Column) const;
+
+	TArray<TSharedPtr<FFtrackHandleRow>> GetSelectedRows() const;
 	FReply OnRefresh();
 	FReply OnImportSelected();
 	FReply OnReimportSelected();
 	FReply OnUpdateSelected();
-	TSharedRef<ITableRow> OnGenerateRow(TSharedPtr<FAssetData> Item, const TSharedRef<STableViewBase>& OwnerTable);
+	FReply OnCheckVersions();
+	/** Read Saved/MroyaFtrack/staleness_index.json (written by ftrack_version_scan) into StaleLabels. */
+	void LoadStalenessIndex();
+	TSharedRef<ITableRow> OnGenerateRow(TSharedPtr<FFtrackHandleRow> Item, const TSharedRef<STableViewBase>& OwnerTable);
 	FText GetSelectedHandleSummary() const;
+	FText GetCountText() const;
+
+	TSharedPtr<SListView<TSharedPtr<FFtrackHandleRow>>> HandleListView;
+	/** Object path -> row, for every handle in the project. */
+	TMap<FString, TSharedPtr<FFtrackHandleRow>> RowsByPath;
+	/** Rows passing the filter, sorted by name; the list view's items source. */
+	TArray<TSharedPtr<FFtrackHandleRow>> FilteredRows;
+	/** Handle object path -> row suffix ("v1 -> v3 available", "check failed: ..."). */
+	TMap<FString, FString> StaleLabels;
+	TSet<FString> StaleHandles;
 
-	TSharedPtr<SListView<TSharedPtr<FAssetData>>> HandleListView;
-	TArray<TSharedPtr<FAssetData>> HandleList;
+	FString FilterText;
+	EFtrackHandleFilterColumn FilterColumn = EFtrackHandleFilterColumn::All;
+	TArray<TSharedPtr<EFtrackHandleFilterColumn>> FilterColumnOptions;
+	bool bStaleOnly = false;
+	bool bRefilterPending = false;
 };
@@ -0,0 +1,9 @@
+# :coding: utf-8
+"""Make Scripts/ importable; the modules under test run without the unreal module."""
+
+import os
+import sys
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Scripts")
+if SCRIPTS not in sys.path:
+    sys.path.insert(0, SCRIPTS)
@@ -0,0 +1,221 @@
+# :coding: utf-8
+import json
+import os
+import time
+
+import pytest
+
+import ftrack_component_cache
+from ftrack_component_cache import ComponentCache, _FileLock, cache_key
+from ftrack_prefetch import prefetch_files
+
+
+@pytest.fixture
+def remote(tmp_path):
+    folder = tmp_path / "remote"
+    folder.mkdir()
+    return folder
+
+
+@pytest.fixture
+def no_recent_grace(monkeypatch):
+    monkeypatch.setattr(ftrack_component_cache, "_RECENT_USE_SECONDS", 0.0)
+
+
+def _source(remote, name, size):
+    path = remote / name
+    path.write_bytes(os.urandom(size))
+    return str(path)
+
+
+def _fill(cache, remote, names, size=1000):
+    """Prefetch one file per name into cache (one component version each); returns {name: source}."""
+    sources = {n: _source(remote, n + ".bin", size) for n in names}
+    prefetch_files([{"path": p, "key": cache_key(n, "v1")} for n, p in sources.items()],
+                   remote_roots=[str(remote)], cache=cache)
+    return sources
+
+
+def _index(cache):
+    with open(os.path.join(cache.root, "index.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _cached(cache, name):
+    return os.path.isdir(os.path.join(cache.root, name))
+
+
+def test_lookup_miss_then_hit(tmp_path, remote):
+    cache = ComponentCache(str(tmp_path / "cache"))
+    source = _source(remote, "a.bin", 500)
+    key = cache_key("c1", "v1")
+    assert cache.lookup(source, key) is None
+
+    (r,) = prefetch_files([{"path": source, "key": key}], remote_roots=[str(remote)], cache=cache)
+    assert r["status"] == "copied"
+    assert cache.lookup(source, key) == r["local"] == os.path.join(cache.root, "c1", "v1", "a.bin")
+
+    session = cache.stats()["session"]
+    # The miss inside prefetch_files plus the two lookups above.
+    assert (session["hits"], session["misses"]) == (1, 2)
+    assert session["bytes_saved"] == 500 and session["bytes_fetched"] == 500
+
+
+def test_changed_source_is_a_miss(tmp_path, remote):
+    cache = ComponentCache(str(tmp_path / "cache"))
+    source = _source(remote, "a.bin", 500)
+    key = cache_key("c1", "v1")
+    prefetch_files([{"path": source, "key": key}], remote_roots=[str(remote)], cache=cache)
+    with open(source, "ab") as f:
+        f.write(b"more")
+    assert cache.lookup(source, key) is None
+
+
+def test_add_after_another_instance_copied_counts_as_hit(tmp_path):
+    cache = ComponentCache(str(tmp_path / "cache"))
+    cache.lookup(str(tmp_path / "missing.bin"), "c/v")
+    cache.add(os.path.join(cache.root, "c", "v", "missing.bin"), "src", 100, 0, found_complete=True)
+    session = cache.stats()["session"]
+    assert (session["hits"], session["misses"], session["bytes_saved"]) == (1, 0, 100)
+
+
+def test_evicts_least_recently_used_over_budget(tmp_path, remote, no_recent_grace):
+    cache = ComponentCache(str(tmp_path / "cache"), budget_bytes=2500)
+    sources = {}
+    for name in "abcd":
+        sources.update(_fill(cache, remote, [name]))
+        time.sleep(0.01)
+    assert cache.stats()["bytes"] <= 2500
+    survivors = [n for n in "abcd" if _cached(cache, n)]
+    assert survivors == ["c", "d"]
+
+    # Touch the older survivor, add a new file: the other survivor is now least recently used.
+    older, newer = survivors
+    assert cache.lookup(sources[older], cache_key(older, "v1"))
+    cache.flush()
+    time.sleep(0.01)
+    _fill(cache, remote, ["e"])
+    assert _cached(cache, older) and _cached(cache, "e") and not _cached(cache, newer)
+    assert cache.stats()["session"]["evicted_files"] == 3
+
+
+def test_keeps_files_of_current_batch(tmp_path, remote, no_recent_grace):
+    cache = ComponentCache(str(tmp_path / "cache"), budget_bytes=500)
+    _fill(cache, remote, ["a", "b"])
+    # Over budget, but a and b were both just prefetched in this batch.
+    assert _cached(cache, "a") and _cached(cache, "b")
+    _fill(cache, remote, ["c"])
+    assert not _cached(cache, "a") and not _cached(cache, "b") and _cached(cache, "c")
+
+
+def test_pinned_files_are_not_evicted(tmp_path, remote, no_recent_grace):
+    cache = ComponentCache(str(tmp_path / "cache"), budget_bytes=1500)
+    sources = _fill(cache, remote, ["a"])
+    cache.pin_sources([sources["a"]])
+    time.sleep(0.01)
+    _fill(cache, remote, ["b"])
+    time.sleep(0.01)
+    _fill(cache, remote, ["c"])
+    assert _cached(cache, "a") and not _cached(cache, "b") and _cached(cache, "c")
+    assert list(_index(cache)["pins"]) == [cache.instance_id]
+
+
+def test_pins_of_other_instances_are_respected(tmp_path, remote, no_recent_grace):
+    root = str(tmp_path / "cache")
+    other = ComponentCache(root)
+    sources = _fill(other, remote, ["a"])
+    other.pin_sources([sources["a"]])
+    other.flush()
+    cache = ComponentCache(root, budget_bytes=1000)
+    cache.instance_id = "other-editor"
+    _fill(cache, remote, ["b"])
+    time.sleep(0.01)
+    _fill(cache, remote, ["c"])
+    assert _cached(cache, "a") and _cached(cache, "c") and not _cached(cache, "b")
+
+
+def test_recently_used_files_are_not_evicted(tmp_path, remote):
+    cache = ComponentCache(str(tmp_path / "cache"), budget_bytes=1000)
+    _fill(cache, remote, ["a"])
+    _fill(cache, remote, ["b"])
+    assert _cached(cache, "a") and _cached(cache, "b")  # both used within _RECENT_USE_SECONDS
+
+
+def test_files_being_copied_are_not_evicted(tmp_path, remote, no_recent_grace):
+    cache = ComponentCache(str(tmp_path / "cache"), budget_bytes=1000)
+    _fill(cache, remote, ["a"])
+    lock = cache.copy_lock(os.path.join(cache.root, "a", "v1", "a.bin"))
+    with lock:
+        time.sleep(0.01)
+        _fill(cache, remote, ["b"])
+        assert _cached(cache, "a")
+
+
+def test_index_merges_usage_from_two_instances(tmp_path, remote):
+    root = str(tmp_path / "cache")
+    first, second = ComponentCache(root), ComponentCache(root)
+    sources = _fill(first, remote, ["a"])
+    first.flush()
+    assert second.lookup(sources["a"], cache_key("a", "v1"))
+    second.flush()
+    index = _index(first)
+    assert index["stats"]["hits"] == 1 and index["stats"]["misses"] == 1
+    assert index["entries"]["a/v1/a.bin"]["hits"] == 1
+    assert first.stats()["total"]["hit_rate"] == 0.5
+
+
+def test_missing_index_adopts_existing_files(tmp_path, remote):
+    cache = ComponentCache(str(tmp_path / "cache"))
+    _fill(cache, remote, ["a", "b"])
+    os.remove(os.path.join(cache.root, "index.json"))
+    cache.flush()
+    assert sorted(_index(cache)["entries"]) == ["a/v1/a.bin", "b/v1/b.bin"]
+
+
+def test_non_object_index_is_replaced(tmp_path):
+    cache = ComponentCache(str(tmp_path / "cache"))
+    os.makedirs(cache.root)
+    with open(os.path.join(cache.root, "index.json"), "w") as f:
+        f.write("[]")
+    assert cache.flush()
+    assert _index(cache)["version"] == 1
+
+
+def test_file_lock_excludes_and_times_out(tmp_path):
+    path = str(tmp_path / "x.lock")
+    with _FileLock(path, stale_seconds=60):
+        assert not _FileLock(path, stale_seconds=60, timeout=0.1).acquire()
+    assert _FileLock(path, stale_seconds=60, timeout=0.1).acquire()
+
+
+def test_stale_file_lock_is_taken_over(tmp_path):
+    path = str(tmp_path / "x.lock")
+    with open(path, "w") as f:
+        f.write("crashed 1")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert _FileLock(path, stale_seconds=60, timeout=0.1).acquire()
+
+
+def test_imported_sources_are_added_to_level_pins(tmp_path, remote, no_recent_grace, monkeypatch):
+    monkeypatch.setattr(ftrack_component_cache, "_level_sources", [])
+    cache = ComponentCache(str(tmp_path / "cache"), budget_bytes=1500)
+    sources = _fill(cache, remote, ["a"])
+    ftrack_component_cache.pin_imported_sources([sources["a"]], cache)
+    time.sleep(0.01)
+    sources.update(_fill(cache, remote, ["b"]))
+    ftrack_component_cache.pin_imported_sources([sources["b"]], cache)
+    time.sleep(0.01)
+    _fill(cache, remote, ["c"])
+    assert _cached(cache, "a") and _cached(cache, "b")
+    assert ftrack_component_cache._level_sources == sorted(sources.values())
+
+
+def test_stats_ignore_non_object_index(tmp_path):
+    cache = ComponentCache(str(tmp_path / "cache"))
+    os.makedirs(cache.root)
+    for text in ("[]", '{"stats": [], "entries": 3, "pins": null}'):
+        with open(os.path.join(cache.root, "index.json"), "w") as f:
+            f.write(text)
+        stats = cache.stats()
+        assert stats["files"] == 0 and stats["total"]["hits"] == 0 and stats["pinned_instances"] == 0
@@ -0,0 +1,62 @@
+# :coding: utf-8
+import json
+import os
+
+import pytest
+
+from ftrack_content_hash import ALGORITHM, HashCache, hash_file
+
+
+def _keys(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return sorted(os.path.basename(e["path"]) for e in json.load(f)["entries"])
+
+
+def test_hash_file_uses_cache(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(os.urandom(1000))
+    cache = HashCache(str(tmp_path / "cache.json"))
+    digest = hash_file(str(path), cache=cache)
+    assert digest.startswith(ALGORITHM + ":")
+    assert hash_file(str(path), cache=cache) == digest
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_saves_from_two_processes_are_merged(tmp_path):
+    path = str(tmp_path / "cache.json")
+    first, second = HashCache(path), HashCache(path)
+    first.put(str(tmp_path / "a"), 1, 1, "h-a")
+    second.put(str(tmp_path / "b"), 2, 2, "h-b")
+    assert first.save() and second.save()
+    assert _keys(path) == ["a", "b"]
+    # The second saver picked up the first one's entry.
+    assert second.get(str(tmp_path / "a"), 1, 1) == "h-a"
+    first.put(str(tmp_path / "c"), 3, 3, "h-c")
+    assert first.save()
+    assert _keys(path) == ["a", "b", "c"]
+
+
+def test_locked_file_keeps_cache_dirty(tmp_path, monkeypatch):
+    import ftrack_content_hash
+
+    monkeypatch.setattr(ftrack_content_hash, "_SAVE_LOCK_TIMEOUT_SECONDS", 0.1)
+    path = str(tmp_path / "cache.json")
+    cache = HashCache(path)
+    cache.put(str(tmp_path / "a"), 1, 1, "h-a")
+    with open(path + ".lock", "w") as f:
+        f.write("other 1")
+    assert not cache.save()
+    os.remove(path + ".lock")
+    assert cache.save()
+    assert _keys(path) == ["a"]
+
+
+@pytest.mark.parametrize("text", ["[]", "null", "{", '{"version": 1, "algorithm": "%s", "entries": {}}' % ALGORITHM])
+def test_unusable_file_is_ignored(tmp_path, text):
+    path = tmp_path / "cache.json"
+    path.write_text(text)
+    cache = HashCache(str(path))
+    assert cache.get(str(tmp_path / "a"), 1, 1) is None
+    cache.put(str(tmp_path / "a"), 1, 1, "h-a")
+    assert cache.save()
+    assert _keys(str(path)) == ["a"]
@@ -0,0 +1,41 @@
+# :coding: utf-8
+import os
+
+import pytest
+
+from ftrack_import_manifest import ImportManifest, source_change
+
+
+def _record(manifest, source, version_id="v1"):
+    st = os.stat(source)
+    manifest.record("/Game/H.H", component_id="c1", version_id=version_id, source_path=source,
+                    size=st.st_size, mtime_ns=st.st_mtime_ns, destination="/Game/Dest",
+                    imported_object_paths=["/Game/Dest/A.A"])
+
+
+def test_save_and_load(tmp_path):
+    source = tmp_path / "a.fbx"
+    source.write_bytes(b"mesh")
+    path = str(tmp_path / "manifest.json")
+    manifest = ImportManifest(path)
+    _record(manifest, str(source))
+    assert manifest.save()
+    assert not manifest.save()  # nothing changed
+
+    entry = ImportManifest(path).get("/Game/H.H")
+    assert entry["component_id"] == "c1" and entry["imported_object_paths"] == ["/Game/Dest/A.A"]
+    assert source_change(entry, str(source), "v1") == (None, None)
+    assert source_change(entry, str(source), "v2")[0] == "version v1 -> v2"
+
+
+@pytest.mark.parametrize("text", ["[]", "null", "3", '"x"', "{", '{"version": 1, "handles": []}'])
+def test_unusable_file_is_ignored(tmp_path, text):
+    path = tmp_path / "manifest.json"
+    path.write_text(text)
+    manifest = ImportManifest(str(path))
+    assert manifest.get("/Game/H.H") is None and manifest.handles() == []
+    source = tmp_path / "a.fbx"
+    source.write_bytes(b"mesh")
+    _record(manifest, str(source))
+    assert manifest.save()
+    assert ImportManifest(str(path)).handles() == ["/Game/H.H"]
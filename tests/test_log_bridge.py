@@ -0,0 +1,62 @@
+# :coding: utf-8
+import io
+import sys
+
+import pytest
+
+import ftrack_log_bridge
+
+
+class FakeUnreal:
+    def __init__(self):
+        self.logs = []
+        self.ticks = {}
+        self._next = 0
+
+    def log(self, text):
+        self.logs.append(text)
+
+    def log_warning(self, text):
+        self.logs.append("WARNING " + text)
+
+    def register_slate_post_tick_callback(self, fn):
+        self._next += 1
+        self.ticks[self._next] = fn
+        return self._next
+
+    def unregister_slate_post_tick_callback(self, handle):
+        del self.ticks[handle]
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(sys, "stderr", io.StringIO())
+    monkeypatch.setattr(ftrack_log_bridge, "_stderr_stream", None)
+    yield FakeUnreal()
+    ftrack_log_bridge.restore_stderr()
+
+
+def test_redirect_is_idempotent(fake):
+    stream = ftrack_log_bridge.redirect_stderr(fake)
+    assert ftrack_log_bridge.redirect_stderr(fake) is stream
+    assert len(fake.ticks) == 1
+
+
+def test_replaced_stream_is_retired(fake):
+    first = ftrack_log_bridge.redirect_stderr(fake)
+    first.write("buffered line\npartial")
+    sys.stderr = io.StringIO()  # e.g. another tool redirected stderr
+    second = ftrack_log_bridge.redirect_stderr(fake)
+    assert second is not first
+    assert len(fake.ticks) == 1
+    assert fake.logs == ["buffered line\npartial"]
+
+
+def test_restore_drains_and_puts_original_back(fake):
+    original = sys.stderr
+    stream = ftrack_log_bridge.redirect_stderr(fake)
+    sys.stderr.write("last words")
+    ftrack_log_bridge.restore_stderr()
+    assert sys.stderr is original and not fake.ticks
+    assert fake.logs == ["last words"]
+    assert stream.original is original
@@ -0,0 +1,116 @@
+# :coding: utf-8
+import json
+import os
+
+import pytest
+
+import ftrack_prefetch
+from ftrack_prefetch import copy_file, needs_prefetch, prefetch_files
+
+
+@pytest.fixture
+def sites(tmp_path):
+    """A "remote" site with a few files and an empty "local" site."""
+    remote, local = tmp_path / "remote", tmp_path / "local"
+    remote.mkdir()
+    local.mkdir()
+    paths = []
+    for i in range(4):
+        p = remote / ("f%d.fbx" % i)
+        p.write_bytes(os.urandom(100000 + i))
+        paths.append(str(p))
+    return str(remote), str(local), paths
+
+
+def _items(paths):
+    return [{"path": p, "key": "c%d/v1" % i} for i, p in enumerate(paths)]
+
+
+def _same(a, b):
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        return fa.read() == fb.read()
+
+
+def test_copies_remote_files_then_hits(sites):
+    remote, local, paths = sites
+    progress = []
+    results = prefetch_files(_items(paths), local, remote_roots=[remote], chunk_size=4096,
+                             progress=lambda done, total: progress.append((done, total)))
+    assert [r["status"] for r in results] == ["copied"] * 4
+    for r in results:
+        assert r["local"].startswith(local) and _same(r["local"], r["source"])
+        assert os.stat(r["local"]).st_mtime_ns == os.stat(r["source"]).st_mtime_ns
+    total = sum(os.path.getsize(p) for p in paths)
+    assert progress[-1] == (total, total)
+
+    again = prefetch_files(_items(paths), local, remote_roots=[remote])
+    assert [r["status"] for r in again] == ["cached"] * 4
+    assert all(r["copied_bytes"] == 0 for r in again)
+
+
+def test_local_paths_are_not_copied(sites, tmp_path):
+    remote, local, _paths = sites
+    here = tmp_path / "here.fbx"
+    here.write_bytes(b"x")
+    (r,) = prefetch_files([{"path": str(here)}], local, remote_roots=[remote])
+    assert r["status"] == "local" and r["local"] == str(here)
+
+
+def test_resumes_partial_copy(sites, tmp_path):
+    _remote, _local, paths = sites
+    source, dest = paths[0], str(tmp_path / "out" / "f0.fbx")
+    os.makedirs(os.path.dirname(dest))
+    st = os.stat(source)
+    with open(source, "rb") as f:
+        head = f.read(30000)
+    with open(dest + ".part", "wb") as f:
+        f.write(head)
+    with open(dest + ".part.json", "w") as f:
+        json.dump({"source": source, "size": st.st_size, "mtime_ns": st.st_mtime_ns}, f)
+
+    out = copy_file(source, dest, chunk_size=4096)
+
+    assert out["status"] == "copied" and out["resumed"]
+    assert out["copied_bytes"] == st.st_size - 30000
+    assert _same(source, dest)
+    assert not os.path.exists(dest + ".part") and not os.path.exists(dest + ".part.json")
+
+
+def test_restarts_partial_copy_of_changed_source(sites, tmp_path):
+    _remote, _local, paths = sites
+    source, dest = paths[1], str(tmp_path / "f1.fbx")
+    with open(dest + ".part", "wb") as f:
+        f.write(b"stale bytes")
+    with open(dest + ".part.json", "w") as f:
+        json.dump({"source": source, "size": 1, "mtime_ns": 1}, f)
+
+    out = copy_file(source, dest)
+
+    assert not out["resumed"] and out["copied_bytes"] == os.path.getsize(source)
+    assert _same(source, dest)
+
+
+def test_size_mismatch_is_an_error(sites, tmp_path, monkeypatch):
+    _remote, _local, paths = sites
+    dest = str(tmp_path / "f2.fbx")
+    real_getsize = os.path.getsize
+    monkeypatch.setattr(ftrack_prefetch.os.path, "getsize",
+                        lambda p: real_getsize(p) - 1 if p.endswith(".part") else real_getsize(p))
+    with pytest.raises(OSError, match="Size mismatch"):
+        copy_file(paths[2], dest)
+    assert not os.path.exists(dest)
+
+
+def test_missing_source_reports_error(sites):
+    remote, local, _paths = sites
+    (r,) = prefetch_files([{"path": os.path.join(remote, "missing.fbx")}], local, remote_roots=[remote])
+    assert r["status"] == "error" and "Prefetch failed" in r["error"]
+
+
+def test_needs_prefetch_modes(tmp_path):
+    assert needs_prefetch("//server/share/a.fbx", mode="auto")
+    assert not needs_prefetch(str(tmp_path / "a.fbx"), remote_roots=[], mode="auto")
+    assert needs_prefetch(str(tmp_path / "a.fbx"), remote_roots=[str(tmp_path)], mode="auto")
+    assert needs_prefetch(str(tmp_path / "a.fbx"), mode="all")
+    assert not needs_prefetch(str(tmp_path / "a.fbx"), root=str(tmp_path), mode="all")
+    assert not needs_prefetch("//server/share/a.fbx", mode="off")
@@ -0,0 +1,72 @@
+# :coding: utf-8
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import ftrack_publish_spool as spool
+import ftrack_publish_worker as worker
+
+
+@pytest.fixture
+def root(tmp_path):
+    return spool.ensure_layout(str(tmp_path / "spool"))
+
+
+def _dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def _running_job(root, **status):
+    job_id = spool.submit_job({"task_id": "t1", "components": []}, root)
+    assert spool.claim_next(root)["job_id"] == job_id
+    spool.write_status(root, job_id, spool.RUNNING, **status)
+    return job_id
+
+
+def _state(root, job_id):
+    return [s for s in (spool.PENDING, spool.RUNNING) if os.path.exists(os.path.join(root, s, job_id + ".json"))]
+
+
+def test_pid_alive():
+    assert not worker._pid_alive(_dead_pid())
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert worker._pid_alive(proc.pid)
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_job_of_dead_worker_is_requeued(root):
+    job_id = _running_job(root, worker_pid=_dead_pid())
+    assert worker._recover_orphans(root) == 1
+    assert _state(root, job_id) == [spool.PENDING]
+    assert spool.read_status(job_id, root)["state"] == spool.PENDING
+
+
+def test_job_of_live_worker_stays_running(root):
+    job_id = _running_job(root, worker_pid=os.getpid())
+    assert worker._recover_orphans(root) == 0
+    assert _state(root, job_id) == [spool.RUNNING]
+
+
+def test_job_owned_by_another_host_stays_running(root, monkeypatch):
+    monkeypatch.setattr(spool, "HOST", "other-machine")
+    job_id = _running_job(root, worker_pid=_dead_pid())
+    monkeypatch.undo()
+    assert worker._recover_orphans(root) == 0
+    assert _state(root, job_id) == [spool.RUNNING]
+
+
+def test_unowned_job_is_requeued_after_grace(root):
+    job_id = _running_job(root)
+    assert worker._recover_orphans(root) == 0
+    old = time.time() - worker._UNOWNED_GRACE_SECONDS - 1
+    os.utime(os.path.join(root, spool.RUNNING, job_id + ".json"), (old, old))
+    assert worker._recover_orphans(root) == 1
+    assert _state(root, job_id) == [spool.PENDING]
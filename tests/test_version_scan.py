@@ -0,0 +1,123 @@
+# :coding: utf-8
+import re
+
+import pytest
+
+import ftrack_version_scan
+from ftrack_version_scan import load_staleness_index, scan_versions, write_staleness_index
+
+
+class FakeSession:
+    """Answers the three scan queries from in-memory components and versions, recording each query."""
+
+    def __init__(self, components, versions):
+        self.components = components  # id -> {"name", "version_id"}
+        self.versions = versions  # id -> {"version", "asset_id", "is_latest"}
+        self.queries = []
+
+    def query(self, expr):
+        self.queries.append(expr)
+        ids = re.findall(r'"([^"]+)"', expr)
+        if expr.startswith("select id, name, version_id, version.version"):
+            for cid in ids:
+                comp = self.components.get(cid)
+                if comp:
+                    v = self.versions[comp["version_id"]]
+                    yield {"id": cid, "name": comp["name"], "version_id": comp["version_id"],
+                           "version": {"version": v["version"], "asset_id": v["asset_id"]}}
+        elif expr.startswith("select id, version, asset_id from AssetVersion"):
+            for vid, v in self.versions.items():
+                if v["asset_id"] in ids and v["is_latest"]:
+                    yield {"id": vid, "version": v["version"], "asset_id": v["asset_id"]}
+        elif expr.startswith("select id, name, version_id from Component where version_id"):
+            for cid, comp in self.components.items():
+                if comp["version_id"] in ids:
+                    yield {"id": cid, "name": comp["name"], "version_id": comp["version_id"]}
+        else:
+            raise AssertionError("unexpected query %s" % expr)
+
+
+def _session():
+    versions = {
+        "av1": {"version": 1, "asset_id": "a1", "is_latest": False},
+        "av3": {"version": 3, "asset_id": "a1", "is_latest": True},
+        "bv2": {"version": 2, "asset_id": "b1", "is_latest": True},
+    }
+    components = {
+        "c-old": {"name": "main", "version_id": "av1"},
+        "c-new": {"name": "main", "version_id": "av3"},
+        "c-b": {"name": "geo", "version_id": "bv2"},
+    }
+    return FakeSession(components, versions)
+
+
+def test_stale_up_to_date_and_missing():
+    session = _session()
+    entries = scan_versions(session, [
+        {"handle": "/Game/H_old.H_old", "component_id": "c-old"},
+        {"handle": "/Game/H_b.H_b", "component_id": "c-b"},
+        {"handle": "/Game/H_gone.H_gone", "component_id": "c-missing"},
+        {"handle": "/Game/H_empty.H_empty", "component_id": None},
+    ])
+    old, current, missing, empty = entries
+
+    assert old["stale"] and old["error"] is None
+    assert (old["current_version"], old["latest_version"], old["latest_component_id"]) == (1, 3, "c-new")
+
+    assert not current["stale"] and current["error"] is None
+    assert current["latest_component_id"] == "c-b"
+
+    assert not missing["stale"] and missing["error"] == "Component not found on the server."
+    assert empty["error"] == "Handle has no ComponentId."
+
+
+def test_latest_version_without_same_named_component():
+    session = _session()
+    session.components["c-new"]["name"] = "renamed"
+    (entry,) = scan_versions(session, [{"handle": "/Game/H.H", "component_id": "c-old"}])
+    assert not entry["stale"]
+    assert "no component named 'main'" in entry["error"]
+
+
+def test_three_queries_per_chunk(monkeypatch):
+    monkeypatch.setattr(ftrack_version_scan, "_QUERY_ID_CHUNK", 2)
+    versions, components, handles = {}, {}, []
+    for i in range(5):
+        versions["old%d" % i] = {"version": 1, "asset_id": "asset%d" % i, "is_latest": False}
+        versions["new%d" % i] = {"version": 2, "asset_id": "asset%d" % i, "is_latest": True}
+        components["c%d" % i] = {"name": "main", "version_id": "old%d" % i}
+        components["n%d" % i] = {"name": "main", "version_id": "new%d" % i}
+        handles.append({"handle": "/Game/H%d.H%d" % (i, i), "component_id": "c%d" % i})
+    session = FakeSession(components, versions)
+
+    entries = scan_versions(session, handles)
+
+    assert all(e["stale"] for e in entries)
+    # 5 IDs in chunks of 2 -> 3 chunks for each of the three queries.
+    assert len(session.queries) == 9
+    assert all(len(re.findall(r'"[^"]+"', q)) <= 2 for q in session.queries)
+
+
+def test_no_queries_without_component_ids():
+    session = _session()
+    (entry,) = scan_versions(session, [{"handle": "/Game/H.H", "component_id": None}])
+    assert entry["error"]
+    assert session.queries == []
+
+
+def test_staleness_index_round_trip(tmp_path):
+    path = str(tmp_path / "staleness.json")
+    write_staleness_index([{"handle": "/Game/A.A", "stale": True}], path)
+    write_staleness_index([{"handle": "/Game/B.B", "stale": False}], path, merge=True)
+    data = load_staleness_index(path)
+    assert sorted(data["handles"]) == ["/Game/A.A", "/Game/B.B"]
+    assert data["stale"] == 1
+
+
+@pytest.mark.parametrize("text", ["[]", "null", "7", "{", '{"version": 1, "handles": []}'])
+def test_unusable_staleness_index_is_ignored(tmp_path, text):
+    path = tmp_path / "staleness.json"
+    path.write_text(text)
+    assert load_staleness_index(str(path)) is None
+    assert write_staleness_index([{"handle": "/Game/A.A", "stale": True}], str(path), merge=True)
+    assert list(load_staleness_index(str(path))["handles"]) == ["/Game/A.A"]
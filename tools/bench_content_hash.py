@@ -0,0 +1,87 @@
+# :coding: utf-8
+"""
+Benchmark ftrack_content_hash on large files: streaming single-thread hashes vs the chunked,
+multi-threaded mmap tree hash, and a second pass answered by the (path, size, mtime) cache.
+
+    python tools/bench_content_hash.py [size_gb] [file_count] [directory]
+
+Files are written once to directory (default: a temp dir) and removed afterwards. Use a directory on
+the storage you care about (local NVMe, network share); the first read may include cold-cache I/O,
+so the runs go cold -> warm and the table reports each.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Scripts"))
+
+import ftrack_content_hash  # noqa: E402
+
+_BLOCK = 64 * 1024 * 1024
+
+
+def _write_file(path: str, size: int) -> None:
+    block = os.urandom(min(_BLOCK, size))
+    with open(path, "wb") as f:
+        written = 0
+        while written < size:
+            n = min(len(block), size - written)
+            f.write(block[:n])
+            written += n
+
+
+def _streaming(paths, algo: str) -> None:
+    for p in paths:
+        h = hashlib.new(algo)
+        with open(p, "rb") as f:
+            while True:
+                data = f.read(1024 * 1024)
+                if not data:
+                    break
+                h.update(data)
+        h.hexdigest()
+
+
+def _timed(label: str, total_bytes: int, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print("%-34s %8.2f s  %8.2f GB/s" % (label, dt, total_bytes / dt / 1e9 if dt else float("inf")))
+    return dt
+
+
+def main() -> None:
+    size_gb = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    base = sys.argv[3] if len(sys.argv) > 3 else None
+    folder = tempfile.mkdtemp(prefix="mroya_hash_bench_", dir=base)
+    try:
+        size = int(size_gb * 1e9)
+        paths = [os.path.join(folder, "component_%d.bin" % i) for i in range(count)]
+        for p in paths:
+            _write_file(p, size)
+        total = size * count
+        print("files: %d x %.2f GB in %s, cpu_count=%s" % (count, size_gb, folder, os.cpu_count()))
+
+        _timed("sha256 streaming, 1 thread", total, lambda: _streaming(paths, "sha256"))
+        _timed("blake2b streaming, 1 thread", total, lambda: _streaming(paths, "blake2b"))
+        _timed("tree hash (threads + mmap)", total, lambda: ftrack_content_hash.hash_files(paths))
+
+        cache = ftrack_content_hash.HashCache(os.path.join(folder, "cache.json"))
+        ftrack_content_hash.hash_files(paths, cache=cache)
+        cache.save()
+        reloaded = ftrack_content_hash.HashCache(os.path.join(folder, "cache.json"))
+        _timed("cached (fresh process cache file)", total, lambda: ftrack_content_hash.hash_files(paths, cache=reloaded))
+        print("cache hits: %d, misses: %d" % (reloaded.hits, reloaded.misses))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
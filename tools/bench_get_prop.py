@@ -0,0 +1,99 @@
+# :coding: utf-8
+"""
+Benchmark ftrack_out_handle._entry_to_component_dict per component: exception-driven property probing
+(previous _get_prop) vs the per-type accessor cache.
+
+Runs outside Unreal with a stand-in struct that behaves like Unreal Python structs: get_editor_property()
+only accepts the snake_case Python name and raises for anything else, so "Name"-style candidates miss.
+
+    python tools/bench_get_prop.py [component_count] [repeats]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Scripts"))
+
+import ftrack_out_handle  # noqa: E402
+
+
+class FakeComponentEntry:
+    """Stand-in for FFtrackPublishComponentEntry as exposed to Unreal Python."""
+
+    def __init__(self, i: int):
+        self._props = {
+            "name": "comp_%d" % i,
+            "file_path": "/proj/out/comp_%d.abc" % i,
+            "component_type": "file",
+            "export_enabled": True,
+            "sequence_pattern": "",
+            "transfer_after_publish": True,
+            "metadata": {"k": "v"},
+            "b_has_frame_range": True,
+            "frame_start": 1001,
+            "frame_end": 1100,
+            "scenario_library_index": 3,
+            "scenario_description": "cache export",
+        }
+
+    def get_editor_property(self, name):
+        try:
+            return self._props[name]
+        except KeyError:
+            raise Exception("Failed to find property '%s' for attribute '%s' on 'FtrackPublishComponentEntry'" % (name, name))
+
+
+def _get_prop_probing(obj, *names):
+    """The _get_prop implementation before the accessor cache."""
+    if obj is None:
+        return None
+    for n in names:
+        try:
+            if hasattr(obj, "get_editor_property"):
+                return obj.get_editor_property(n)
+        except Exception:
+            pass
+        try:
+            return getattr(obj, n)
+        except Exception:
+            pass
+    return None
+
+
+def _run(entries, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for e in entries:
+            ftrack_out_handle._entry_to_component_dict(e, include_unreal_metadata=True)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(entries)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    entries = [FakeComponentEntry(i) for i in range(count)]
+
+    cached_get_prop = ftrack_out_handle._get_prop
+    ftrack_out_handle._get_prop = _get_prop_probing
+    try:
+        reference = [ftrack_out_handle._entry_to_component_dict(e, include_unreal_metadata=True) for e in entries[:3]]
+        before = _run(entries, repeats)
+    finally:
+        ftrack_out_handle._get_prop = cached_get_prop
+    ftrack_out_handle._accessor_cache.clear()
+    assert reference == [ftrack_out_handle._entry_to_component_dict(e, include_unreal_metadata=True) for e in entries[:3]]
+    after = _run(entries, repeats)
+
+    print("components: %d, best of %d runs" % (count, repeats))
+    print("probing (before):      %8.2f us/component" % (before * 1e6))
+    print("accessor cache (after): %8.2f us/component" % (after * 1e6))
+    print("speedup: %.1fx" % (before / after if after else float("inf")))
+
+
+if __name__ == "__main__":
+    main()